@@ -0,0 +1,10 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+from django.apps import AppConfig
+
+
+class AuditConfig(AppConfig):
+    name = "openzaak.audit"
+
+    def ready(self):
+        from . import signals  # noqa
@@ -0,0 +1,234 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+"""
+Compact storage of update audit trail entries.
+
+Instead of the complete ``oud`` and ``nieuw`` representations, only the changes
+between them are stored (see :class:`openzaak.audit.models.AuditTrailDiff`). The
+changes of a resource form a chain that starts at a full snapshot, so the complete
+representations can be reconstructed on read by applying the changes to the
+snapshot.
+
+The chain is only continued if the representation before the change matches the
+representation after the previous change in the chain, which is verified with a
+hash. Otherwise (for example after changes through the admin, which are always
+stored in full) a new snapshot is stored.
+"""
+import hashlib
+import json
+from collections import defaultdict
+from copy import deepcopy
+from functools import reduce
+from operator import or_
+from typing import Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Max, Q
+
+from dictdiffer import diff, patch
+from vng_api_common.audittrails.models import AuditTrail
+
+from .models import AuditTrailDiff, get_main_object_uuid
+
+
+def normalize(data: dict) -> dict:
+    """
+    Return the data as it is stored in (and read from) a JSON field.
+    """
+    return json.loads(json.dumps(data, cls=DjangoJSONEncoder))
+
+
+def get_state_hash(data: dict) -> str:
+    dumped = json.dumps(data, cls=DjangoJSONEncoder, sort_keys=True)
+    return hashlib.sha1(dumped.encode("utf-8")).hexdigest()
+
+
+def compact_audittrail(
+    audittrail: AuditTrail, version_before_edit: dict, version_after_edit: dict
+) -> Optional[AuditTrailDiff]:
+    """
+    Prepare an unsaved update audit trail entry for compact storage.
+
+    If the entry is stored as changes, ``oud`` and ``nieuw`` of the audit trail are
+    cleared. The returned diff must be saved after the audit trail entry, in the
+    same transaction.
+    """
+    resource_uuid = get_main_object_uuid(audittrail.resource_url)
+    if resource_uuid is None:
+        return None
+
+    before = normalize(version_before_edit)
+    after = normalize(version_after_edit)
+    state_hash = get_state_hash(after)
+
+    # the latest diff of the resource is locked until the entry is saved, so
+    # concurrent updates of the resource don't continue the chain from the same
+    # diff. A diff that was saved while waiting for the lock isn't returned by the
+    # locking query, so the lock is taken again until the latest diff is locked
+    latest_diff = (
+        AuditTrailDiff.objects.select_for_update()
+        .filter(resource_uuid=resource_uuid)
+        .order_by("-pk")
+        .values("pk", "depth", "state_hash")
+    )
+    previous = latest_diff.first()
+    while previous is not None:
+        latest = latest_diff.first()
+        if latest["pk"] == previous["pk"]:
+            break
+        previous = latest
+    continue_chain = (
+        previous is not None
+        and previous["state_hash"] == get_state_hash(before)
+        and previous["depth"] + 1 < settings.AUDIT_TRAIL_SNAPSHOT_INTERVAL
+    )
+    if not continue_chain:
+        return AuditTrailDiff(
+            resource_uuid=resource_uuid,
+            changes=None,
+            depth=0,
+            state_hash=state_hash,
+        )
+
+    audittrail.oud = None
+    audittrail.nieuw = None
+    return AuditTrailDiff(
+        resource_uuid=resource_uuid,
+        changes=list(diff(before, after)),
+        depth=previous["depth"] + 1,
+        state_hash=state_hash,
+    )
+
+
+def load_changes(changes: list) -> list:
+    """
+    Restore the changes from their JSON form to the form produced by dictdiffer.
+    """
+    return [
+        (
+            action,
+            tuple(node) if isinstance(node, list) else node,
+            tuple(value) if action == "change" else value,
+        )
+        for action, node, value in changes
+    ]
+
+
+def _replay(chain: Iterable[AuditTrailDiff]) -> Iterable[Tuple[int, dict, dict]]:
+    """
+    Yield the (pk, oud, nieuw) of every entry in the chain of changes.
+    """
+    state = None
+    for entry in chain:
+        if entry.is_snapshot:
+            state = entry.audittrail.nieuw
+            continue
+        if state is None:
+            continue
+        new_state = patch(entry.changes, state, in_place=False)
+        yield entry.audittrail_id, state, new_state
+        state = new_state
+
+
+def reconstruct(audittrails: Iterable[AuditTrail]) -> None:
+    """
+    Fill in ``oud`` and ``nieuw`` of compact audit trail entries, in place.
+
+    The chains of all entries are fetched with two queries: one for the snapshots
+    the chains start at, and one for the entries of the chains.
+    """
+    compact = {
+        audittrail.pk: audittrail
+        for audittrail in audittrails
+        if audittrail.oud is None
+        and audittrail.nieuw is None
+        and hasattr(audittrail, "compact_diff")
+        and not audittrail.compact_diff.is_snapshot
+    }
+    if not compact:
+        return
+
+    # the (first, last) requested entry per resource
+    bounds = {}
+    for pk, audittrail in compact.items():
+        resource_uuid = audittrail.compact_diff.resource_uuid
+        first, last = bounds.get(resource_uuid, (pk, pk))
+        bounds[resource_uuid] = (min(first, pk), max(last, pk))
+
+    # ⚡️ the chain of a resource starts at the latest snapshot before its first
+    # requested entry, the older entries of the resource are not fetched
+    starts = dict(
+        AuditTrailDiff.objects.filter(
+            reduce(
+                or_,
+                (
+                    Q(resource_uuid=resource_uuid, pk__lte=first)
+                    for resource_uuid, (first, _last) in bounds.items()
+                ),
+            ),
+            depth=0,
+        )
+        .values("resource_uuid")
+        .annotate(start=Max("pk"))
+        .values_list("resource_uuid", "start")
+    )
+    if not starts:
+        return
+
+    entries = (
+        AuditTrailDiff.objects.filter(
+            reduce(
+                or_,
+                (
+                    Q(
+                        resource_uuid=resource_uuid,
+                        pk__gte=start,
+                        pk__lte=bounds[resource_uuid][1],
+                    )
+                    for resource_uuid, start in starts.items()
+                ),
+            )
+        )
+        .select_related("audittrail")
+        .order_by("pk")
+    )
+    chains = defaultdict(list)
+    for entry in entries:
+        chains[entry.resource_uuid].append(entry)
+
+    for chain in chains.values():
+        for pk, oud, nieuw in _replay(chain):
+            if pk in compact:
+                compact[pk].oud = deepcopy(oud)
+                compact[pk].nieuw = deepcopy(nieuw)
+
+
+def rebase(resource_uuids: Iterable, after_pk: int) -> None:
+    """
+    Store the first compact entry after ``after_pk`` of the resources as a snapshot.
+
+    Call this before removing the (older) entries up to ``after_pk``, so that the
+    remaining chains can still be reconstructed.
+    """
+    heads = [
+        entry
+        for entry in AuditTrailDiff.objects.filter(
+            resource_uuid__in=resource_uuids, pk__gt=after_pk
+        )
+        .select_related("audittrail")
+        .order_by("resource_uuid", "pk")
+        .distinct("resource_uuid")
+        if not entry.is_snapshot
+    ]
+    if not heads:
+        return
+
+    audittrails = [entry.audittrail for entry in heads]
+    reconstruct(audittrails)
+    AuditTrail.objects.bulk_update(audittrails, fields=["oud", "nieuw"])
+
+    for entry in heads:
+        entry.changes = None
+        entry.depth = 0
+    AuditTrailDiff.objects.bulk_update(heads, fields=["changes", "depth"])
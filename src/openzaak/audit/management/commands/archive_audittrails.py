@@ -0,0 +1,154 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+import gzip
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+from django.core.management import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+
+from dateutil.relativedelta import relativedelta
+from vng_api_common.audittrails.models import AuditTrail
+
+from ...compact import rebase, reconstruct
+from ...models import AuditTrailDiff
+
+FIELDS = [field.name for field in AuditTrail._meta.concrete_fields]
+
+
+class Command(BaseCommand):
+    help = (
+        "Export audit trail entries older than the retention period to compressed "
+        "JSONL files (one per month and run) and remove them from the database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--retention-months",
+            type=int,
+            required=True,
+            help="Audit trail entries older than this number of months are archived.",
+        )
+        parser.add_argument(
+            "--output-dir",
+            required=True,
+            help="Directory to write the archive files to.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5_000,
+            help="Number of audit trail entries to export and delete per query.",
+        )
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="Only export the audit trail entries, do not delete them.",
+        )
+
+    def handle(self, **options):
+        if options["retention_months"] < 1:
+            raise CommandError("The retention period must be at least one month.")
+
+        output_dir = Path(options["output_dir"])
+        if not output_dir.is_dir():
+            raise CommandError(f"'{output_dir}' is not a directory.")
+
+        # archive whole months only
+        cutoff = (
+            timezone.now() - relativedelta(months=options["retention_months"])
+        ).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+        oldest = (
+            AuditTrail.objects.filter(aanmaakdatum__lt=cutoff)
+            .order_by("aanmaakdatum")
+            .values_list("aanmaakdatum", flat=True)
+            .first()
+        )
+        if oldest is None:
+            self.stdout.write("There are no audit trail entries to archive.")
+            return
+
+        # every run writes its own files, re-running (e.g. with ``--keep``) never
+        # mixes the records of different runs
+        run_at = timezone.now()
+        month = oldest.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        while month < cutoff:
+            next_month = month + relativedelta(months=1)
+            self.archive_month(month, next_month, output_dir, run_at, **options)
+            month = next_month
+
+    def expand_compact(self, batch: List[dict]) -> None:
+        """
+        Fill in ``oud`` and ``nieuw`` of the compact entries in the batch.
+        """
+        records = {
+            record["id"]: record
+            for record in batch
+            if record["oud"] is None and record["nieuw"] is None
+        }
+        if not records:
+            return
+
+        audittrails = list(
+            AuditTrail.objects.filter(pk__in=records).select_related("compact_diff")
+        )
+        reconstruct(audittrails)
+        for audittrail in audittrails:
+            records[audittrail.pk].update(oud=audittrail.oud, nieuw=audittrail.nieuw)
+
+    def archive_month(
+        self,
+        start: datetime,
+        end: datetime,
+        output_dir: Path,
+        run_at: datetime,
+        batch_size: int,
+        keep: bool,
+        **options,
+    ):
+        queryset = AuditTrail.objects.filter(
+            aanmaakdatum__gte=start, aanmaakdatum__lt=end
+        ).order_by("pk")
+        if not queryset.exists():
+            return
+        path = output_dir / f"audittrail-{start:%Y-%m}-{run_at:%Y%m%dT%H%M%S}.jsonl.gz"
+
+        count, last_pk = 0, 0
+        # the records deleted by an interrupted run are in its own file, the next run
+        # archives the remaining records to a new file
+        with gzip.open(path, "xt", encoding="utf-8") as archive:
+            while True:
+                batch = list(
+                    queryset.filter(pk__gt=last_pk).values(*FIELDS)[:batch_size]
+                )
+                if not batch:
+                    break
+
+                self.expand_compact(batch)
+                for record in batch:
+                    archive.write(json.dumps(record, cls=DjangoJSONEncoder))
+                    archive.write("\n")
+                archive.flush()
+
+                last_pk = batch[-1]["id"]
+                if not keep:
+                    ids = [record["id"] for record in batch]
+                    with transaction.atomic():
+                        resource_uuids = (
+                            AuditTrailDiff.objects.filter(audittrail__in=ids)
+                            .values_list("resource_uuid", flat=True)
+                            .distinct()
+                        )
+                        rebase(list(resource_uuids), after_pk=last_pk)
+                        AuditTrail.objects.filter(pk__in=ids).delete()
+                count += len(batch)
+
+        if options["verbosity"] > 0:
+            self.stdout.write(
+                self.style.SUCCESS(f"Archived {count} audit trail entries to {path}.")
+            )
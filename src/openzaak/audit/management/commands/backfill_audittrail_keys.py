@@ -0,0 +1,40 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+from django.core.management import BaseCommand
+
+from vng_api_common.audittrails.models import AuditTrail
+
+from ...models import AuditTrailKey
+
+
+class Command(BaseCommand):
+    help = (
+        "Create the missing main object lookup keys of audit trail entries. The "
+        "keys of the entries that existed before the keys were introduced are "
+        "created by the migrations, this command covers entries written by an "
+        "older version of Open Zaak afterwards (e.g. during a rolling deployment)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10_000,
+            help="Number of audit trail entries to process per query.",
+        )
+
+    def handle(self, **options):
+        batch_size = options["batch_size"]
+        verbosity = options["verbosity"]
+
+        processed = 0
+        for processed in AuditTrailKey.objects.backfill(
+            AuditTrail.objects.all(), batch_size
+        ):
+            if verbosity > 1:
+                self.stdout.write(f"Processed {processed} audit trail entries...")
+
+        if verbosity > 0:
+            self.stdout.write(
+                self.style.SUCCESS(f"Processed {processed} audit trail entries.")
+            )
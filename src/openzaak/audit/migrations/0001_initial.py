@@ -0,0 +1,46 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+# Generated by Django 4.2.15 on 2024-09-09 09:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("audittrails", "0018_auto_20221212_0745"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AuditTrailKey",
+            fields=[
+                (
+                    "audittrail",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="main_object_key",
+                        serialize=False,
+                        to="audittrails.audittrail",
+                        verbose_name="audit trail",
+                    ),
+                ),
+                (
+                    "hoofd_object_uuid",
+                    models.UUIDField(
+                        db_index=True,
+                        help_text="UUID of the main object of the audit trail entry.",
+                        verbose_name="hoofd object UUID",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "audit trail key",
+                "verbose_name_plural": "audit trail keys",
+            },
+        ),
+    ]
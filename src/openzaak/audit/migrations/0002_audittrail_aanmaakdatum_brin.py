@@ -0,0 +1,27 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Add a BRIN index on the creation date of audit trail entries.
+
+    Audit trail entries are only appended, so the creation date follows the
+    physical order of the table. A BRIN index is tiny compared to a B-tree index and
+    makes selecting (and archiving) old entries by date cheap.
+    """
+
+    dependencies = [
+        ("audit", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX IF NOT EXISTS audittrail_aanmaakdatum_brin "
+                "ON audittrails_audittrail USING brin (aanmaakdatum);"
+            ),
+            reverse_sql="DROP INDEX IF EXISTS audittrail_aanmaakdatum_brin;",
+        ),
+    ]
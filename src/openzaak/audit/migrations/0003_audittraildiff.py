@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+# Generated by Django 4.2.15 on 2024-09-16 14:02
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("audittrails", "0018_auto_20221212_0745"),
+        ("audit", "0002_audittrail_aanmaakdatum_brin"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AuditTrailDiff",
+            fields=[
+                (
+                    "audittrail",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="compact_diff",
+                        serialize=False,
+                        to="audittrails.audittrail",
+                        verbose_name="audit trail",
+                    ),
+                ),
+                (
+                    "resource_uuid",
+                    models.UUIDField(db_index=True, verbose_name="resource UUID"),
+                ),
+                (
+                    "changes",
+                    models.JSONField(
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        help_text="The changes in dictdiffer format, empty if the audit trail entry is a full snapshot.",
+                        null=True,
+                        verbose_name="changes",
+                    ),
+                ),
+                (
+                    "depth",
+                    models.PositiveIntegerField(
+                        help_text="Number of changes since the last full snapshot.",
+                        verbose_name="depth",
+                    ),
+                ),
+                (
+                    "state_hash",
+                    models.CharField(
+                        help_text="Hash of the representation after the change.",
+                        max_length=40,
+                        verbose_name="state hash",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "audit trail diff",
+                "verbose_name_plural": "audit trail diffs",
+            },
+        ),
+    ]
@@ -0,0 +1,55 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+# Generated by Django 4.2.15 on 2024-09-23 10:12
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("audit", "0003_audittraildiff"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AuditTrailOutbox",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "record",
+                    models.JSONField(
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        help_text="Fields of the audit trail entry.",
+                        verbose_name="record",
+                    ),
+                ),
+                (
+                    "changes",
+                    models.JSONField(
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        help_text="The changes in dictdiffer format for updates, which are stored instead of the old representation.",
+                        null=True,
+                        verbose_name="changes",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="created at"),
+                ),
+            ],
+            options={
+                "verbose_name": "audit trail outbox entry",
+                "verbose_name_plural": "audit trail outbox entries",
+            },
+        ),
+    ]
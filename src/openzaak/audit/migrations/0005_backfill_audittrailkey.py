@@ -0,0 +1,35 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+# Generated by Django 4.2.15 on 2024-09-30 09:12
+
+from django.db import migrations
+
+import openzaak.audit.models
+
+
+def backfill_audittrail_keys(apps, schema_editor):
+    AuditTrail = apps.get_model("audittrails", "AuditTrail")
+    AuditTrailKey = apps.get_model("audit", "AuditTrailKey")
+
+    for _ in AuditTrailKey.objects.backfill(AuditTrail.objects.all()):
+        pass
+
+
+class Migration(migrations.Migration):
+    # the keys are committed per batch, so a large audit trail isn't backfilled in a
+    # single transaction and an interrupted migration continues where it stopped
+    atomic = False
+
+    dependencies = [
+        ("audit", "0004_audittrailoutbox"),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name="audittrailkey",
+            managers=[
+                ("objects", openzaak.audit.models.AuditTrailKeyManager()),
+            ],
+        ),
+        migrations.RunPython(backfill_audittrail_keys, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+# Generated by Django 4.2.15 on 2024-10-07 09:41
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("audit", "0005_backfill_audittrailkey"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="audittrailoutbox",
+            name="changes",
+        ),
+    ]
@@ -0,0 +1,156 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+import uuid
+from typing import Iterable, Iterator, List, Optional
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.utils import get_uuid_from_path
+
+
+def get_main_object_uuid(url: str) -> Optional[uuid.UUID]:
+    try:
+        return uuid.UUID(get_uuid_from_path(url))
+    except ValueError:
+        return None
+
+
+class AuditTrailKeyManager(models.Manager):
+    use_in_migrations = True
+
+    def create_for(self, audittrails: Iterable[AuditTrail]) -> List["AuditTrailKey"]:
+        keys = []
+        for audittrail in audittrails:
+            main_object_uuid = get_main_object_uuid(audittrail.hoofd_object)
+            if main_object_uuid is None:
+                continue
+            keys.append(
+                self.model(audittrail=audittrail, hoofd_object_uuid=main_object_uuid)
+            )
+        return self.bulk_create(keys, ignore_conflicts=True)
+
+    def backfill(
+        self, audittrails: models.QuerySet, batch_size: int = 10_000
+    ) -> Iterator[int]:
+        """
+        Create the missing keys of the audit trail entries, in batches.
+
+        Only the entries without a key are processed, so an interrupted backfill
+        continues where it stopped. Every batch is committed on its own, unless
+        the backfill runs in a transaction.
+
+        Yields the number of processed audit trail entries after every batch.
+        """
+        # entries of which the main object has no UUID never get a key, so the
+        # batches still move past the last processed entry
+        audittrails = audittrails.filter(main_object_key__isnull=True)
+        last_pk, processed = 0, 0
+        while True:
+            batch = list(
+                audittrails.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .only("pk", "hoofd_object")[:batch_size]
+            )
+            if not batch:
+                break
+
+            self.create_for(batch)
+            last_pk = batch[-1].pk
+            processed += len(batch)
+            yield processed
+
+
+class AuditTrailKey(models.Model):
+    """
+    Exact-match lookup key for the main object of an audit trail entry.
+
+    The audit trail only stores the URL of the main object, which can only be
+    searched with a (slow) substring match on large tables.
+    """
+
+    audittrail = models.OneToOneField(
+        AuditTrail,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="main_object_key",
+        verbose_name=_("audit trail"),
+    )
+    hoofd_object_uuid = models.UUIDField(
+        _("hoofd object UUID"),
+        db_index=True,
+        help_text=_("UUID of the main object of the audit trail entry."),
+    )
+
+    objects = AuditTrailKeyManager()
+
+    class Meta:
+        verbose_name = _("audit trail key")
+        verbose_name_plural = _("audit trail keys")
+
+
+class AuditTrailDiff(models.Model):
+    """
+    Changes of an update audit trail entry that is stored in compact form.
+
+    Compact entries don't store the complete ``oud`` and ``nieuw`` representations,
+    only the changes. Every so many changes of a resource a full snapshot is stored
+    instead (with empty ``changes``), which is the starting point to reconstruct
+    the complete representations.
+    """
+
+    audittrail = models.OneToOneField(
+        AuditTrail,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="compact_diff",
+        verbose_name=_("audit trail"),
+    )
+    resource_uuid = models.UUIDField(_("resource UUID"), db_index=True)
+    changes = models.JSONField(
+        _("changes"),
+        null=True,
+        encoder=DjangoJSONEncoder,
+        help_text=_(
+            "The changes in dictdiffer format, empty if the audit trail entry is "
+            "a full snapshot."
+        ),
+    )
+    depth = models.PositiveIntegerField(
+        _("depth"), help_text=_("Number of changes since the last full snapshot.")
+    )
+    state_hash = models.CharField(
+        _("state hash"),
+        max_length=40,
+        help_text=_("Hash of the representation after the change."),
+    )
+
+    class Meta:
+        verbose_name = _("audit trail diff")
+        verbose_name_plural = _("audit trail diffs")
+
+    @property
+    def is_snapshot(self) -> bool:
+        return self.changes is None
+
+
+class AuditTrailOutbox(models.Model):
+    """
+    An audit trail entry waiting to be written.
+
+    Outbox entries are written in the same database transaction as the change they
+    describe and are turned into audit trail entries by a background worker.
+    """
+
+    record = models.JSONField(
+        _("record"),
+        encoder=DjangoJSONEncoder,
+        help_text=_("Fields of the audit trail entry."),
+    )
+    created_at = models.DateTimeField(_("created at"), auto_now_add=True)
+
+    class Meta:
+        verbose_name = _("audit trail outbox entry")
+        verbose_name_plural = _("audit trail outbox entries")
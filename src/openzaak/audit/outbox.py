@@ -0,0 +1,92 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+"""
+Asynchronous writing of audit trail entries.
+
+Instead of writing the audit trail entry (and its lookup key and compact changes)
+as part of the request, a minimal record is stored in an outbox table in the same
+transaction as the change. A background worker turns the records into audit trail
+entries in batches.
+
+The records are written in the order they were created, by a single worker at a
+time, so the audit trail of a main object keeps its order.
+"""
+from typing import List, Optional
+
+from django.conf import settings
+from django.db import transaction
+
+from vng_api_common.audittrails.models import AuditTrail
+
+from openzaak.utils.db import pg_advisory_lock
+
+from .compact import compact_audittrail
+from .models import AuditTrailKey, AuditTrailOutbox
+
+LOCK_ID_AUDITTRAIL_WRITER = "write-audittrails"
+
+
+def async_enabled() -> bool:
+    return settings.AUDIT_TRAIL_ASYNC
+
+
+def enqueue_audittrails(records: List[dict]) -> List[AuditTrailOutbox]:
+    """
+    Store the audit trail records in the outbox and wake up the writer after the
+    commit.
+
+    ⚡️ The records are stored as they are, they are only serialized once to be
+    stored in the JSON field. Anything else is left to the writer.
+    """
+    from .tasks import write_audittrails
+
+    entries = AuditTrailOutbox.objects.bulk_create(
+        [AuditTrailOutbox(record=record) for record in records]
+    )
+    transaction.on_commit(write_audittrails.delay)
+    return entries
+
+
+def write_outbox(batch_size: Optional[int] = None) -> int:
+    """
+    Write a batch of audit trail records from the outbox.
+
+    :return: the number of written audit trail entries
+    """
+    batch_size = batch_size or settings.AUDIT_TRAIL_OUTBOX_BATCH_SIZE
+
+    # a single writer at a time, to keep the order of the audit trail
+    with pg_advisory_lock(LOCK_ID_AUDITTRAIL_WRITER):
+        entries = list(AuditTrailOutbox.objects.order_by("pk")[:batch_size])
+        if not entries:
+            return 0
+
+        # the records are read from a JSON field, like the audit trail entries are
+        audittrails = AuditTrail.objects.bulk_create(
+            [AuditTrail(**entry.record) for entry in entries]
+        )
+        AuditTrailKey.objects.create_for(audittrails)
+
+        for audittrail, entry in zip(audittrails, entries):
+            # ``aanmaakdatum`` is set on every save, restore the moment of the change
+            audittrail.aanmaakdatum = entry.created_at
+            if not (
+                settings.AUDIT_TRAIL_COMPACT and audittrail.oud and audittrail.nieuw
+            ):
+                continue
+
+            compact_diff = compact_audittrail(
+                audittrail, audittrail.oud, audittrail.nieuw
+            )
+            if compact_diff is not None:
+                compact_diff.audittrail = audittrail
+                # saved one by one, the next entry of the resource continues the chain
+                compact_diff.save()
+
+        # ``bulk_update`` doesn't touch ``aanmaakdatum``, unlike ``save``
+        AuditTrail.objects.bulk_update(
+            audittrails, fields=["aanmaakdatum", "oud", "nieuw"]
+        )
+        AuditTrailOutbox.objects.filter(pk__in=[entry.pk for entry in entries]).delete()
+
+    return len(audittrails)
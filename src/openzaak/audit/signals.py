@@ -0,0 +1,14 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from vng_api_common.audittrails.models import AuditTrail
+
+from .models import AuditTrailKey
+
+
+@receiver(post_save, sender=AuditTrail, dispatch_uid="audit.create_audittrail_key")
+def create_audittrail_key(sender, instance: AuditTrail, created: bool, **kwargs):
+    if created:
+        AuditTrailKey.objects.create_for([instance])
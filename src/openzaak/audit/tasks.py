@@ -0,0 +1,16 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+import logging
+
+from openzaak import celery_app
+
+from .outbox import write_outbox
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task()
+def write_audittrails():
+    written = write_outbox()
+    if written:
+        logger.info("Wrote %d audit trail entries from the outbox", written)
@@ -0,0 +1,96 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+import gzip
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from freezegun import freeze_time
+from vng_api_common.audittrails.models import AuditTrail
+
+from openzaak.components.zaken.tests.factories import ZaakFactory
+
+from ..models import AuditTrailKey
+from .test_audittrail_key import create_audittrail
+
+
+class ArchiveAuditTrailsTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.output_dir = Path(tmpdir.name)
+
+        zaak = ZaakFactory.create()
+        self.url = zaak.get_absolute_api_url(version=1)
+
+    def test_archive_old_months(self):
+        with freeze_time("2023-01-15"):
+            old1 = create_audittrail(self.url)
+            old2 = create_audittrail(self.url)
+        with freeze_time("2023-03-01"):
+            old3 = create_audittrail(self.url)
+        with freeze_time("2024-01-10"):
+            recent = create_audittrail(self.url)
+
+        with freeze_time("2024-02-20"):
+            call_command(
+                "archive_audittrails",
+                retention_months=6,
+                output_dir=self.output_dir,
+                batch_size=1,
+                stdout=StringIO(),
+            )
+
+        self.assertEqual(list(AuditTrail.objects.all()), [recent])
+        self.assertEqual(AuditTrailKey.objects.count(), 1)
+
+        self.assertEqual(
+            sorted(path.name for path in self.output_dir.iterdir()),
+            [
+                "audittrail-2023-01-20240220T000000.jsonl.gz",
+                "audittrail-2023-03-20240220T000000.jsonl.gz",
+            ],
+        )
+        with gzip.open(
+            self.output_dir / "audittrail-2023-01-20240220T000000.jsonl.gz", "rt"
+        ) as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual([r["uuid"] for r in records], [str(old1.uuid), str(old2.uuid)])
+        with gzip.open(
+            self.output_dir / "audittrail-2023-03-20240220T000000.jsonl.gz", "rt"
+        ) as f:
+            self.assertEqual(json.loads(f.readline())["uuid"], str(old3.uuid))
+
+    def test_keep(self):
+        with freeze_time("2023-01-15"):
+            create_audittrail(self.url)
+
+        for run_at in ("2024-02-20", "2024-02-21"):
+            with freeze_time(run_at):
+                call_command(
+                    "archive_audittrails",
+                    retention_months=6,
+                    output_dir=self.output_dir,
+                    keep=True,
+                    stdout=StringIO(),
+                )
+
+        self.assertEqual(AuditTrail.objects.count(), 1)
+        # every run writes its own file, instead of appending duplicates
+        paths = sorted(self.output_dir.iterdir())
+        self.assertEqual(
+            [path.name for path in paths],
+            [
+                "audittrail-2023-01-20240220T000000.jsonl.gz",
+                "audittrail-2023-01-20240221T000000.jsonl.gz",
+            ],
+        )
+        for path in paths:
+            with gzip.open(path, "rt") as f:
+                self.assertEqual(len(f.readlines()), 1)
@@ -0,0 +1,126 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from maykin_2fa.test import disable_admin_mfa
+from vng_api_common.audittrails.models import AuditTrail
+
+from openzaak.components.zaken.tests.factories import ZaakFactory
+from openzaak.tests.utils import AdminTestMixin, TestMigrations
+
+from ..models import AuditTrailKey
+
+
+def create_audittrail(hoofd_object: str, **kwargs) -> AuditTrail:
+    return AuditTrail.objects.create(
+        bron="ZRC",
+        actie="update",
+        resultaat=200,
+        hoofd_object=hoofd_object,
+        resource="zaak",
+        resource_url=hoofd_object,
+        resource_weergave="zaak",
+        **kwargs,
+    )
+
+
+class AuditTrailKeyTests(TestCase):
+    def test_key_is_created_on_write(self):
+        zaak = ZaakFactory.create()
+
+        audittrail = create_audittrail(zaak.get_absolute_api_url(version=1))
+
+        key = AuditTrailKey.objects.get()
+        self.assertEqual(key.audittrail, audittrail)
+        self.assertEqual(key.hoofd_object_uuid, zaak.uuid)
+
+    def test_backfill(self):
+        zaak = ZaakFactory.create()
+        create_audittrail(zaak.get_absolute_api_url(version=1))
+        create_audittrail(zaak.get_absolute_api_url(version=1))
+        AuditTrailKey.objects.all().delete()
+
+        call_command("backfill_audittrail_keys", batch_size=1, stdout=StringIO())
+
+        self.assertEqual(
+            AuditTrailKey.objects.filter(hoofd_object_uuid=zaak.uuid).count(), 2
+        )
+
+    def test_backfill_skips_entries_with_key(self):
+        zaak = ZaakFactory.create()
+        create_audittrail(zaak.get_absolute_api_url(version=1))
+        audittrail = create_audittrail(zaak.get_absolute_api_url(version=1))
+        AuditTrailKey.objects.filter(audittrail=audittrail).delete()
+
+        processed = list(AuditTrailKey.objects.backfill(AuditTrail.objects.all()))
+
+        self.assertEqual(processed, [1])
+        self.assertEqual(AuditTrailKey.objects.count(), 2)
+
+    def test_audittrail_page_only_contains_main_object(self):
+        zaak, other_zaak = ZaakFactory.create_batch(2)
+        for _ in range(3):
+            create_audittrail(
+                zaak.get_absolute_api_url(version=1),
+                oud={"foo": "bar"},
+                nieuw={"foo": "baz"},
+            )
+        create_audittrail(other_zaak.get_absolute_api_url(version=1))
+        zaak.audittrail_page_size = 2
+
+        page = zaak.get_audittrail_page(2)
+
+        self.assertEqual(page.paginator.count, 3)
+        self.assertEqual(len(page), 1)
+        self.assertEqual(page[0].changes, [("change", {"foo": ("bar", "baz")})])
+
+
+@disable_admin_mfa()
+class AuditTrailHistoryAdminTests(AdminTestMixin, TestCase):
+    def test_history_view(self):
+        zaak = ZaakFactory.create()
+        create_audittrail(zaak.get_absolute_api_url(version=1), toelichting="foo")
+        url = reverse("admin:zaken_zaak_history", args=(zaak.pk,))
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context["audittrail_page"]), 1)
+        self.assertContains(response, "foo")
+
+
+class BackfillMigrationTests(TestMigrations):
+    app = "audit"
+    migrate_from = "0004_audittrailoutbox"
+    migrate_to = "0005_backfill_audittrailkey"
+
+    def setUpBeforeMigration(self, apps):
+        AuditTrail = apps.get_model("audittrails", "AuditTrail")
+        self.zaak_url = (
+            "http://testserver/zaken/api/v1/zaken/4f8b4811-5d7e-4e9b-8201-b35f5101f891"
+        )
+        for hoofd_object in (self.zaak_url, self.zaak_url, "http://testserver/foo"):
+            AuditTrail.objects.create(
+                bron="ZRC",
+                actie="update",
+                resultaat=200,
+                hoofd_object=hoofd_object,
+                resource="zaak",
+                resource_url=hoofd_object,
+                resource_weergave="zaak",
+            )
+
+    def test_keys_are_created(self):
+        AuditTrailKey = self.apps.get_model("audit", "AuditTrailKey")
+
+        self.assertEqual(
+            AuditTrailKey.objects.filter(
+                hoofd_object_uuid="4f8b4811-5d7e-4e9b-8201-b35f5101f891"
+            ).count(),
+            2,
+        )
+        self.assertEqual(AuditTrailKey.objects.count(), 2)
@@ -0,0 +1,176 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+from vng_api_common.tests import reverse
+
+from openzaak.components.catalogi.tests.factories import ZaakTypeFactory
+from openzaak.components.zaken.models import Zaak
+from openzaak.components.zaken.tests.factories import ZaakFactory
+from openzaak.components.zaken.tests.utils import ZAAK_WRITE_KWARGS
+from openzaak.tests.utils import JWTAuthMixin
+
+from ..compact import compact_audittrail, rebase, reconstruct
+from ..models import AuditTrailDiff
+
+
+@override_settings(AUDIT_TRAIL_COMPACT=True, AUDIT_TRAIL_SNAPSHOT_INTERVAL=3)
+class CompactAuditTrailAPITests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def _create_zaak(self) -> dict:
+        zaaktype = ZaakTypeFactory.create(concept=False)
+        response = self.client.post(
+            reverse(Zaak),
+            {
+                "zaaktype": f"http://testserver{reverse(zaaktype)}",
+                "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.openbaar,
+                "bronorganisatie": "517439943",
+                "verantwoordelijkeOrganisatie": "517439943",
+                "registratiedatum": "2018-12-24",
+                "startdatum": "2018-12-24",
+            },
+            **ZAAK_WRITE_KWARGS,
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.json()
+
+    def test_updates_are_stored_as_changes(self):
+        zaak_data = self._create_zaak()
+        versions = [zaak_data]
+        for index in range(4):
+            response = self.client.patch(
+                zaak_data["url"],
+                {"toelichting": f"change {index}"},
+                **ZAAK_WRITE_KWARGS,
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            versions.append(response.json())
+
+        updates = AuditTrail.objects.filter(actie="partial_update").order_by("pk")
+        self.assertEqual(
+            [(audit.oud is None, audit.compact_diff.depth) for audit in updates],
+            [(False, 0), (True, 1), (True, 2), (False, 0)],
+        )
+
+        zaak = Zaak.objects.get()
+        response = self.client.get(
+            reverse("audittrail-list", kwargs={"zaak_uuid": zaak.uuid})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = {entry["uuid"]: entry for entry in response.json()}
+        for audit, oud, nieuw in zip(updates, versions, versions[1:]):
+            entry = data[str(audit.uuid)]
+            with self.subTest(nieuw=nieuw["toelichting"]):
+                self.assertEqual(entry["oud"], oud)
+                self.assertEqual(entry["nieuw"], nieuw)
+
+    def test_retrieve_compact_entry(self):
+        zaak_data = self._create_zaak()
+        for toelichting in ("first", "second"):
+            response = self.client.patch(
+                zaak_data["url"], {"toelichting": toelichting}, **ZAAK_WRITE_KWARGS
+            )
+        audittrail = AuditTrail.objects.order_by("pk").last()
+        self.assertIsNone(audittrail.nieuw)
+
+        response = self.client.get(
+            reverse(
+                "audittrail-detail",
+                kwargs={"zaak_uuid": Zaak.objects.get().uuid, "uuid": audittrail.uuid},
+            )
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["oud"]["toelichting"], "first")
+        self.assertEqual(response.json()["nieuw"]["toelichting"], "second")
+
+
+class CompactAuditTrailTests(TestCase):
+    def _create(self, url: str, oud: dict, nieuw: dict) -> AuditTrail:
+        audittrail = AuditTrail(
+            bron="ZRC",
+            actie="update",
+            resultaat=200,
+            hoofd_object=url,
+            resource="zaak",
+            resource_url=url,
+            resource_weergave="zaak",
+            oud=oud,
+            nieuw=nieuw,
+        )
+        with override_settings(AUDIT_TRAIL_SNAPSHOT_INTERVAL=10):
+            compact_diff = compact_audittrail(audittrail, oud, nieuw)
+        audittrail.save()
+        compact_diff.audittrail = audittrail
+        compact_diff.save()
+        return audittrail
+
+    def test_new_snapshot_if_chain_is_broken(self):
+        url = ZaakFactory.create().get_absolute_api_url(version=1)
+        self._create(url, {"a": 1}, {"a": 2})
+        # changed outside the API in between
+        audittrail = self._create(url, {"a": 3}, {"a": 4})
+
+        self.assertEqual(audittrail.oud, {"a": 3})
+        self.assertTrue(audittrail.compact_diff.is_snapshot)
+
+    def test_latest_diff_is_locked(self):
+        url = ZaakFactory.create().get_absolute_api_url(version=1)
+        self._create(url, {"a": 1}, {"a": 2})
+
+        with CaptureQueriesContext(connection) as context:
+            self._create(url, {"a": 2}, {"a": 3})
+
+        self.assertTrue(
+            any("FOR UPDATE" in query["sql"] for query in context.captured_queries)
+        )
+
+    def test_rebase(self):
+        url = ZaakFactory.create().get_absolute_api_url(version=1)
+        first = self._create(url, {"a": 1}, {"a": 2})
+        second = self._create(url, {"a": 2}, {"a": 3, "b": [1]})
+        third = self._create(url, {"a": 3, "b": [1]}, {"a": 3, "b": [1, 2]})
+        self.assertIsNone(second.nieuw)
+
+        rebase([second.compact_diff.resource_uuid], after_pk=first.pk)
+        first.delete()
+
+        audittrails = list(
+            AuditTrail.objects.select_related("compact_diff").order_by("pk")
+        )
+        reconstruct(audittrails)
+        self.assertEqual(AuditTrailDiff.objects.get(pk=second.pk).depth, 0)
+        self.assertEqual(
+            [(audit.oud, audit.nieuw) for audit in audittrails],
+            [
+                ({"a": 2}, {"a": 3, "b": [1]}),
+                ({"a": 3, "b": [1]}, {"a": 3, "b": [1, 2]}),
+            ],
+        )
+        self.assertEqual(audittrails[1].pk, third.pk)
+
+    def test_reconstruct_starts_at_latest_snapshot(self):
+        url = ZaakFactory.create().get_absolute_api_url(version=1)
+        self._create(url, {"a": 1}, {"a": 2})
+        old = self._create(url, {"a": 2}, {"a": 3})
+        # changed outside the API in between, starting a new chain
+        self._create(url, {"a": 4}, {"a": 5})
+        latest = self._create(url, {"a": 5}, {"a": 6})
+        # the older chain can't be replayed, so it must not be fetched
+        AuditTrailDiff.objects.filter(pk=old.pk).update(
+            changes=[["change", "missing", [1, 2]]]
+        )
+
+        audittrail = AuditTrail.objects.select_related("compact_diff").get(pk=latest.pk)
+        with self.assertNumQueries(2):
+            reconstruct([audittrail])
+
+        self.assertEqual((audittrail.oud, audittrail.nieuw), ({"a": 5}, {"a": 6}))
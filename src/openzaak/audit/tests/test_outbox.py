@@ -0,0 +1,110 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+from django.test import override_settings
+
+from freezegun import freeze_time
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+from vng_api_common.tests import reverse
+
+from openzaak.components.catalogi.tests.factories import ZaakTypeFactory
+from openzaak.components.zaken.models import Zaak
+from openzaak.components.zaken.tests.utils import ZAAK_WRITE_KWARGS
+from openzaak.tests.utils import JWTAuthMixin
+
+from ..models import AuditTrailKey, AuditTrailOutbox
+from ..outbox import write_outbox
+
+
+@override_settings(AUDIT_TRAIL_ASYNC=True)
+class AuditTrailOutboxTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def _create_zaak(self) -> dict:
+        zaaktype = ZaakTypeFactory.create(concept=False)
+        response = self.client.post(
+            reverse(Zaak),
+            {
+                "zaaktype": f"http://testserver{reverse(zaaktype)}",
+                "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.openbaar,
+                "bronorganisatie": "517439943",
+                "verantwoordelijkeOrganisatie": "517439943",
+                "registratiedatum": "2018-12-24",
+                "startdatum": "2018-12-24",
+            },
+            **ZAAK_WRITE_KWARGS,
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.data
+
+    def test_audittrails_are_written_in_the_background(self):
+        with freeze_time("2024-01-01T12:00:00Z"):
+            zaak_data = self._create_zaak()
+        with freeze_time("2024-01-01T12:05:00Z"):
+            response = self.client.patch(
+                zaak_data["url"], {"toelichting": "aangepast"}, **ZAAK_WRITE_KWARGS
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertFalse(AuditTrail.objects.exists())
+        self.assertEqual(AuditTrailOutbox.objects.count(), 2)
+        # the records are stored as they are
+        update = AuditTrailOutbox.objects.order_by("pk").last()
+        self.assertEqual(update.record["oud"], zaak_data)
+
+        written = write_outbox()
+
+        self.assertEqual(written, 2)
+        self.assertFalse(AuditTrailOutbox.objects.exists())
+        create, update = AuditTrail.objects.order_by("pk")
+        self.assertEqual(create.actie, "create")
+        self.assertEqual(create.nieuw, zaak_data)
+        self.assertEqual(update.actie, "partial_update")
+        self.assertEqual(update.oud, zaak_data)
+        self.assertEqual(update.nieuw, response.data)
+        self.assertEqual(update.hoofd_object, zaak_data["url"])
+        self.assertEqual(update.aanmaakdatum.isoformat(), "2024-01-01T12:05:00+00:00")
+        self.assertEqual(AuditTrailKey.objects.count(), 2)
+
+    def test_write_in_batches_keeps_order(self):
+        zaak_data = self._create_zaak()
+        for toelichting in ("first", "second", "third"):
+            self.client.patch(
+                zaak_data["url"], {"toelichting": toelichting}, **ZAAK_WRITE_KWARGS
+            )
+
+        self.assertEqual(write_outbox(batch_size=3), 3)
+        self.assertEqual(write_outbox(batch_size=3), 1)
+        self.assertEqual(write_outbox(batch_size=3), 0)
+
+        audittrails = AuditTrail.objects.order_by("pk")
+        self.assertEqual(
+            [audit.nieuw["toelichting"] for audit in audittrails],
+            ["", "first", "second", "third"],
+        )
+
+    @override_settings(AUDIT_TRAIL_COMPACT=True)
+    def test_write_compact(self):
+        zaak_data = self._create_zaak()
+        for toelichting in ("first", "second"):
+            self.client.patch(
+                zaak_data["url"], {"toelichting": toelichting}, **ZAAK_WRITE_KWARGS
+            )
+
+        write_outbox()
+
+        *_, first, second = AuditTrail.objects.order_by("pk")
+        self.assertTrue(first.compact_diff.is_snapshot)
+        self.assertEqual(first.nieuw["toelichting"], "first")
+        self.assertIsNone(second.nieuw)
+        self.assertEqual(second.compact_diff.depth, 1)
+
+    def test_destroy_zaak_removes_pending_audittrails(self):
+        zaak_data = self._create_zaak()
+
+        response = self.client.delete(zaak_data["url"])
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(AuditTrailOutbox.objects.exists())
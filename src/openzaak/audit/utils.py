@@ -0,0 +1,38 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+from vng_api_common.audittrails.audits import Audit
+from vng_api_common.compat import get_header
+from vng_api_common.constants import CommonResourceAction
+
+
+def get_audittrail_kwargs(
+    request, audit: Audit, action: str, status_code: int, main_object: str
+) -> dict:
+    """
+    Return the request-related fields of an audit trail entry.
+
+    Mirrors :meth:`vng_api_common.audittrails.viewsets.AuditTrailMixin.create_audittrail`.
+    """
+    jwt_auth = request.jwt_auth
+    applications = jwt_auth.applicaties
+    if applications:
+        application = applications[0]
+        app_id, app_presentation = str(application.uuid), application.label
+    else:
+        app_id = get_header(request, "X-NLX-Request-Application-Id")
+        app_presentation = app_id
+
+    action_labels = dict(zip(CommonResourceAction.names, CommonResourceAction.labels))
+    return dict(
+        bron=audit.component_name,
+        logrecord_id=get_header(request, "X-NLX-Logrecord-ID") or "",
+        applicatie_id=app_id,
+        applicatie_weergave=app_presentation,
+        actie=action,
+        actie_weergave=action_labels.get(action, ""),
+        gebruikers_id=jwt_auth.payload.get("user_id") or "",
+        gebruikers_weergave=jwt_auth.payload.get("user_representation") or "",
+        resultaat=status_code,
+        hoofd_object=main_object,
+        toelichting=get_header(request, "X-Audit-Toelichting") or "",
+    )
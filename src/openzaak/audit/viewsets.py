@@ -0,0 +1,95 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+from django.conf import settings
+from django.db import transaction
+
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.audittrails.viewsets import (
+    AuditTrailCreateMixin as _AuditTrailCreateMixin,
+    AuditTrailDestroyMixin as _AuditTrailDestroyMixin,
+    AuditTrailMixin as _AuditTrailMixin,
+    AuditTrailUpdateMixin as _AuditTrailUpdateMixin,
+)
+
+from .compact import compact_audittrail
+from .models import AuditTrailOutbox
+from .outbox import async_enabled, enqueue_audittrails
+from .utils import get_audittrail_kwargs
+
+
+class AuditTrailMixin(_AuditTrailMixin):
+    """
+    Write the audit trail entries through the outbox if ``AUDIT_TRAIL_ASYNC`` is
+    enabled, and store the entries of updates as changes if ``AUDIT_TRAIL_COMPACT``
+    is enabled.
+    """
+
+    def create_audittrail(
+        self,
+        status_code,
+        action,
+        version_before_edit,
+        version_after_edit,
+        unique_representation,
+    ):
+        is_update = bool(version_before_edit and version_after_edit)
+        if not (async_enabled() or (settings.AUDIT_TRAIL_COMPACT and is_update)):
+            return super().create_audittrail(
+                status_code,
+                action,
+                version_before_edit,
+                version_after_edit,
+                unique_representation,
+            )
+
+        data = version_after_edit if version_after_edit else version_before_edit
+        if self.basename == self.audit.main_resource:
+            main_object = data["url"]
+        else:
+            main_object = self.get_audittrail_main_object_url(
+                data, self.audit.main_resource
+            )
+
+        record = dict(
+            resource=self.basename,
+            resource_url=data["url"],
+            resource_weergave=unique_representation,
+            oud=version_before_edit,
+            nieuw=version_after_edit,
+            **get_audittrail_kwargs(
+                self.request, self.audit, action, status_code, main_object
+            ),
+        )
+        if async_enabled():
+            enqueue_audittrails([record])
+            return
+
+        trail = AuditTrail(**record)
+        with transaction.atomic():
+            compact_diff = compact_audittrail(
+                trail, version_before_edit, version_after_edit
+            )
+            trail.save()
+            if compact_diff is not None:
+                compact_diff.audittrail = trail
+                compact_diff.save()
+
+
+class AuditTrailCreateMixin(AuditTrailMixin, _AuditTrailCreateMixin):
+    pass
+
+
+class AuditTrailUpdateMixin(AuditTrailMixin, _AuditTrailUpdateMixin):
+    pass
+
+
+class AuditTrailDestroyMixin(AuditTrailMixin, _AuditTrailDestroyMixin):
+    def _destroy_related_audittrails(self, main_object_url):
+        super()._destroy_related_audittrails(main_object_url)
+        AuditTrailOutbox.objects.filter(record__hoofd_object=main_object_url).delete()
+
+
+class AuditTrailViewsetMixin(
+    AuditTrailCreateMixin, AuditTrailUpdateMixin, AuditTrailDestroyMixin
+):
+    pass
@@ -3,13 +3,13 @@
 import logging
 
 from drf_spectacular.utils import extend_schema, extend_schema_view
-from notifications_api_common.viewsets import NotificationViewSetMixin
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.generics import get_object_or_404
 from vng_api_common.authorizations.models import Applicatie
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
+from openzaak.notifications.viewsets import NotificationViewSetMixin
 from openzaak.utils.pagination import OptimizedPagination
 from openzaak.utils.schema import COMMON_ERROR_RESPONSES
 
@@ -20,6 +20,7 @@ from openzaak.components.zaken.api.utils import (
     delete_remote_zaakbesluit,
 )
 from openzaak.utils.api import create_remote_oio
+from openzaak.utils.serializer_fields import MainObjectHyperlinkedRelatedField
 from openzaak.utils.serializers import ConvertNoneMixin
 from openzaak.utils.validators import (
     LooseFkIsImmutableValidator,
@@ -169,6 +170,8 @@ class BesluitSerializer(ConvertNoneMixin, serializers.HyperlinkedModelSerializer
 
 
 class BesluitInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
+    serializer_related_field = MainObjectHyperlinkedRelatedField
+
     informatieobject = EnkelvoudigInformatieObjectField(
         validators=[
             LooseFkIsImmutableValidator(instance_path="canonical"),
@@ -10,23 +10,23 @@ from drf_spectacular.utils import (
     extend_schema,
     extend_schema_view,
 )
-from notifications_api_common.viewsets import (
-    NotificationCreateMixin,
-    NotificationDestroyMixin,
-    NotificationViewSetMixin,
-)
 from rest_framework import mixins, viewsets
 from rest_framework.exceptions import ValidationError
-from vng_api_common.audittrails.viewsets import (
+from vng_api_common.caching import conditional_retrieve
+from vng_api_common.viewsets import CheckQueryParamsMixin
+
+from openzaak.audit.viewsets import (
     AuditTrailCreateMixin,
     AuditTrailDestroyMixin,
     AuditTrailViewsetMixin,
 )
-from vng_api_common.caching import conditional_retrieve
-from vng_api_common.viewsets import CheckQueryParamsMixin
-
 from openzaak.components.zaken.api.mixins import ClosedZaakMixin
 from openzaak.components.zaken.api.utils import delete_remote_zaakbesluit
+from openzaak.notifications.viewsets import (
+    NotificationCreateMixin,
+    NotificationDestroyMixin,
+    NotificationViewSetMixin,
+)
 from openzaak.utils.api import delete_remote_oio
 from openzaak.utils.data_filtering import ListFilterByAuthorizationsMixin
 from openzaak.utils.pagination import OptimizedPagination
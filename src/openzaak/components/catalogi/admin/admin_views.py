@@ -16,6 +16,7 @@ from openzaak.utils.admin import AdminContextMixin
 
 from ..api.viewsets import ZaakTypeViewSet
 from ..models import BesluitType, Catalogus, InformatieObjectType, ZaakType
+from ..utils import publish_concepts
 from ..validators import validate_zaaktype_for_publish
 from .forms import BesluitTypeFormSet, InformatieObjectTypeFormSet, ZaakTypeImportForm
 from .utils import (
@@ -288,20 +289,17 @@ class ZaaktypePublishView(AdminContextMixin, PermissionRequiredMixin, DetailView
         published_besluittypen = []
         published_informatieobjecttypen = []
 
-        # publish related types
-        for besluittype in self.object.besluittypen.filter(concept=True):
-            try:
-                besluittype.publish()
-                published_besluittypen.append(besluittype.omschrijving)
-            except ValidationError as e:
-                self.errors.append(f"{besluittype.omschrijving} – {e.message}")
-
-        for iot in self.object.informatieobjecttypen.filter(concept=True):
-            try:
-                iot.publish()
-                published_informatieobjecttypen.append(iot.omschrijving)
-            except ValidationError as e:
-                self.errors.append(f"{iot.omschrijving} – {e.message}")
+        # ⚡️ publish related types in bulk
+        for model, names in (
+            (BesluitType, published_besluittypen),
+            (InformatieObjectType, published_informatieobjecttypen),
+        ):
+            published, failed = publish_concepts(
+                model.objects.filter(zaaktypen=self.object)
+            )
+            names.extend(obj.omschrijving for obj in published)
+            for obj, e in failed:
+                self.errors.append(f"{obj.omschrijving} – {e.message}")
 
         if len(published_besluittypen) > 0:
             messages.add_message(
@@ -1,6 +1,8 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
+import logging
 from copy import deepcopy
+from typing import Dict, Iterator, List
 from urllib.parse import parse_qsl, quote as urlquote
 
 from django.contrib import admin, messages
@@ -8,7 +10,8 @@ from django.contrib.admin.templatetags.admin_urls import add_preserved_filters
 from django.contrib.admin.utils import flatten_fieldsets
 from django.core.exceptions import PermissionDenied, ValidationError
 from django.core.management import CommandError, call_command
-from django.http import HttpResponse, HttpResponseRedirect
+from django.db import transaction
+from django.http import HttpResponseRedirect, StreamingHttpResponse
 from django.template.response import TemplateResponse
 from django.urls import path, reverse
 from django.utils.html import format_html
@@ -30,6 +33,8 @@ from .forms import CatalogusImportForm
 from .helpers import AdminForm
 from .side_effects import NotificationSideEffect, VersioningSideEffect
 
+logger = logging.getLogger(__name__)
+
 VIEWSET_FOR_MODEL = {
     ZaakType: ZaakTypeViewSet,
     InformatieObjectType: InformatieObjectTypeViewSet,
@@ -58,6 +63,9 @@ class PublishAdminMixin:
     def _publish_validation_errors(self, obj):
         return []
 
+    def _publish_validation_errors_bulk(self, objs) -> Dict[int, List[str]]:
+        return {obj.pk: self._publish_validation_errors(obj) for obj in objs}
+
     def response_post_save_change(self, request, obj):
         if "_publish" in request.POST:
             # Clear messages
@@ -104,8 +112,10 @@ class PublishAdminMixin:
             )
             self.message_user(request, msg, level=messages.WARNING)
 
-        for obj in queryset.filter(concept=True):
-            errors = self._publish_validation_errors(obj)
+        concepts = list(queryset.filter(concept=True))
+        validation_errors = self._publish_validation_errors_bulk(concepts)
+        for obj in concepts:
+            errors = validation_errors[obj.pk]
             if errors:
                 for error in errors:
                     msg = _("%(obj)s can't be published: %(error)s") % {
@@ -252,6 +262,15 @@ class ExportMixin:
         """
         return [], []
 
+    def _stream_export(self, obj, first_chunk: bytes, chunks: Iterator[bytes]):
+        yield first_chunk
+        try:
+            yield from chunks
+        except Exception:
+            # the response is aborted, instead of ending with an incomplete archive
+            logger.exception("Could not export %r, the download is aborted", obj)
+            raise
+
     def response_post_save_change(self, request, obj):
         if "_export" in request.POST:
             # Clear messages
@@ -261,7 +280,8 @@ class ExportMixin:
 
             resource_list, id_list = self.get_related_objects(obj)
 
-            response = HttpResponse(content_type="application/zip")
+            # ⚡️ the archive is written while it's downloaded
+            response = StreamingHttpResponse(content_type="application/zip")
             filename = slugify(str(obj))
             response["Content-Disposition"] = "attachment;filename={}".format(
                 f"{filename}.zip"
@@ -273,15 +293,26 @@ class ExportMixin:
                 ids=id_list,
             )
 
-            response["Content-Length"] = len(response.content)
+            # the first chunk is generated before the response is sent, so that a
+            # failing export can still be reported, without rolling back the changes
+            chunks = iter(response.streaming_content)
+            try:
+                with transaction.atomic():
+                    first_chunk = next(chunks, b"")
+            except Exception:
+                logger.exception("Could not export %r", obj)
+                self.message_user(
+                    request,
+                    _("{} {} could not be exported").format(
+                        self.resource_name.capitalize(), obj
+                    ),
+                    level=messages.ERROR,
+                )
+                return HttpResponseRedirect(request.path)
 
-            self.message_user(
-                request,
-                _("{} {} was successfully exported").format(
-                    self.resource_name.capitalize(), obj
-                ),
-                level=messages.SUCCESS,
-            )
+            # there is no success message, the download itself shows if the export
+            # succeeded and a message can't be added once the response is sent
+            response.streaming_content = self._stream_export(obj, first_chunk, chunks)
             return response
         else:
             return super().response_post_save_change(request, obj)
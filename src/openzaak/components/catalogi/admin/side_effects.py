@@ -1,19 +1,16 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2021 Dimpact
-import uuid
 from abc import ABC, abstractmethod
-from datetime import date
 
 from rest_framework.request import Request
 
-from openzaak.utils.models import clone_object
-
 from ..api.viewsets import (
     BesluitTypeViewSet,
     InformatieObjectTypeViewSet,
     ZaakTypeViewSet,
 )
 from ..models import BesluitType, InformatieObjectType, ZaakType
+from ..versioning import create_new_version
 
 VIEWSET_FOR_MODEL = {
     ZaakType: ZaakTypeViewSet,
@@ -56,44 +53,9 @@ class VersioningSideEffect(SideEffectBase):
         self.new_version = self.create_new_version()
 
     def create_new_version(self):
-        new_obj = clone_object(self.original)
-        version_date = date.today()
-
-        new_obj.uuid = uuid.uuid4()
-        new_obj.datum_begin_geldigheid = version_date
-        new_obj.versiedatum = version_date
-        new_obj.datum_einde_geldigheid = None
-        new_obj.concept = True
-        new_obj.save()
-
-        related_objects = [
-            f
-            for f in new_obj._meta.get_fields(include_hidden=True)
-            if (f.auto_created and not f.concrete)
-        ]
-
-        # related objects
-        for relation in related_objects:
-            if relation.name in self.modeladmin.exclude_copy_relation:
-                continue
-
-            # m2m relation included in the loop below as one_to_many
-            if relation.one_to_many or relation.one_to_one:
-                remote_model = relation.related_model
-                remote_field = relation.field.name
-
-                related_queryset = remote_model.objects.filter(
-                    **{remote_field: self.original.pk}
-                )
-                for related_obj in related_queryset:
-                    related_obj.pk = None
-                    setattr(related_obj, remote_field, new_obj)
-
-                    if hasattr(related_obj, "uuid"):
-                        related_obj.uuid = uuid.uuid4()
-                    related_obj.save()
-
-        return new_obj
+        return create_new_version(
+            self.original, exclude=self.modeladmin.exclude_copy_relation
+        )
 
 
 class NotificationSideEffect(SideEffectBase):
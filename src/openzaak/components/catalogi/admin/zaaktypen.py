@@ -35,7 +35,8 @@ from ..models import (
     ZaakTypeInformatieObjectType,
     ZaakTypenRelatie,
 )
-from ..validators import validate_zaaktype_for_publish
+from ..snapshot import bump_generation
+from ..validators import get_zaaktypen_publish_errors, validate_zaaktype_for_publish
 from .admin_views import ZaaktypePublishView
 from .eigenschap import EigenschapAdmin
 from .filters import GeldigheidFilter
@@ -344,6 +345,16 @@ class ZaakTypeAdmin(
             errors.append(error)
         return errors
 
+    def _publish_validation_errors_bulk(self, objs):
+        # ⚡️ the related objects of all the zaaktypen are verified in a single query
+        errors = get_zaaktypen_publish_errors(
+            ZaakType.objects.filter(pk__in=[obj.pk for obj in objs])
+        )
+        return {
+            pk: [error for field, error in zaaktype_errors]
+            for pk, zaaktype_errors in errors.items()
+        }
+
     def get_object_actions(self, obj):
         return (
             link_to_related_objects(StatusType, obj),
@@ -432,6 +443,7 @@ class ZaakTypeAdmin(
                 brondatum_archiefprocedure_registratie="",
                 brondatum_archiefprocedure_procestermijn=None,
             )
+            bump_generation()
 
     def render_readonly(self, field, result_repr, value):
         if field.name == "selectielijst_procestype" and value:
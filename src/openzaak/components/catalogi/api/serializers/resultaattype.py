@@ -16,7 +16,7 @@ from vng_api_common.serializers import (
 )
 from vng_api_common.utils import get_help_text
 
-from openzaak.utils.validators import ResourceValidator, UniqueTogetherValidator
+from openzaak.utils.validators import UniqueTogetherValidator
 
 from ...models import ResultaatType
 from ..validators import (
@@ -26,6 +26,7 @@ from ..validators import (
     ProcestermijnAfleidingswijzeValidator,
     ProcesTypeValidator,
     RelationCatalogValidator,
+    SelectielijstResourceValidator,
     StartBeforeEndValidator,
     ZaakTypeConceptValidator,
 )
@@ -136,7 +137,7 @@ class ResultaatTypeSerializer(
             "url": {"lookup_field": "uuid"},
             "resultaattypeomschrijving": {
                 "validators": [
-                    ResourceValidator(
+                    SelectielijstResourceValidator(
                         "ResultaattypeOmschrijvingGeneriek",
                         settings.REFERENTIELIJSTEN_API_STANDARD,
                     )
@@ -151,7 +152,9 @@ class ResultaatTypeSerializer(
             "zaaktype": {"lookup_field": "uuid", "label": _("is van")},
             "selectielijstklasse": {
                 "validators": [
-                    ResourceValidator("Resultaat", settings.SELECTIELIJST_API_STANDARD)
+                    SelectielijstResourceValidator(
+                        "Resultaat", settings.SELECTIELIJST_API_STANDARD
+                    )
                 ]
             },
             "besluittypen": {"lookup_field": "uuid", "required": False},
@@ -18,8 +18,6 @@ from vng_api_common.serializers import (
     add_choice_values_help_text,
 )
 
-from openzaak.utils.validators import ResourceValidator
-
 from ...constants import AardRelatieChoices, RichtingChoices
 from ...models import BesluitType, ZaakType, ZaakTypenRelatie
 from ..validators import (
@@ -31,6 +29,7 @@ from ..validators import (
     M2MConceptCreateValidator,
     M2MConceptUpdateValidator,
     RelationCatalogValidator,
+    SelectielijstResourceValidator,
     VerlengingsValidator,
     ZaakTypeRelationsPublishValidator,
 )
@@ -253,7 +252,9 @@ class ZaakTypeSerializer(
             "producten_of_diensten": {"required": True},
             "selectielijst_procestype": {
                 "validators": [
-                    ResourceValidator("ProcesType", settings.SELECTIELIJST_API_STANDARD)
+                    SelectielijstResourceValidator(
+                        "ProcesType", settings.SELECTIELIJST_API_STANDARD
+                    )
                 ]
             },
             "deelzaaktypen": {"lookup_field": "uuid"},
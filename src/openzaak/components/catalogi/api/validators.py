@@ -12,7 +12,10 @@ from vng_api_common.constants import (
 
 from openzaak.client import fetch_object
 from openzaak.components.catalogi.api.scopes import SCOPE_CATALOGI_FORCED_WRITE
+from openzaak.selectielijst.api import get_mirrored_object
+from openzaak.selectielijst.constants import MirroredResources
 from openzaak.utils.serializers import get_from_serializer_data_or_instance
+from openzaak.utils.validators import ResourceValidator
 
 from ..constants import SelectielijstKlasseProcestermijn as Procestermijn
 from ..utils import has_overlapping_objects
@@ -155,6 +158,25 @@ class RelationCatalogValidator:
                 )
 
 
+class SelectielijstResourceValidator(ResourceValidator):
+    """
+    Validate a Selectielijst or Referentielijsten resource, without any requests if
+    the URL is in the local mirror of the Selectielijst API.
+    """
+
+    mirrored_resources = {
+        "ProcesType": MirroredResources.procestype,
+        "Resultaat": MirroredResources.resultaat,
+        "ResultaattypeOmschrijvingGeneriek": MirroredResources.resultaattypeomschrijving,
+    }
+
+    def __call__(self, url: str):
+        mirrored = get_mirrored_object(url, self.mirrored_resources[self.resource])
+        if mirrored is not None:
+            return mirrored
+        return super().__call__(url)
+
+
 class ProcesTypeValidator:
     code = "procestype-mismatch"
     message = _("{} should belong to the same procestype as {}")
@@ -170,7 +192,9 @@ class ProcesTypeValidator:
         if not selectielijstklasse_url:
             return
 
-        selectielijstklasse = fetch_object("resultaat", selectielijstklasse_url)
+        selectielijstklasse = get_mirrored_object(
+            selectielijstklasse_url, MirroredResources.resultaat
+        ) or fetch_object("resultaat", selectielijstklasse_url)
 
         if selectielijstklasse["procesType"] != zaaktype.selectielijst_procestype:
             raise ValidationError(
@@ -200,7 +224,9 @@ class ProcestermijnAfleidingswijzeValidator:
         if not selectielijstklasse_url or not archiefprocedure:
             return
 
-        selectielijstklasse = fetch_object("resultaat", selectielijstklasse_url)
+        selectielijstklasse = get_mirrored_object(
+            selectielijstklasse_url, MirroredResources.resultaat
+        ) or fetch_object("resultaat", selectielijstklasse_url)
         procestermijn = selectielijstklasse["procestermijn"]
         afleidingswijze = archiefprocedure["afleidingswijze"]
 
@@ -1,12 +1,12 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
 from drf_spectacular.utils import extend_schema, extend_schema_view
-from notifications_api_common.viewsets import NotificationViewSetMixin
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from vng_api_common.caching import conditional_retrieve
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
+from openzaak.notifications.viewsets import NotificationViewSetMixin
 from openzaak.utils.pagination import OptimizedPagination
 from openzaak.utils.permissions import AuthRequired
 from openzaak.utils.schema import COMMON_ERROR_RESPONSES, VALIDATION_ERROR_RESPONSES
@@ -80,7 +80,6 @@ class BesluitTypeViewSet(
         BesluitType.objects.all()
         .select_related("catalogus")
         .prefetch_related("informatieobjecttypen", "zaaktypen")
-        .with_dates()
         .order_by("-pk")
     )
     serializer_class = BesluitTypeSerializer
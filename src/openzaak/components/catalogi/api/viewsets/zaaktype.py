@@ -2,17 +2,20 @@
 # Copyright (C) 2019 - 2020 Dimpact
 
 from drf_spectacular.utils import extend_schema, extend_schema_view
-from notifications_api_common.viewsets import NotificationViewSetMixin
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
+from rest_framework.response import Response
 from vng_api_common.caching import conditional_retrieve
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
+from openzaak.notifications.viewsets import NotificationViewSetMixin
 from openzaak.utils.pagination import OptimizedPagination
 from openzaak.utils.permissions import AuthRequired
+from openzaak.utils.query import prefetch_related_uuids
 from openzaak.utils.schema import COMMON_ERROR_RESPONSES, VALIDATION_ERROR_RESPONSES
 
 from ...models import ZaakType
+from ...versioning import create_new_version
 from ..filters import ZaakTypeFilter
 from ..kanalen import KANAAL_ZAAKTYPEN
 from ..scopes import (
@@ -93,22 +96,18 @@ class ZaakTypeViewSet(
     zaken van eenzelfde soort.
     """
 
-    queryset = (
-        ZaakType.objects.prefetch_related(
-            # prefetch catalogus rather than select related -> far fewer catalogi, so less data to transfer
-            "catalogus",
-            "statustypen",
-            "zaaktypenrelaties",
-            "informatieobjecttypen",
-            "resultaattypen",
-            "eigenschap_set",
-            "roltype_set",
-            "deelzaaktypen",
-            "besluittypen",
-        )
-        .with_dates("identificatie")
-        .order_by("-pk")
-    )
+    queryset = ZaakType.objects.prefetch_related(
+        # prefetch catalogus rather than select related -> far fewer catalogi, so less data to transfer
+        "catalogus",
+        "statustypen",
+        "zaaktypenrelaties",
+        "informatieobjecttypen",
+        "resultaattypen",
+        "eigenschap_set",
+        "roltype_set",
+        "deelzaaktypen",
+        "besluittypen",
+    ).order_by("-pk")
     serializer_class = ZaakTypeSerializer
     publish_serializer = ZaakTypePublishSerializer
     lookup_field = "uuid"
@@ -123,9 +122,22 @@ class ZaakTypeViewSet(
         "partial_update": SCOPE_CATALOGI_WRITE | SCOPE_CATALOGI_FORCED_WRITE,
         "destroy": SCOPE_CATALOGI_WRITE | SCOPE_CATALOGI_FORCED_DELETE,
         "publish": SCOPE_CATALOGI_WRITE,
+        "new_version": SCOPE_CATALOGI_WRITE,
     }
     notifications_kanaal = KANAAL_ZAAKTYPEN
+    # the zaken of the original zaaktype keep referring to the original
+    exclude_copy_relation = ("zaak",)
     concept_related_fields = ["besluittypen", "informatieobjecttypen"]
+    retrieve_uuid_relations = (
+        "statustypen",
+        "resultaattypen",
+        "eigenschap_set",
+        "informatieobjecttypen",
+        "roltype_set",
+        "besluittypen",
+        "deelzaaktypen",
+        "zaakobjecttype_set",
+    )
 
     def get_queryset(self):
         qs = super().get_queryset()
@@ -139,8 +151,18 @@ class ZaakTypeViewSet(
             # is needed, the queries will be done during serialization and the amount
             # of queries will be the same.
             qs = qs.prefetch_related(None)
+        if action == "retrieve":
+            qs = qs.select_related("catalogus").prefetch_related("zaaktypenrelaties")
         return qs
 
+    def get_object(self):
+        obj = super().get_object()
+        if getattr(self, "action", None) == "retrieve":
+            # ⚡️ the URL lists of the related objects only need their uuid, which
+            # are fetched with a single query instead of a query per relation
+            prefetch_related_uuids(obj, self.retrieve_uuid_relations)
+        return obj
+
     def perform_update(self, serializer):
 
         if not serializer.partial:
@@ -168,3 +190,28 @@ class ZaakTypeViewSet(
     @action(detail=True, methods=["post"], name="zaaktype_publish")
     def publish(self, request, *args, **kwargs):
         return super()._publish(request, *args, **kwargs)
+
+    @extend_schema(
+        "zaaktype_new_version",
+        summary="Maak een nieuwe versie van het ZAAKTYPE aan.",
+        description=(
+            "Maak een nieuwe versie van het ZAAKTYPE aan, inclusief de statustypen, "
+            "roltypen, resultaattypen, eigenschappen... etc. De nieuwe versie is een "
+            "concept dat geldig is vanaf vandaag."
+        ),
+        request=None,
+        responses={
+            status.HTTP_201_CREATED: ZaakTypeSerializer,
+            **COMMON_ERROR_RESPONSES,
+        },
+    )
+    @action(detail=True, methods=["post"], name="zaaktype_new_version")
+    def new_version(self, request, *args, **kwargs):
+        instance = self.get_object()
+        new_version = create_new_version(instance, exclude=self.exclude_copy_relation)
+
+        data = self.get_serializer(new_version).data
+        # a new version is announced as a new zaaktype, like in the admin
+        self.action = "create"
+        self.notify(status.HTTP_201_CREATED, data, instance=new_version)
+        return Response(data, status=status.HTTP_201_CREATED)
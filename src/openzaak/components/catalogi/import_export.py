@@ -0,0 +1,481 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+"""
+Streaming import and export of the catalogi.
+
+The resources of an import file are read entry by entry and handled in batches: the
+UUIDs of the batch are remapped in a single pass, the references of the batch to
+local objects are looked up with one query per related resource, and the validated
+entries are inserted with one ``bulk_create`` per model.
+
+An export is generated as a stream of ZIP data, which is written while the objects
+are serialized chunk by chunk, so the complete export is never kept in memory.
+"""
+import io
+import json
+import re
+import uuid
+import zipfile
+from collections import defaultdict
+from itertools import chain
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from django.core.management.base import CommandError
+from django.db import IntegrityError, models, transaction
+from django.db.models.fields.related_descriptors import (
+    ForwardManyToOneDescriptor,
+    ManyToManyDescriptor,
+    ReverseManyToOneDescriptor,
+)
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework.relations import HyperlinkedRelatedField, ManyRelatedField
+from rest_framework.serializers import Serializer
+from vng_api_common.descriptors import GegevensGroepType
+
+from openzaak.components.autorisaties.models import AutorisatieSpec
+
+from .api import serializers, viewsets
+from .constants import IMPORT_ORDER
+from .models import BesluitType, InformatieObjectType, ZaakType
+from .snapshot import bump_generation
+
+CHUNK_SIZE = 64 * 1024
+
+BATCH_SIZE = 500
+
+EXPORT_CHUNK_SIZE = 500
+
+UUID_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+
+
+def iter_json_array(fp: BinaryIO, chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Yield the items of the JSON array in ``fp`` without reading the complete file.
+    """
+    decoder = json.JSONDecoder()
+    reader = io.TextIOWrapper(fp, encoding="utf-8")
+    buffer = ""
+    eof = False
+
+    def read_more() -> None:
+        nonlocal buffer, eof
+        chunk = reader.read(chunk_size)
+        eof = not chunk
+        buffer += chunk
+
+    def next_char() -> str:
+        nonlocal buffer
+        while True:
+            buffer = buffer.lstrip()
+            if buffer or eof:
+                return buffer[:1]
+            read_more()
+
+    if next_char() != "[":
+        raise ValueError("Expected a JSON array")
+    buffer = buffer[1:]
+    if next_char() == "]":
+        return
+
+    while True:
+        next_char()
+        try:
+            item, end = decoder.raw_decode(buffer)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            read_more()
+            continue
+        # a number could continue in the next chunk
+        if end == len(buffer) and not eof:
+            read_more()
+            continue
+
+        yield item
+        buffer = buffer[end:]
+
+        separator = next_char()
+        if separator == "]":
+            return
+        if separator != ",":
+            raise ValueError("Expected ',' or ']' in the JSON array")
+        buffer = buffer[1:]
+
+
+def remap_uuids(value: Any, mapping: Dict[str, str]) -> Any:
+    """
+    Replace the UUIDs in the (nested) strings of ``value`` in a single pass.
+    """
+    if isinstance(value, str):
+        return UUID_RE.sub(lambda match: mapping.get(match[0], match[0]), value)
+    if isinstance(value, list):
+        return [remap_uuids(item, mapping) for item in value]
+    if isinstance(value, dict):
+        return {key: remap_uuids(item, mapping) for key, item in value.items()}
+    return value
+
+
+def _get_uuid(url: str) -> str:
+    return url.rstrip("/").rsplit("/", 1)[-1]
+
+
+def _get_reference_fields(serializer: Serializer) -> Dict[str, HyperlinkedRelatedField]:
+    fields = {}
+    for name, field in serializer.fields.items():
+        if field.read_only:
+            continue
+        if isinstance(field, ManyRelatedField):
+            field = field.child_relation
+        if isinstance(field, HyperlinkedRelatedField):
+            fields[name] = field
+    return fields
+
+
+def _get_references(entry: dict, fields: Dict[str, HyperlinkedRelatedField]) -> Set:
+    references = set()
+    for name in fields:
+        value = entry.get(name)
+        values = value if isinstance(value, list) else [value]
+        references.update(url for url in values if url and isinstance(url, str))
+    return references
+
+
+def _prefetch_references(serializer: Serializer, entries: List[dict]) -> None:
+    """
+    Look up the objects referred to by the ``entries`` with one query per field.
+
+    The fields of the serializer resolve the URLs of the entries from the fetched
+    objects instead of querying them one by one.
+    """
+    for name, field in _get_reference_fields(serializer).items():
+        urls = set()
+        for entry in entries:
+            urls |= _get_references(entry, {name: field})
+        lookups = [
+            value
+            for value in {_get_uuid(url) for url in urls}
+            if UUID_RE.fullmatch(value)
+        ]
+        queryset = field.get_queryset()
+        objects = {
+            str(getattr(obj, field.lookup_field)): obj
+            for obj in queryset.filter(**{f"{field.lookup_field}__in": lookups})
+        }
+        field.get_object = _make_get_object(objects, field, queryset.model)
+
+
+def _make_get_object(objects: dict, field: HyperlinkedRelatedField, model):
+    def get_object(view_name, view_args, view_kwargs):
+        try:
+            return objects[str(view_kwargs[field.lookup_url_kwarg])]
+        except KeyError:
+            raise model.DoesNotExist from None
+
+    return get_object
+
+
+class BulkWriter:
+    """
+    Insert the validated data of a serializer with ``bulk_create``.
+
+    Mirrors the nested writes of the catalogi serializers: gegevensgroepen, nested
+    objects of the same model, nested foreign keys and to-many relations.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.opts = model._meta
+        self.fields = {
+            name
+            for field in self.opts.concrete_fields
+            for name in (field.name, field.attname)
+        }
+
+    def build(self, data: dict) -> Tuple[models.Model, dict]:
+        instance = self.model()
+        related = {}
+        for name, value in data.items():
+            attr = getattr(self.model, name, None)
+            if isinstance(attr, GegevensGroepType):
+                setattr(instance, name, value)
+            elif isinstance(attr, ForwardManyToOneDescriptor) and isinstance(
+                value, dict
+            ):
+                related[name] = value
+            elif name in self.fields:
+                setattr(instance, name, value)
+            elif isinstance(value, dict):
+                # nested serializers of the same model
+                for key, item in value.items():
+                    setattr(instance, key, item)
+            else:
+                related[name] = value
+        return instance, related
+
+    def save(self, rows: List[Tuple[models.Model, dict]]) -> List[models.Model]:
+        instances = [instance for instance, _ in rows]
+
+        # nested objects referred to with a foreign key are created first
+        nested = defaultdict(list)
+        for instance, related in rows:
+            for name in list(related):
+                if isinstance(
+                    getattr(self.model, name, None), ForwardManyToOneDescriptor
+                ):
+                    related_model = self.opts.get_field(name).related_model
+                    nested[name].append((instance, related_model(**related.pop(name))))
+        for name, pairs in nested.items():
+            related_model = self.opts.get_field(name).related_model
+            related_model._default_manager.bulk_create([obj for _, obj in pairs])
+            for instance, obj in pairs:
+                setattr(instance, name, obj)
+
+        for instance in instances:
+            if hasattr(instance, "set_derived_fields"):
+                instance.set_derived_fields()
+
+        self.model._default_manager.bulk_create(instances)
+
+        to_many = defaultdict(list)
+        for instance, related in rows:
+            for name, value in related.items():
+                to_many[name].append((instance, value))
+        for name, values in to_many.items():
+            self._save_to_many(name, values)
+
+        return instances
+
+    def _save_to_many(self, name: str, values: List[Tuple[models.Model, list]]):
+        descriptor = getattr(self.model, name)
+
+        if isinstance(descriptor, ManyToManyDescriptor):
+            through = descriptor.through
+            if through._meta.auto_created:
+                field = descriptor.field
+                source, target = field.m2m_field_name(), field.m2m_reverse_field_name()
+                if descriptor.reverse:
+                    source, target = target, source
+                source = through._meta.get_field(source).attname
+                target = through._meta.get_field(target).attname
+                through._default_manager.bulk_create(
+                    [
+                        through(**{source: instance.pk, target: obj.pk})
+                        for instance, objs in values
+                        for obj in objs
+                    ]
+                )
+                return
+
+        elif isinstance(descriptor, ReverseManyToOneDescriptor) and all(
+            isinstance(item, dict) for _, items in values for item in items
+        ):
+            related_model = descriptor.rel.related_model
+            fk_name = descriptor.field.name
+            related_model._default_manager.bulk_create(
+                [
+                    related_model(**item, **{fk_name: instance})
+                    for instance, items in values
+                    for item in items
+                ]
+            )
+            return
+
+        for instance, objs in values:
+            getattr(instance, name).set(objs)
+
+
+class CatalogiImporter:
+    def __init__(
+        self, request, generate_new_uuids: bool = False, batch_size: int = BATCH_SIZE
+    ):
+        self.request = request
+        self.generate_new_uuids = generate_new_uuids
+        self.batch_size = batch_size
+        self.uuid_mapping: Dict[str, str] = {}
+        self.models: Set = set()
+
+    @transaction.atomic
+    def run(self, import_file) -> None:
+        with zipfile.ZipFile(import_file, "r") as zip_file:
+            names = zip_file.namelist()
+            for resource in IMPORT_ORDER:
+                if f"{resource}.json" not in names:
+                    continue
+                with zip_file.open(f"{resource}.json") as fp:
+                    self.import_resource(resource, iter_json_array(fp))
+
+        # ⚡️ the bulk created objects don't send signals, so the derived data is
+        # updated once for the complete import
+        if self.models & {ZaakType, InformatieObjectType, BesluitType}:
+            transaction.on_commit(AutorisatieSpec.sync)
+        if self.models:
+            bump_generation()
+
+    def import_resource(self, resource: str, entries: Iterator[dict]) -> None:
+        serializer_class = getattr(serializers, f"{resource}Serializer")
+        fields = _get_reference_fields(
+            serializer_class(context={"request": self.request})
+        )
+
+        batch: List[dict] = []
+        urls: Set[str] = set()
+        for entry in entries:
+            # an entry referring to an entry of the same batch is validated after
+            # that entry is saved
+            if len(batch) >= self.batch_size or urls & _get_references(entry, fields):
+                self.import_batch(resource, serializer_class, batch)
+                batch, urls = [], set()
+            batch.append(entry)
+            urls.add(entry["url"])
+
+        if batch:
+            self.import_batch(resource, serializer_class, batch)
+
+    def import_batch(
+        self, resource: str, serializer_class, entries: List[dict]
+    ) -> List[models.Model]:
+        if self.generate_new_uuids and self.uuid_mapping:
+            entries = [remap_uuids(entry, self.uuid_mapping) for entry in entries]
+
+        serializer = serializer_class(
+            data=entries, many=True, context={"request": self.request}
+        )
+        _prefetch_references(serializer.child, entries)
+        if not serializer.is_valid():
+            errors = next(error for error in serializer.errors if error)
+            raise CommandError(
+                _("A validation error occurred while deserializing a {}\n{}").format(
+                    resource, errors
+                )
+            )
+
+        writer = BulkWriter(serializer.child.Meta.model)
+        rows = []
+        for entry, data in zip(entries, serializer.validated_data):
+            original_uuid = _get_uuid(entry["url"])
+            data["uuid"] = uuid.uuid4() if self.generate_new_uuids else original_uuid
+            rows.append(writer.build(data))
+
+        try:
+            instances = writer.save(rows)
+        except IntegrityError as exc:
+            raise CommandError(
+                _("A validation error occurred while saving a {}\n{}").format(
+                    resource, exc
+                )
+            ) from exc
+
+        for entry, instance in zip(entries, instances):
+            self.uuid_mapping[_get_uuid(entry["url"])] = str(instance.uuid)
+        self._update_object_dates(instances)
+        self.models.add(writer.model)
+        return instances
+
+    def _update_object_dates(self, instances: List[models.Model]) -> None:
+        keys = {
+            instance.versions_key
+            for instance in instances
+            if hasattr(instance, "versions_key")
+        }
+        for key in keys:
+            type(instances[0])._default_manager.update_object_dates(*key)
+
+
+def import_catalogi(
+    import_file,
+    request,
+    generate_new_uuids: bool = False,
+    batch_size: Optional[int] = None,
+) -> None:
+    importer = CatalogiImporter(
+        request,
+        generate_new_uuids=generate_new_uuids,
+        batch_size=batch_size or BATCH_SIZE,
+    )
+    importer.run(import_file)
+
+
+class _ZipStream(io.RawIOBase):
+    """
+    Unseekable file-like object collecting the data written by ``zipfile``.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+        self.size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+    def pop(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        self.size = 0
+        return data
+
+
+def _iter_export_objects(
+    resource: str, ids: List[int], chunk_size: int
+) -> Iterator[models.Model]:
+    """
+    Yield the objects to export, fetched (and prefetched) per chunk of ids.
+
+    Every chunk is a query of its own instead of a server-side cursor, which is
+    closed when the transaction it was opened in ends - the archive is streamed
+    after the transaction of the admin view is committed.
+    """
+    # the prefetches of the API are the ones needed by the serializer
+    viewset = getattr(viewsets, f"{resource}ViewSet")
+    ids = sorted(set(ids))
+    for start in range(0, len(ids), chunk_size):
+        chunk = ids[start : start + chunk_size]
+        yield from viewset.queryset.filter(pk__in=chunk).order_by("pk")
+
+
+def iter_export(
+    resources: Iterable[Tuple[str, List[int]]],
+    request,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """
+    Yield the ZIP archive with a JSON file of the objects with ``ids`` for every
+    resource.
+    """
+    stream = _ZipStream()
+    with zipfile.ZipFile(stream, "w") as zip_file:
+        for resource, ids in resources:
+            serializer_class = getattr(serializers, f"{resource}Serializer")
+            # ⚡️ the prefetches are done per chunk
+            objects = _iter_export_objects(resource, ids, chunk_size)
+            first = next(objects, None)
+            if first is None:
+                continue
+
+            # the size is unknown up front
+            with zip_file.open(f"{resource}.json", "w", force_zip64=True) as fp:
+                fp.write(b"[")
+                for index, obj in enumerate(chain([first], objects)):
+                    data = serializer_class(obj, context={"request": request}).data
+
+                    # Because BesluitType is imported before ZaakType, related
+                    # ZaakTypen do not exist yet at the time of importing, so the
+                    # relations will be left empty when importing BesluitTypen and
+                    # they will be set when importing ZaakTypen
+                    if resource == "BesluitType":
+                        data["zaaktypen"] = []
+
+                    if index:
+                        fp.write(b", ")
+                    fp.write(json.dumps(data).encode())
+                    if stream.size >= CHUNK_SIZE:
+                        yield stream.pop()
+                fp.write(b"]")
+
+    yield stream.pop()
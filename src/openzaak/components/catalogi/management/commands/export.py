@@ -1,12 +1,7 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
-import io
-import json
-import zipfile
-
-from django.apps import apps
 from django.core.management.base import BaseCommand, CommandError
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework.request import Request
@@ -14,7 +9,7 @@ from rest_framework.versioning import URLPathVersioning
 
 from openzaak.utils import build_fake_request
 
-from ...api import serializers
+from ...import_export import EXPORT_CHUNK_SIZE, iter_export
 
 
 class Command(BaseCommand):
@@ -42,6 +37,12 @@ class Command(BaseCommand):
             nargs="*",
             type=int,
         )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=EXPORT_CHUNK_SIZE,
+            help=_("The number of objects to fetch from the database at once"),
+        )
 
     def handle(self, *args, **options):
         archive_name = options.pop("archive_name")
@@ -64,36 +65,16 @@ class Command(BaseCommand):
         setattr(request, "versioning_scheme", URLPathVersioning())
         setattr(request, "version", "1")
 
-        results = []
-
-        for resource, ids in zip(all_resources, all_ids):
-            model = apps.get_model("catalogi", resource)
-            serializer = getattr(serializers, f"{resource}Serializer")
-            objects = model.objects.filter(id__in=ids)
-
-            serialized = serializer(
-                instance=objects, many=True, context={"request": request}
-            )
-            data = serialized.data
-
-            # Because BesluitType is imported before ZaakType, related
-            # ZaakTypen do not exist yet at the time of importing, so the
-            # relations will be left empty when importing BesluitTypen and
-            # they will be set when importing ZaakTypen
-            if resource == "BesluitType":
-                for entry in data:
-                    entry["zaaktypen"] = []
-
-            if data:
-                results.append((resource, data))
+        chunks = iter_export(
+            zip(all_resources, all_ids), request, chunk_size=options["chunk_size"]
+        )
 
-        if response:
-            f = io.BytesIO()
-            for resource, data in results:
-                with zipfile.ZipFile(f, "a") as zip_file:
-                    zip_file.writestr(f"{resource}.json", json.dumps(data))
-            response.content = f.getvalue()
+        # the archive is generated while the response is sent
+        if isinstance(response, StreamingHttpResponse):
+            response.streaming_content = chunks
+        elif response:
+            response.content = b"".join(chunks)
         else:
-            for resource, data in results:
-                with zipfile.ZipFile(archive_name, "a") as zip_file:
-                    zip_file.writestr(f"{resource}.json", json.dumps(data))
+            with open(archive_name, "wb") as archive:
+                for chunk in chunks:
+                    archive.write(chunk)
@@ -1,8 +1,6 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
 import io
-import json
-import zipfile
 
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
@@ -11,10 +9,10 @@ from django.utils.translation import gettext_lazy as _
 from rest_framework.test import APIRequestFactory
 from rest_framework.versioning import URLPathVersioning
 
-from openzaak.components.catalogi.api import serializers
-from openzaak.components.catalogi.constants import IMPORT_ORDER
 from openzaak.utils.cache import DjangoRequestsCache, requests_cache_enabled
 
+from ...import_export import BATCH_SIZE, import_catalogi
+
 
 class Command(BaseCommand):
     help = "Import Catalogi data from a .zip file"
@@ -37,6 +35,12 @@ class Command(BaseCommand):
                 "Indicates whether new UUIDs should be generated for the import data"
             ),
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BATCH_SIZE,
+            help=_("The number of objects to validate and insert at once"),
+        )
 
     @requests_cache_enabled("import", backend=DjangoRequestsCache())
     @transaction.atomic
@@ -55,43 +59,14 @@ class Command(BaseCommand):
         if import_file_content:
             import_file = io.BytesIO(import_file_content)
 
-        uuid_mapping = {}
-
         factory = APIRequestFactory()
         request = factory.get("/")
         setattr(request, "versioning_scheme", URLPathVersioning())
         setattr(request, "version", "1")
 
-        with zipfile.ZipFile(import_file, "r") as zip_file:
-            for resource in IMPORT_ORDER:
-                if f"{resource}.json" in zip_file.namelist():
-                    data = zip_file.read(f"{resource}.json").decode()
-
-                    if generate_new_uuids:
-                        for old, new in uuid_mapping.items():
-                            data = data.replace(old, new)
-
-                    data = json.loads(data)
-
-                    serializer = getattr(serializers, f"{resource}Serializer")
-
-                    for entry in data:
-                        deserialized = serializer(
-                            data=entry, context={"request": request}
-                        )
-
-                        if deserialized.is_valid():
-                            original_uuid = entry["url"].split("/")[-1]
-                            if generate_new_uuids:
-                                deserialized.save()
-                                uuid_mapping[entry["url"].split("/")[-1]] = str(
-                                    deserialized.instance.uuid
-                                )
-                            else:
-                                deserialized.save(uuid=original_uuid)
-                        else:
-                            raise CommandError(
-                                _(
-                                    "A validation error occurred while deserializing a {}\n{}"
-                                ).format(resource, deserialized.errors)
-                            )
+        import_catalogi(
+            import_file,
+            request,
+            generate_new_uuids=generate_new_uuids,
+            batch_size=options["batch_size"],
+        )
@@ -0,0 +1,106 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+# Generated by Django 4.2.15 on 2024-10-07 13:02
+
+from django.db import migrations, models
+
+MODELS = (
+    ("ZaakType", "identificatie"),
+    ("InformatieObjectType", "omschrijving"),
+    ("BesluitType", "omschrijving"),
+)
+
+
+def fill_object_dates(apps, _):
+    for model_name, id_field in MODELS:
+        model = apps.get_model("catalogi", model_name)
+        versions = model.objects.filter(
+            catalogus=models.OuterRef("catalogus"),
+            **{id_field: models.OuterRef(id_field)},
+        )
+        model.objects.update(
+            datum_begin_object=models.Subquery(
+                versions.order_by("datum_begin_geldigheid").values(
+                    "datum_begin_geldigheid"
+                )[:1]
+            ),
+            datum_einde_object=models.Subquery(
+                versions.order_by("-datum_begin_geldigheid").values(
+                    "datum_einde_geldigheid"
+                )[:1]
+            ),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            "catalogi",
+            "0023_alter_resultaattype_brondatum_archiefprocedure_datumkenmerk",
+        ),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="besluittype",
+            name="datum_begin_object",
+            field=models.DateField(
+                editable=False,
+                help_text="De datum begin geldigheid van de eerste versie.",
+                null=True,
+                verbose_name="datum begin object",
+            ),
+        ),
+        migrations.AddField(
+            model_name="besluittype",
+            name="datum_einde_object",
+            field=models.DateField(
+                editable=False,
+                help_text="De datum einde geldigheid van de laatste versie.",
+                null=True,
+                verbose_name="datum einde object",
+            ),
+        ),
+        migrations.AddField(
+            model_name="informatieobjecttype",
+            name="datum_begin_object",
+            field=models.DateField(
+                editable=False,
+                help_text="De datum begin geldigheid van de eerste versie.",
+                null=True,
+                verbose_name="datum begin object",
+            ),
+        ),
+        migrations.AddField(
+            model_name="informatieobjecttype",
+            name="datum_einde_object",
+            field=models.DateField(
+                editable=False,
+                help_text="De datum einde geldigheid van de laatste versie.",
+                null=True,
+                verbose_name="datum einde object",
+            ),
+        ),
+        migrations.AddField(
+            model_name="zaaktype",
+            name="datum_begin_object",
+            field=models.DateField(
+                editable=False,
+                help_text="De datum begin geldigheid van de eerste versie.",
+                null=True,
+                verbose_name="datum begin object",
+            ),
+        ),
+        migrations.AddField(
+            model_name="zaaktype",
+            name="datum_einde_object",
+            field=models.DateField(
+                editable=False,
+                help_text="De datum einde geldigheid van de laatste versie.",
+                null=True,
+                verbose_name="datum einde object",
+            ),
+        ),
+        migrations.RunPython(fill_object_dates, migrations.RunPython.noop),
+    ]
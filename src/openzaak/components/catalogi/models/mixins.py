@@ -19,6 +19,20 @@ class GeldigheidMixin(models.Model):
         null=True,
         help_text=_("De datum waarop het is opgeheven."),
     )
+    # ⚡️ maintained for all versions by the catalogi signals, rather than derived
+    # from the other versions for every row that is read
+    datum_begin_object = models.DateField(
+        _("datum begin object"),
+        null=True,
+        editable=False,
+        help_text=_("De datum begin geldigheid van de eerste versie."),
+    )
+    datum_einde_object = models.DateField(
+        _("datum einde object"),
+        null=True,
+        editable=False,
+        help_text=_("De datum einde geldigheid van de laatste versie."),
+    )
 
     omschrijving_field = "omschrijving"
 
@@ -66,7 +80,19 @@ class GeldigheidMixin(models.Model):
 
     @property
     def _has_overlap(self):
-        from openzaak.components.catalogi.utils import has_overlapping_objects
+        from openzaak.components.catalogi.utils import (
+            has_overlapping_objects,
+            is_overlapping,
+        )
+
+        # ⚡️ the published versions fetched in bulk by ``publish_concepts``
+        versions = getattr(self, "_published_versions", None)
+        if versions is not None:
+            return not getattr(self, "concept", None) and any(
+                is_overlapping(self, version)
+                for version in versions
+                if version.pk != self.pk
+            )
 
         try:
             catalogus = self.catalogus
@@ -114,37 +140,33 @@ class GeldigheidMixin(models.Model):
                     )
                 )
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # remember the versions the object belonged to, to update them after changes
+        if cls.omschrijving_field in field_names and "catalogus_id" in field_names:
+            instance._loaded_versions_key = instance.versions_key
+        return instance
+
+    @property
+    def versions_key(self) -> tuple:
+        return (self.catalogus_id, getattr(self, self.omschrijving_field))
+
     @property
     def begin_object(self) -> date:
-        # annotated in the queryset
-        if hasattr(self, "datum_begin_object"):
+        if self.datum_begin_object is not None:
             return self.datum_begin_object
 
-        # for inclusions we don't have annotated queryset
-        return (
-            self._meta.default_manager.filter(
-                **{self.omschrijving_field: getattr(self, self.omschrijving_field)}
-            )
-            .order_by("datum_begin_geldigheid")
-            .first()
-            .datum_begin_geldigheid
-        )
+        # not saved yet
+        return self.datum_begin_geldigheid
 
     @property
     def einde_object(self) -> Optional[date]:
-        # annotated in the queryset
-        if hasattr(self, "datum_einde_object"):
+        if self.datum_begin_object is not None:
             return self.datum_einde_object
 
-        # for inclusions we don't have annotated queryset
-        return (
-            self._meta.default_manager.filter(
-                **{self.omschrijving_field: getattr(self, self.omschrijving_field)}
-            )
-            .order_by("-datum_begin_geldigheid")
-            .first()
-            .datum_einde_geldigheid
-        )
+        # not saved yet
+        return self.datum_einde_geldigheid
 
 
 class OptionalGeldigheidMixin(models.Model):
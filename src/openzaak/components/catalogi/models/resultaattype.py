@@ -286,6 +286,10 @@ class ResultaatType(ETagMixin, OptionalGeldigheidMixin, models.Model):
         verbose_name_plural = _("resultaattypen")
 
     def save(self, *args, **kwargs):
+        self.set_derived_fields()
+        super().save(*args, **kwargs)
+
+    def set_derived_fields(self) -> None:
         """
         Save some derived fields into local object as a means of caching.
         """
@@ -319,8 +323,6 @@ class ResultaatType(ETagMixin, OptionalGeldigheidMixin, models.Model):
                 Afleidingswijze.afgehandeld
             )
 
-        super().save(*args, **kwargs)
-
     def clean(self):
         super().clean()
 
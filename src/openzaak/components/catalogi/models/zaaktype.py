@@ -354,6 +354,10 @@ class ZaakType(ETagMixin, APIMixin, ConceptMixin, GeldigheidMixin, models.Model)
         if not self.pk:
             transaction.on_commit(AutorisatieSpec.sync)
 
+        self.set_derived_fields()
+        super().save(*args, **kwargs)
+
+    def set_derived_fields(self) -> None:
         if self.selectielijst_procestype and not self.selectielijst_procestype_jaar:
             client = Service.get_client(self.selectielijst_procestype)
             response = client.retrieve(
@@ -371,8 +375,6 @@ class ZaakType(ETagMixin, APIMixin, ConceptMixin, GeldigheidMixin, models.Model)
                 "'verlengingstermijn' must be set if 'verlenging_mogelijk' is set."
             )
 
-        super().save(*args, **kwargs)
-
     def clean(self):
         from ..utils import compare_relativedeltas
 
@@ -1,26 +1,39 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2023 Dimpact
+from datetime import date
+from typing import Optional, Tuple
+
 from django.db import models
 
 
 class GeldigheidQuerySet(models.QuerySet):
     def with_dates(self, id_field="omschrijving"):
         """
-        annotate queryset with begin_object and einde_object
+        Kept for backwards compatibility, ``datum_begin_object`` and
+        ``datum_einde_object`` are stored with every version.
+        """
+        return self
+
+    def update_object_dates(
+        self, catalogus_id: int, identifier: str
+    ) -> Tuple[Optional[date], Optional[date]]:
         """
-        qs = self.filter(
-            catalogus=models.OuterRef("catalogus"),
-            **{id_field: models.OuterRef(id_field)}
+        Store the first begin and the last end of the versions of an object with
+        every version.
+        """
+        versions = self.filter(
+            catalogus_id=catalogus_id,
+            **{self.model.omschrijving_field: identifier},
         )
-        return self.annotate(
-            datum_begin_object=models.Subquery(
-                qs.order_by("datum_begin_geldigheid").values("datum_begin_geldigheid")[
-                    :1
-                ]
-            ),
-            datum_einde_object=models.Subquery(
-                qs.order_by("-datum_begin_geldigheid").values("datum_einde_geldigheid")[
-                    :1
-                ]
-            ),
+        last_version = (
+            versions.order_by("-datum_begin_geldigheid")
+            .values("datum_einde_geldigheid")
+            .first()
         )
+        if last_version is None:
+            return None, None
+
+        begin = versions.aggregate(begin=models.Min("datum_begin_geldigheid"))["begin"]
+        einde = last_version["datum_einde_geldigheid"]
+        versions.update(datum_begin_object=begin, datum_einde_object=einde)
+        return begin, einde
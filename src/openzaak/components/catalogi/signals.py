@@ -4,7 +4,7 @@ import logging
 from typing import Union
 
 from django.db.models.base import ModelBase
-from django.db.models.signals import ModelSignal, post_delete
+from django.db.models.signals import ModelSignal, post_delete, post_save
 from django.dispatch import receiver
 
 from vng_api_common.authorizations.models import Applicatie, Autorisatie
@@ -12,6 +12,7 @@ from vng_api_common.authorizations.models import Applicatie, Autorisatie
 from openzaak.utils import build_absolute_url
 
 from .models import BesluitType, InformatieObjectType, ZaakType
+from .snapshot import RECORDS, bump_generation
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +40,7 @@ def sync_autorisaties(
     sender: ModelBase,
     signal: ModelSignal,
     instance: Union[ZaakType, InformatieObjectType, BesluitType],
-    **kwargs
+    **kwargs,
 ) -> None:
     logger.debug("Received signal %r, from sender %r", signal, sender)
 
@@ -73,3 +74,65 @@ def sync_autorisaties(
     )
     logger.info("Deleting applications: %s", apps_to_delete)
     apps_to_delete.delete()
+
+
+def bump_catalogi_generation(sender: ModelBase, **kwargs) -> None:
+    bump_generation()
+
+
+for model in RECORDS:
+    for signal in (post_save, post_delete):
+        signal.connect(
+            bump_catalogi_generation,
+            sender=model,
+            dispatch_uid=f"catalogi.bump_generation_{model._meta.model_name}",
+        )
+
+
+@receiver(
+    post_save, sender=ZaakType, dispatch_uid="catalogi.update_object_dates_zaaktype"
+)
+@receiver(
+    post_save,
+    sender=InformatieObjectType,
+    dispatch_uid="catalogi.update_object_dates_informatieobjecttype",
+)
+@receiver(
+    post_save,
+    sender=BesluitType,
+    dispatch_uid="catalogi.update_object_dates_besluittype",
+)
+@receiver(
+    post_delete,
+    sender=ZaakType,
+    dispatch_uid="catalogi.update_object_dates_zaaktype_delete",
+)
+@receiver(
+    post_delete,
+    sender=InformatieObjectType,
+    dispatch_uid="catalogi.update_object_dates_informatieobjecttype_delete",
+)
+@receiver(
+    post_delete,
+    sender=BesluitType,
+    dispatch_uid="catalogi.update_object_dates_besluittype_delete",
+)
+def update_object_dates(
+    sender: ModelBase,
+    instance: Union[ZaakType, InformatieObjectType, BesluitType],
+    **kwargs,
+) -> None:
+    """
+    Update the dates of the first and last version stored with every version.
+    """
+    manager = sender._default_manager
+    key = instance.versions_key
+    loaded_key = getattr(instance, "_loaded_versions_key", key)
+    if loaded_key != key:
+        manager.update_object_dates(*loaded_key)
+
+    begin, einde = manager.update_object_dates(*key)
+    if begin is not None:
+        instance.datum_begin_object = begin
+        instance.datum_einde_object = einde
+    instance._loaded_versions_key = key
@@ -0,0 +1,304 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+"""
+Versioned, per-process snapshot of the catalogi.
+
+The catalogi are read on almost every zaken and documenten request, but change only
+a few times per week. Every process keeps an immutable snapshot of the types in
+memory, keyed by a global generation stored in the (shared) default cache. Any
+change to the catalogi bumps the generation, after which every process reloads its
+snapshot on the next read.
+
+Code changing the catalogi without signals (``QuerySet.update``, ``bulk_create``)
+must call :func:`bump_generation` itself.
+"""
+import logging
+import threading
+import uuid
+from typing import Dict, Iterable, Optional, Tuple, Type
+from urllib.parse import urlparse
+
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import Max
+from django.urls import reverse
+
+from .models import (
+    BesluitType,
+    Eigenschap,
+    InformatieObjectType,
+    ResultaatType,
+    RolType,
+    StatusType,
+    ZaakType,
+)
+
+logger = logging.getLogger(__name__)
+
+GENERATION_CACHE_KEY = "catalogi:generation"
+
+_URL_PLACEHOLDER = "00000000-0000-0000-0000-000000000000"
+
+
+class Record:
+    """
+    Immutable, slotted copy of the fields of a catalogi object that are read on the
+    hot path.
+    """
+
+    __slots__ = ("pk", "uuid", "path")
+    fields: Tuple[str, ...] = ()
+
+    def __init__(self, **values):
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self):
+        return f"<{type(self).__name__}: {self.pk}>"
+
+
+class ZaakTypeRecord(Record):
+    __slots__ = (
+        "identificatie",
+        "concept",
+        "catalogus_id",
+        "datum_begin_geldigheid",
+        "datum_einde_geldigheid",
+        "eindstatustype_id",
+    )
+    fields = __slots__[:-1]
+
+
+class StatusTypeRecord(Record):
+    __slots__ = (
+        "zaaktype_id",
+        "statustypevolgnummer",
+        "statustype_omschrijving",
+        "is_eindstatus",
+    )
+    fields = __slots__[:-1]
+
+
+class ResultaatTypeRecord(Record):
+    __slots__ = (
+        "zaaktype_id",
+        "omschrijving",
+        "archiefnominatie",
+        "archiefactietermijn",
+        "brondatum_archiefprocedure",
+    )
+    fields = (
+        "zaaktype_id",
+        "omschrijving",
+        "archiefnominatie",
+        "archiefactietermijn",
+        "brondatum_archiefprocedure_afleidingswijze",
+        "brondatum_archiefprocedure_datumkenmerk",
+        "brondatum_archiefprocedure_einddatum_bekend",
+        "brondatum_archiefprocedure_objecttype",
+        "brondatum_archiefprocedure_registratie",
+        "brondatum_archiefprocedure_procestermijn",
+    )
+
+
+class RolTypeRecord(Record):
+    __slots__ = ("zaaktype_id", "omschrijving", "omschrijving_generiek")
+    fields = __slots__
+
+
+class EigenschapRecord(Record):
+    __slots__ = ("zaaktype_id", "eigenschapnaam")
+    fields = __slots__
+
+
+class InformatieObjectTypeRecord(Record):
+    __slots__ = (
+        "catalogus_id",
+        "omschrijving",
+        "concept",
+        "vertrouwelijkheidaanduiding",
+    )
+    fields = __slots__
+
+
+class BesluitTypeRecord(Record):
+    __slots__ = ("catalogus_id", "omschrijving", "concept")
+    fields = __slots__
+
+
+RECORDS: Dict[Type[models.Model], Type[Record]] = {
+    ZaakType: ZaakTypeRecord,
+    StatusType: StatusTypeRecord,
+    ResultaatType: ResultaatTypeRecord,
+    RolType: RolTypeRecord,
+    Eigenschap: EigenschapRecord,
+    InformatieObjectType: InformatieObjectTypeRecord,
+    BesluitType: BesluitTypeRecord,
+}
+
+
+def _get_path_template(model: Type[models.Model]) -> str:
+    path = reverse(
+        f"{model._meta.model_name}-detail",
+        kwargs={"version": "1", "uuid": _URL_PLACEHOLDER},
+    )
+    return path.replace(_URL_PLACEHOLDER, "{uuid}")
+
+
+def _load_values(model: Type[models.Model]) -> Iterable[dict]:
+    record_class = RECORDS[model]
+    values = model.objects.order_by().values("pk", "uuid", *record_class.fields)
+    if model is ResultaatType:
+        for row in values:
+            prefix = "brondatum_archiefprocedure_"
+            row["brondatum_archiefprocedure"] = {
+                name[len(prefix) :]: row.pop(name)
+                for name in list(row)
+                if name.startswith(prefix)
+            }
+            yield row
+    else:
+        yield from values
+
+
+class CatalogiSnapshot:
+    """
+    The catalogi types of a single generation, indexed by pk and by API path.
+    """
+
+    def __init__(self, generation: str):
+        self.generation = generation
+        self._by_pk: Dict[Type[models.Model], Dict[int, Record]] = {}
+        self._by_path: Dict[str, Record] = {}
+
+        eindstatustypen = dict(
+            StatusType.objects.order_by()
+            .values("zaaktype_id")
+            .annotate(volgnummer=Max("statustypevolgnummer"))
+            .values_list("zaaktype_id", "volgnummer")
+        )
+        eindstatustype_ids = {}
+
+        for model, record_class in RECORDS.items():
+            if model is ZaakType:
+                continue
+            self._load(model, record_class, eindstatustypen, eindstatustype_ids)
+        self._load(ZaakType, ZaakTypeRecord, eindstatustypen, eindstatustype_ids)
+
+    def _load(self, model, record_class, eindstatustypen, eindstatustype_ids):
+        path_template = _get_path_template(model)
+        records = self._by_pk[model] = {}
+        for row in _load_values(model):
+            row["path"] = path_template.format(uuid=row["uuid"])
+            if model is StatusType:
+                row["is_eindstatus"] = (
+                    eindstatustypen.get(row["zaaktype_id"])
+                    == row["statustypevolgnummer"]
+                )
+                if row["is_eindstatus"]:
+                    eindstatustype_ids[row["zaaktype_id"]] = row["pk"]
+            elif model is ZaakType:
+                row["eindstatustype_id"] = eindstatustype_ids.get(row["pk"])
+
+            record = record_class(**row)
+            records[record.pk] = record
+            self._by_path[record.path] = record
+
+    def get(self, model: Type[models.Model], pk: int) -> Optional[Record]:
+        return self._by_pk[model].get(pk)
+
+    def get_by_url(self, url: str) -> Optional[Record]:
+        return self._by_path.get(urlparse(url).path)
+
+
+_lock = threading.Lock()
+_snapshot: Optional[CatalogiSnapshot] = None
+# the on-commit callback of the uncommitted changes to the catalogi of the thread
+_pending = threading.local()
+
+
+def _has_pending_changes() -> bool:
+    """
+    Check if the current transaction has uncommitted changes to the catalogi.
+
+    The callback is removed from the connection when the transaction is committed
+    or rolled back, and when the savepoint it was registered in is rolled back.
+    """
+    callback = getattr(_pending, "callback", None)
+    if callback is None:
+        return False
+    connection = transaction.get_connection()
+    if connection.in_atomic_block and any(
+        entry[1] is callback for entry in connection.run_on_commit
+    ):
+        return True
+    _pending.callback = None
+    return False
+
+
+def get_generation() -> Optional[str]:
+    return cache.get_or_set(GENERATION_CACHE_KEY, lambda: uuid.uuid4().hex, None)
+
+
+def bump_generation() -> None:
+    """
+    Invalidate the catalogi snapshots of all processes.
+
+    The generation is bumped again after the commit, so no process keeps a snapshot
+    loaded before the changes were visible.
+    """
+    cache.set(GENERATION_CACHE_KEY, uuid.uuid4().hex, None)
+    if _has_pending_changes():
+        return
+
+    def bump_after_commit():
+        cache.set(GENERATION_CACHE_KEY, uuid.uuid4().hex, None)
+
+    transaction.on_commit(bump_after_commit)
+    if transaction.get_connection().in_atomic_block:
+        _pending.callback = bump_after_commit
+
+
+def get_snapshot() -> Optional[CatalogiSnapshot]:
+    """
+    Return the snapshot of the current generation of the catalogi.
+
+    Returns ``None`` if the generation is unknown (the cache is unavailable), in
+    which case the caller should read from the database.
+    """
+    global _snapshot
+
+    generation = get_generation()
+    if generation is None:
+        return None
+
+    # uncommitted changes are only visible to this transaction, and might still be
+    # rolled back
+    if _has_pending_changes():
+        return CatalogiSnapshot(generation)
+
+    snapshot = _snapshot
+    if snapshot is None or snapshot.generation != generation:
+        with _lock:
+            if _snapshot is None or _snapshot.generation != generation:
+                logger.debug(
+                    "Loading the catalogi snapshot of generation %s", generation
+                )
+                _snapshot = CatalogiSnapshot(generation)
+            snapshot = _snapshot
+    return snapshot
+
+
+def get_record(model: Type[models.Model], pk: Optional[int]) -> Optional[Record]:
+    """
+    Return the snapshot record of a local catalogi object.
+    """
+    if pk is None or model not in RECORDS:
+        return None
+    snapshot = get_snapshot()
+    if snapshot is None:
+        return None
+    return snapshot.get(model, pk)
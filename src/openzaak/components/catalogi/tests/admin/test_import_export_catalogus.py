@@ -1,6 +1,8 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
 import io
+import json
+import zipfile
 from unittest.mock import patch
 
 from django.contrib.auth.models import Permission
@@ -10,7 +12,7 @@ from django.urls import reverse
 from django.utils.translation import gettext as _
 
 import requests_mock
-from django_webtest import WebTest
+from django_webtest import TransactionWebTest, WebTest
 from maykin_2fa.test import disable_admin_mfa
 from zgw_consumers.constants import APITypes, AuthTypes
 from zgw_consumers.models import Service
@@ -388,6 +390,72 @@ class CatalogusAdminImportExportTests(MockSelectielijst, WebTest):
         export_button = response.html.find("input", {"name": "_export"})
         self.assertIsNone(export_button)
 
+    def test_export_fails(self, *mocks):
+        catalogus = CatalogusFactory.create(rsin="000000000", domein="TEST")
+        url = reverse("admin:catalogi_catalogus_change", args=(catalogus.pk,))
+        form = self.app.get(url).forms["catalogus_form"]
+
+        def iter_export(*args, **kwargs):
+            raise Exception("export failed")
+            yield b""
+
+        with patch(
+            "openzaak.components.catalogi.management.commands.export.iter_export",
+            side_effect=iter_export,
+        ):
+            response = form.submit("_export")
+
+        self.assertRedirects(response, url, fetch_redirect_response=False)
+        messages = [str(message) for message in response.follow().context["messages"]]
+        self.assertEqual(
+            messages, [_("{} {} could not be exported").format("Catalogus", catalogus)]
+        )
+
+    def test_export_fails_while_streaming(self, *mocks):
+        catalogus = CatalogusFactory.create(rsin="000000000", domein="TEST")
+        url = reverse("admin:catalogi_catalogus_change", args=(catalogus.pk,))
+        form = self.app.get(url).forms["catalogus_form"]
+
+        def iter_export(*args, **kwargs):
+            yield b"PK"
+            raise Exception("export failed")
+
+        # the download is aborted instead of ending with an incomplete archive
+        with patch(
+            "openzaak.components.catalogi.management.commands.export.iter_export",
+            side_effect=iter_export,
+        ):
+            with self.assertRaisesMessage(Exception, "export failed"):
+                form.submit("_export")
+
+
+@disable_admin_mfa()
+class CatalogusAdminExportTransactionTests(TransactionWebTest):
+    """
+    The archive is streamed after the transaction of the admin view is committed.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.app.set_user(SuperUserFactory.create())
+
+    @patch(
+        "openzaak.components.catalogi.management.commands.export.EXPORT_CHUNK_SIZE", 2
+    )
+    def test_export_more_objects_than_chunk_size(self):
+        catalogus = CatalogusFactory.create(rsin="000000000", domein="TEST")
+        InformatieObjectTypeFactory.create_batch(5, catalogus=catalogus)
+        url = reverse("admin:catalogi_catalogus_change", args=(catalogus.pk,))
+        form = self.app.get(url).forms["catalogus_form"]
+
+        response = form.submit("_export")
+
+        with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+            informatieobjecttypen = json.loads(
+                archive.read("InformatieObjectType.json")
+            )
+        self.assertEqual(len(informatieobjecttypen), 5)
+
 
 @tag("readonly-user")
 @disable_admin_mfa()
@@ -1,6 +1,8 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
+import io
 import json
+import uuid
 import zipfile
 from pathlib import Path
 from unittest.mock import patch
@@ -8,7 +10,8 @@ from unittest.mock import patch
 from django.contrib.sites.models import Site
 from django.core.management import call_command
 from django.core.management.base import CommandError
-from django.test import TestCase, override_settings, tag
+from django.http import StreamingHttpResponse
+from django.test import SimpleTestCase, TestCase, override_settings, tag
 
 import requests_cache
 import requests_mock
@@ -18,6 +21,7 @@ from zgw_consumers.models import Service
 from openzaak.selectielijst.tests import mock_resource_get, mock_selectielijst_oas_get
 from openzaak.tests.utils import patch_resource_validator
 
+from ...import_export import iter_json_array, remap_uuids
 from ...models import (
     BesluitType,
     Catalogus,
@@ -97,6 +101,28 @@ class ExportCatalogiTests(ImportExportMixin, TestCase):
                 catalogus.contactpersoon_beheer_emailadres,
             )
 
+    def test_export_to_streaming_response(self):
+        catalogus = CatalogusFactory.create()
+        zaaktypen = ZaakTypeFactory.create_batch(3, catalogus=catalogus)
+        response = StreamingHttpResponse(content_type="application/zip")
+
+        call_command(
+            "export",
+            response=response,
+            resource=["Catalogus", "ZaakType", "StatusType"],
+            ids=[[catalogus.id], [zaaktype.id for zaaktype in zaaktypen], []],
+            chunk_size=2,
+        )
+
+        content = b"".join(response.streaming_content)
+        with zipfile.ZipFile(io.BytesIO(content), "r") as f:
+            self.assertEqual(f.namelist(), ["Catalogus.json", "ZaakType.json"])
+            data = json.loads(f.read("ZaakType.json"))
+            self.assertEqual(
+                [entry["identificatie"] for entry in data],
+                [zaaktype.identificatie for zaaktype in zaaktypen],
+            )
+
     def test_export_catalogus_with_relations(self):
         catalogus = CatalogusFactory.create(rsin="000000000")
         zaaktype = ZaakTypeFactory.create(
@@ -528,6 +554,50 @@ class ImportCatalogiTests(ImportExportMixin, TestCase):
             resultaattypeomschrijving_request.url, resultaattypeomschrijving
         )
 
+    def test_import_in_batches(self):
+        catalogus = CatalogusFactory.create(rsin="000000000")
+        zaaktypen = ZaakTypeFactory.create_batch(
+            3, catalogus=catalogus, vertrouwelijkheidaanduiding="openbaar"
+        )
+        statustypen = [
+            StatusTypeFactory.create(zaaktype=zaaktype, statustypevolgnummer=volgnummer)
+            for zaaktype in zaaktypen
+            for volgnummer in (1, 2)
+        ]
+        call_command(
+            "export",
+            archive_name=self.filepath,
+            resource=["Catalogus", "ZaakType", "StatusType"],
+            ids=[
+                [catalogus.id],
+                [zaaktype.id for zaaktype in zaaktypen],
+                [statustype.id for statustype in statustypen],
+            ],
+        )
+        catalogus.delete()
+
+        call_command(
+            "import",
+            import_file=self.filepath,
+            generate_new_uuids=True,
+            batch_size=2,
+        )
+
+        imported_catalogus = Catalogus.objects.get()
+        self.assertEqual(
+            ZaakType.objects.filter(catalogus=imported_catalogus).count(), 3
+        )
+        for zaaktype in ZaakType.objects.all():
+            self.assertEqual(
+                sorted(
+                    zaaktype.statustypen.values_list("statustypevolgnummer", flat=True)
+                ),
+                [1, 2],
+            )
+            self.assertEqual(
+                zaaktype.datum_begin_object, zaaktype.datum_begin_geldigheid
+            )
+
     @patch(
         "openzaak.utils.cache.uninstall_cache",
         side_effect=requests_cache.uninstall_cache,
@@ -542,3 +612,32 @@ class ImportCatalogiTests(ImportExportMixin, TestCase):
 
         # Cache should be uninstalled despite errors during import
         self.assertTrue(uninstall_cache_mock.called)
+
+
+class IterJsonArrayTests(SimpleTestCase):
+    def test_items_are_read_in_chunks(self):
+        data = [
+            {"url": f"http://testserver/{i}", "values": [i, 1.5, None]}
+            for i in range(50)
+        ]
+        content = json.dumps(data, indent=2).encode()
+
+        for chunk_size in (1, 7, 1024):
+            with self.subTest(chunk_size=chunk_size):
+                items = list(iter_json_array(io.BytesIO(content), chunk_size))
+
+                self.assertEqual(items, data)
+
+    def test_empty_array(self):
+        self.assertEqual(list(iter_json_array(io.BytesIO(b" [ ] "))), [])
+
+    def test_remap_uuids(self):
+        old, new = str(uuid.uuid4()), str(uuid.uuid4())
+        entry = {"url": f"http://testserver/{old}", "zaaktypen": [f"/{old}"], "n": 1}
+
+        remapped = remap_uuids(entry, {old: new})
+
+        self.assertEqual(
+            remapped,
+            {"url": f"http://testserver/{new}", "zaaktypen": [f"/{new}"], "n": 1},
+        )
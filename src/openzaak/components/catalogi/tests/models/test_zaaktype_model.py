@@ -56,3 +56,39 @@ class ZaakTypeDatesTests(TestCase):
             with self.subTest(zaaktype.pk):
                 self.assertEqual(zaaktype.begin_object, date(2021, 10, 1))
                 self.assertEqual(zaaktype.einde_object, date(2021, 12, 11))
+
+    def test_dates_are_updated_with_versions(self):
+        catalogus = CatalogusFactory.create()
+        first = ZaakTypeFactory.create(
+            catalogus=catalogus,
+            identificatie="ZAAK1",
+            datum_begin_geldigheid=date(2020, 1, 1),
+            datum_einde_geldigheid=date(2020, 2, 1),
+        )
+        second = ZaakTypeFactory.create(
+            catalogus=catalogus,
+            identificatie="ZAAK1",
+            datum_begin_geldigheid=date(2020, 2, 1),
+            datum_einde_geldigheid=date(2020, 3, 1),
+        )
+
+        # the saved instance is updated as well
+        self.assertEqual(second.begin_object, date(2020, 1, 1))
+        first.refresh_from_db()
+        self.assertEqual(first.einde_object, date(2020, 3, 1))
+
+        second.datum_einde_geldigheid = None
+        second.save()
+
+        first.refresh_from_db()
+        self.assertIsNone(first.einde_object)
+
+        second.delete()
+
+        first.refresh_from_db()
+        self.assertEqual(first.einde_object, date(2020, 2, 1))
+
+        first.identificatie = "ZAAK2"
+        first.save()
+
+        self.assertEqual(first.begin_object, date(2020, 1, 1))
@@ -9,8 +9,19 @@ from vng_api_common.constants import VertrouwelijkheidsAanduiding
 
 from ...admin.forms import ZaakTypeForm
 from ...constants import InternExtern
+from ...models import BesluitType
 from ...models.zaaktype import ZaakType
-from ..factories import CatalogusFactory, ZaakTypeFactory
+from ...utils import publish_concepts
+from ...validators import get_zaaktypen_publish_errors, validate_zaaktype_for_publish
+from ..factories import (
+    BesluitTypeFactory,
+    CatalogusFactory,
+    InformatieObjectTypeFactory,
+    ResultaatTypeFactory,
+    RolTypeFactory,
+    StatusTypeFactory,
+    ZaakTypeFactory,
+)
 
 
 class ZaaktypeValidationTests(TestCase):
@@ -211,3 +222,86 @@ class ZaaktypeValidationTests(TestCase):
         )
         instance.clean()
         self.assertEqual(ZaakType.objects.all().count(), 2)
+
+
+class ZaaktypePublishValidationTests(TestCase):
+    def test_all_errors_in_a_single_query(self):
+        zaaktype = ZaakTypeFactory.create(concept=True)
+        BesluitTypeFactory.create(concept=True, zaaktypen=[zaaktype])
+        ResultaatTypeFactory.create(zaaktype=zaaktype, selectielijstklasse="")
+        StatusTypeFactory.create(zaaktype=zaaktype)
+
+        with self.assertNumQueries(1):
+            errors = validate_zaaktype_for_publish(zaaktype)
+
+        self.assertEqual(
+            [field for field, error in errors],
+            [None, "resultaattypen", "roltypen", "statustypen"],
+        )
+
+    def test_multiple_zaaktypen_in_a_single_query(self):
+        valid, invalid = ZaakTypeFactory.create_batch(2, concept=True)
+        InformatieObjectTypeFactory.create(concept=True, zaaktypen__zaaktype=invalid)
+        for zaaktype in (valid, invalid):
+            StatusTypeFactory.create_batch(2, zaaktype=zaaktype)
+            ResultaatTypeFactory.create(zaaktype=zaaktype)
+            RolTypeFactory.create(zaaktype=zaaktype)
+
+        with self.assertNumQueries(1):
+            errors = get_zaaktypen_publish_errors(ZaakType.objects.all())
+
+        self.assertEqual(errors[valid.pk], [])
+        self.assertEqual([field for field, error in errors[invalid.pk]], [None])
+
+
+class PublishConceptsTests(TestCase):
+    def test_publish_concepts_in_bulk(self):
+        catalogus = CatalogusFactory.create()
+        zaaktype = ZaakTypeFactory.create(catalogus=catalogus)
+        BesluitTypeFactory.create(
+            catalogus=catalogus,
+            omschrijving="Apple",
+            datum_begin_geldigheid="2023-01-01",
+            concept=False,
+        )
+        overlapping = BesluitTypeFactory.create(
+            catalogus=catalogus,
+            omschrijving="Apple",
+            datum_begin_geldigheid="2023-04-01",
+            concept=True,
+            zaaktypen=[zaaktype],
+        )
+        besluittypen = BesluitTypeFactory.create_batch(
+            5, catalogus=catalogus, concept=True, zaaktypen=[zaaktype]
+        )
+
+        # the concepts, their published versions and a single update
+        with self.assertNumQueries(3):
+            published, failed = publish_concepts(
+                BesluitType.objects.filter(zaaktypen=zaaktype)
+            )
+
+        self.assertEqual(published, besluittypen)
+        self.assertEqual([obj for obj, error in failed], [overlapping])
+        self.assertFalse(
+            BesluitType.objects.filter(
+                pk__in=[obj.pk for obj in besluittypen], concept=True
+            ).exists()
+        )
+        overlapping.refresh_from_db()
+        self.assertTrue(overlapping.concept)
+
+    def test_concepts_do_not_overlap_each_other(self):
+        catalogus = CatalogusFactory.create()
+        first, second = BesluitTypeFactory.create_batch(
+            2,
+            catalogus=catalogus,
+            omschrijving="Apple",
+            datum_begin_geldigheid="2023-01-01",
+            concept=True,
+        )
+
+        published, failed = publish_concepts(BesluitType.objects.all())
+
+        self.assertEqual(published, [first])
+        self.assertEqual([obj for obj, error in failed], [second])
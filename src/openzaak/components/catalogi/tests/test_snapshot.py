@@ -0,0 +1,79 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+from django.db import transaction
+from django.test import TestCase
+
+from vng_api_common.tests import reverse
+
+from openzaak.tests.utils import ClearCachesMixin
+
+from ..models import ResultaatType, StatusType, ZaakType
+from ..snapshot import get_generation, get_record, get_snapshot
+from .factories import ResultaatTypeFactory, StatusTypeFactory, ZaakTypeFactory
+
+
+class CatalogiSnapshotTests(ClearCachesMixin, TestCase):
+    def test_records(self):
+        zaaktype = ZaakTypeFactory.create()
+        statustype1 = StatusTypeFactory.create(
+            zaaktype=zaaktype, statustypevolgnummer=1
+        )
+        statustype2 = StatusTypeFactory.create(
+            zaaktype=zaaktype, statustypevolgnummer=2
+        )
+        resultaattype = ResultaatTypeFactory.create(zaaktype=zaaktype)
+
+        zaaktype_record = get_record(ZaakType, zaaktype.pk)
+        self.assertEqual(zaaktype_record.identificatie, zaaktype.identificatie)
+        self.assertEqual(zaaktype_record.eindstatustype_id, statustype2.pk)
+        self.assertFalse(get_record(StatusType, statustype1.pk).is_eindstatus)
+        self.assertTrue(get_record(StatusType, statustype2.pk).is_eindstatus)
+        resultaattype_record = get_record(ResultaatType, resultaattype.pk)
+        self.assertEqual(
+            resultaattype_record.brondatum_archiefprocedure,
+            resultaattype.brondatum_archiefprocedure,
+        )
+        record = get_snapshot().get_by_url(f"http://testserver{reverse(statustype1)}")
+        self.assertEqual(record.pk, statustype1.pk)
+
+    def test_records_are_immutable(self):
+        zaaktype = ZaakTypeFactory.create()
+
+        with self.assertRaises(AttributeError):
+            get_record(ZaakType, zaaktype.pk).concept = False
+
+    def test_changes_bump_generation(self):
+        zaaktype = ZaakTypeFactory.create()
+        statustype = StatusTypeFactory.create(zaaktype=zaaktype)
+        self.assertTrue(get_record(StatusType, statustype.pk).is_eindstatus)
+        generation = get_generation()
+
+        last_statustype = StatusTypeFactory.create(
+            zaaktype=zaaktype,
+            statustypevolgnummer=statustype.statustypevolgnummer + 1,
+        )
+
+        self.assertNotEqual(get_generation(), generation)
+        self.assertFalse(get_record(StatusType, statustype.pk).is_eindstatus)
+        self.assertTrue(get_record(StatusType, last_statustype.pk).is_eindstatus)
+
+        last_statustype.delete()
+
+        self.assertTrue(get_record(StatusType, statustype.pk).is_eindstatus)
+
+    def test_uncommitted_changes_use_own_snapshot(self):
+        class RolledBack(Exception):
+            pass
+
+        with self.assertRaises(RolledBack):
+            with transaction.atomic():
+                zaaktype = ZaakTypeFactory.create()
+
+                # the uncommitted changes are not in the shared snapshot
+                self.assertIsNot(get_snapshot(), get_snapshot())
+                self.assertIsNotNone(get_record(ZaakType, zaaktype.pk))
+                raise RolledBack
+
+        # the rolled back changes no longer need a snapshot of their own
+        self.assertIs(get_snapshot(), get_snapshot())
+        self.assertIsNone(get_record(ZaakType, zaaktype.pk))
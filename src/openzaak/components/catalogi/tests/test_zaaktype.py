@@ -3,11 +3,14 @@
 import uuid
 from datetime import date
 
+from django.db import connection
 from django.test import TestCase, override_settings, tag
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse as django_reverse
 from django.utils.translation import gettext_lazy as _
 
 import requests_mock
+from freezegun import freeze_time
 from rest_framework import status
 from vng_api_common.authorizations.models import Autorisatie
 from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
@@ -35,10 +38,13 @@ from .base import APITestCase
 from .factories import (
     BesluitTypeFactory,
     CatalogusFactory,
+    CheckListItemFactory,
+    EigenschapFactory,
     InformatieObjectTypeFactory,
     ResultaatTypeFactory,
     RolTypeFactory,
     StatusTypeFactory,
+    ZaakObjectTypeFactory,
     ZaakTypeFactory,
     ZaakTypeInformatieObjectTypeFactory,
     ZaakTypenRelatieFactory,
@@ -157,6 +163,76 @@ class ZaakTypeAPITests(TypeCheckMixin, APITestCase):
             },
         )
 
+    def test_get_detail_queries_per_relation(self):
+        zaaktype = ZaakTypeFactory.create(catalogus=self.catalogus)
+        statustype1 = StatusTypeFactory.create(
+            zaaktype=zaaktype, statustypevolgnummer=1
+        )
+        statustype2 = StatusTypeFactory.create(
+            zaaktype=zaaktype, statustypevolgnummer=2
+        )
+        ResultaatTypeFactory.create_batch(2, zaaktype=zaaktype)
+        EigenschapFactory.create_batch(2, zaaktype=zaaktype)
+        RolTypeFactory.create_batch(2, zaaktype=zaaktype)
+        ZaakObjectTypeFactory.create_batch(2, zaaktype=zaaktype)
+        ZaakTypeInformatieObjectTypeFactory.create_batch(
+            2, zaaktype=zaaktype, informatieobjecttype__catalogus=self.catalogus
+        )
+        BesluitTypeFactory.create_batch(
+            2, catalogus=self.catalogus, zaaktypen=[zaaktype]
+        )
+        zaaktype.deelzaaktypen.set(
+            ZaakTypeFactory.create_batch(2, catalogus=self.catalogus)
+        )
+        # the ETag value is not calculated during the request
+        ZaakType.objects.filter(pk=zaaktype.pk).update(_etag="cached")
+        url = get_operation_url("zaaktype_read", uuid=zaaktype.uuid)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        for field in (
+            "statustypen",
+            "resultaattypen",
+            "eigenschappen",
+            "roltypen",
+            "zaakobjecttypen",
+            "informatieobjecttypen",
+            "besluittypen",
+            "deelzaaktypen",
+        ):
+            with self.subTest(field=field):
+                self.assertEqual(len(data[field]), 2)
+        # ordered like the statustypen of the zaaktype
+        self.assertEqual(
+            data["statustypen"],
+            [
+                f"http://testserver{reverse(statustype2)}",
+                f"http://testserver{reverse(statustype1)}",
+            ],
+        )
+
+        # all the related URLs are fetched with a single query
+        for table in (
+            "catalogi_statustype",
+            "catalogi_resultaattype",
+            "catalogi_eigenschap",
+            "catalogi_roltype",
+            "catalogi_zaakobjecttype",
+            "catalogi_zaaktypeinformatieobjecttype",
+            "catalogi_besluittype_zaaktypen",
+            "catalogi_zaaktype_deelzaaktypen",
+        ):
+            with self.subTest(table=table):
+                queries = [
+                    query["sql"]
+                    for query in context.captured_queries
+                    if f'"{table}"' in query["sql"]
+                ]
+                self.assertEqual(len(queries), 1)
+
     def test_create_zaaktype(self):
         besluittype = BesluitTypeFactory.create(catalogus=self.catalogus)
         besluittype_url = get_operation_url("besluittype_read", uuid=besluittype.uuid)
@@ -1630,6 +1706,54 @@ class ZaakTypePublishTests(APITestCase):
         )
 
 
+class ZaakTypeNewVersionTests(APITestCase):
+    @freeze_time("2024-05-01")
+    def test_new_version(self):
+        zaaktype = ZaakTypeFactory.create(
+            concept=False, datum_begin_geldigheid=date(2020, 1, 1)
+        )
+        statustype = StatusTypeFactory.create(zaaktype=zaaktype)
+        CheckListItemFactory.create(statustype=statustype)
+        EigenschapFactory.create(zaaktype=zaaktype, statustype=statustype)
+        zaakobjecttype = ZaakObjectTypeFactory.create(
+            zaaktype=zaaktype, statustype=statustype
+        )
+        besluittype = BesluitTypeFactory.create(zaaktypen=[zaaktype])
+        resultaattype = ResultaatTypeFactory.create(zaaktype=zaaktype)
+        resultaattype.besluittypen.add(besluittype)
+        resultaattype.zaakobjecttypen.add(zaakobjecttype)
+        RolTypeFactory.create(zaaktype=zaaktype)
+
+        response = self.client.post(
+            get_operation_url("zaaktype_new_version", uuid=zaaktype.uuid)
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        new_version = ZaakType.objects.get(uuid=response.data["url"].split("/")[-1])
+        self.assertTrue(new_version.concept)
+        self.assertEqual(new_version.identificatie, zaaktype.identificatie)
+        self.assertEqual(new_version.datum_begin_geldigheid, date(2024, 5, 1))
+        self.assertIsNone(new_version.datum_einde_geldigheid)
+
+        # the relations between the copies refer to the new version
+        new_statustype = new_version.statustypen.get()
+        self.assertNotEqual(new_statustype.pk, statustype.pk)
+        self.assertEqual(new_statustype.checklistitem_set.count(), 1)
+        self.assertEqual(new_version.eigenschap_set.get().statustype, new_statustype)
+        new_zaakobjecttype = new_version.zaakobjecttype_set.get()
+        self.assertEqual(new_zaakobjecttype.statustype, new_statustype)
+        new_resultaattype = new_version.resultaattypen.get()
+        self.assertEqual(new_resultaattype.besluittypen.get(), besluittype)
+        self.assertEqual(new_resultaattype.zaakobjecttypen.get(), new_zaakobjecttype)
+        self.assertEqual(new_version.besluittypen.get(), besluittype)
+        self.assertEqual(new_version.roltype_set.count(), 1)
+        self.assertEqual(new_statustype._etag, "")
+
+        # the original is unchanged
+        self.assertEqual(statustype.checklistitem_set.count(), 1)
+        self.assertEqual(resultaattype.zaakobjecttypen.get(), zaakobjecttype)
+
+
 class ZaakTypeCreateDuplicateTests(APITestCase):
     """
     Test the creation business rules w/r to duplicates.
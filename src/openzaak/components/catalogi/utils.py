@@ -1,8 +1,9 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
 import operator
+from collections import defaultdict
 from datetime import date
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from django.core.exceptions import ValidationError
 from django.db import models
@@ -12,6 +13,7 @@ from django.utils.translation import gettext_lazy as _
 from dateutil.relativedelta import relativedelta
 
 from .models import Catalogus
+from .snapshot import bump_generation
 
 
 def has_overlapping_objects(
@@ -62,6 +64,80 @@ def has_overlapping_objects(
     return False
 
 
+def is_overlapping(obj: models.Model, other: models.Model) -> bool:
+    """
+    Tests if the geldigheid of two objects overlaps, like
+    :func:`has_overlapping_objects` does in the database.
+    """
+    if not obj.datum_begin_geldigheid:
+        return False
+    if (
+        other.datum_einde_geldigheid is not None
+        and other.datum_einde_geldigheid <= obj.datum_begin_geldigheid
+    ):
+        return False
+    if (
+        obj.datum_einde_geldigheid is not None
+        and other.datum_begin_geldigheid >= obj.datum_einde_geldigheid
+    ):
+        return False
+    return True
+
+
+def publish_concepts(
+    queryset: models.QuerySet,
+) -> Tuple[List[models.Model], List[Tuple[models.Model, ValidationError]]]:
+    """
+    Publish the concepts in the queryset in bulk.
+
+    The concepts are validated like :meth:`ConceptMixin.publish` does, but the
+    published versions they could overlap with are fetched with a single query, and
+    the valid concepts are published with a single ``UPDATE``.
+
+    :param queryset: queryset of a model with versions (``GeldigheidMixin``)
+    :return: the published objects, and the objects that can't be published with
+        their validation errors
+    """
+    model = queryset.model
+    concepts = list(queryset.filter(concept=True).order_by("pk"))
+    if not concepts:
+        return [], []
+
+    field = model.omschrijving_field
+    versions = defaultdict(list)
+    published_versions = model._default_manager.filter(
+        catalogus_id__in={obj.catalogus_id for obj in concepts},
+        concept=False,
+        **{f"{field}__in": {getattr(obj, field) for obj in concepts}},
+    ).only(
+        "pk", "catalogus_id", field, "datum_begin_geldigheid", "datum_einde_geldigheid"
+    )
+    for version in published_versions:
+        versions[version.versions_key].append(version)
+
+    published, failed = [], []
+    for obj in concepts:
+        obj.concept = False
+        obj._published_versions = versions[obj.versions_key]
+        try:
+            obj.clean()
+        except ValidationError as exc:
+            obj.concept = True
+            failed.append((obj, exc))
+            continue
+        # the next concepts of the same object may not overlap with this one either
+        versions[obj.versions_key].append(obj)
+        published.append(obj)
+
+    if published:
+        # ⚡️ the ETag values are calculated on the next request
+        model._default_manager.filter(pk__in=[obj.pk for obj in published]).update(
+            concept=False, _etag=""
+        )
+        bump_generation()
+    return published, failed
+
+
 def compare_relativedeltas(
     rd1: relativedelta, rd2: relativedelta, comparison=operator.gt
 ) -> bool:
@@ -1,14 +1,24 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2022 Dimpact
-from typing import List, Tuple, TypedDict
+from typing import Dict, List, Optional, Tuple, Type, TypedDict
 
+from django.db import models
+from django.db.models import Count, Exists, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.utils.translation import gettext_lazy as _
 
 from vng_api_common.constants import (
     BrondatumArchiefprocedureAfleidingswijze as Afleidingswijze,
 )
 
-from .models import ZaakType
+from .models import (
+    BesluitType,
+    InformatieObjectType,
+    ResultaatType,
+    RolType,
+    StatusType,
+    ZaakType,
+)
 
 
 class ArchiefProcedure(TypedDict):
@@ -97,25 +107,70 @@ def validate_brondatumarchiefprocedure(
     return error, empty, required
 
 
-def validate_zaaktype_for_publish(zaaktype: ZaakType) -> List[Tuple[str, str]]:
+def _count(model: Type[models.Model], **filters) -> Coalesce:
+    counts = (
+        model.objects.filter(zaaktype=OuterRef("pk"), **filters)
+        .order_by()
+        .values("zaaktype")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    return Coalesce(Subquery(counts), 0)
+
+
+def get_zaaktypen_publish_errors(
+    zaaktypen: models.QuerySet,
+) -> Dict[int, List[Tuple[Optional[str], str]]]:
     """
-    Validates that a ZaakType has the correct number of related object
-    :param zaaktype: ZaakType object
-    :return: list of tuples containing field name and error text
+    Validates that the ZaakTypen have the correct number of related objects.
+
+    ⚡️ All the rules are evaluated for all the zaaktypen with a single query, instead
+    of a query per rule and zaaktype.
+
+    :param zaaktypen: queryset of ZaakType objects
+    :return: dict of the pk of every zaaktype with a list of tuples containing the
+        field name and error text
     """
+    rows = (
+        zaaktypen.order_by()
+        .annotate(
+            has_concept_besluittypen=Exists(
+                BesluitType.objects.filter(zaaktypen=OuterRef("pk"), concept=True)
+            ),
+            has_concept_informatieobjecttypen=Exists(
+                InformatieObjectType.objects.filter(
+                    zaaktypen=OuterRef("pk"), concept=True
+                )
+            ),
+            has_invalid_resultaattypen=Exists(
+                ResultaatType.objects.filter(
+                    zaaktype=OuterRef("pk"), selectielijstklasse=""
+                )
+            ),
+            num_roltypen=_count(RolType),
+            num_resultaattypen=_count(ResultaatType),
+            num_statustypen=_count(StatusType),
+        )
+        .values(
+            "pk",
+            "has_concept_besluittypen",
+            "has_concept_informatieobjecttypen",
+            "has_invalid_resultaattypen",
+            "num_roltypen",
+            "num_resultaattypen",
+            "num_statustypen",
+        )
+    )
+    return {row["pk"]: _get_publish_errors(row) for row in rows}
+
 
+def _get_publish_errors(row: dict) -> List[Tuple[Optional[str], str]]:
     errors = []
 
-    if (
-        zaaktype.besluittypen.filter(concept=True).exists()
-        or zaaktype.informatieobjecttypen.filter(concept=True).exists()
-    ):
+    if row["has_concept_besluittypen"] or row["has_concept_informatieobjecttypen"]:
         errors.append((None, _("All related resources should be published")))
 
-    has_invalid_resultaattypen = zaaktype.resultaattypen.filter(
-        selectielijstklasse=""
-    ).exists()
-    if has_invalid_resultaattypen:
+    if row["has_invalid_resultaattypen"]:
         errors.append(
             (
                 "resultaattypen",
@@ -126,8 +181,7 @@ def validate_zaaktype_for_publish(zaaktype: ZaakType) -> List[Tuple[str, str]]:
             )
         )
 
-    num_roltypen = zaaktype.roltype_set.count()
-    if not num_roltypen >= 1:
+    if not row["num_roltypen"] >= 1:
         errors.append(
             (
                 "roltypen",
@@ -135,8 +189,7 @@ def validate_zaaktype_for_publish(zaaktype: ZaakType) -> List[Tuple[str, str]]:
             )
         )
 
-    num_resultaattypen = zaaktype.resultaattypen.count()
-    if not num_resultaattypen >= 1:
+    if not row["num_resultaattypen"] >= 1:
         errors.append(
             (
                 "resultaattypen",
@@ -146,8 +199,7 @@ def validate_zaaktype_for_publish(zaaktype: ZaakType) -> List[Tuple[str, str]]:
             )
         )
 
-    num_statustypen = zaaktype.statustypen.count()
-    if not num_statustypen >= 2:
+    if not row["num_statustypen"] >= 2:
         errors.append(
             (
                 "statustypen",
@@ -158,3 +210,13 @@ def validate_zaaktype_for_publish(zaaktype: ZaakType) -> List[Tuple[str, str]]:
         )
 
     return errors
+
+
+def validate_zaaktype_for_publish(zaaktype: ZaakType) -> List[Tuple[str, str]]:
+    """
+    Validates that a ZaakType has the correct number of related object
+    :param zaaktype: ZaakType object
+    :return: list of tuples containing field name and error text
+    """
+    errors = get_zaaktypen_publish_errors(ZaakType.objects.filter(pk=zaaktype.pk))
+    return errors.get(zaaktype.pk, [])
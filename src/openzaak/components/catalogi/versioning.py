@@ -0,0 +1,152 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+"""
+Create new versions of the catalogi types.
+
+A new version is a concept copy of the type with all its related objects, e.g. the
+statustypen, roltypen and resultaattypen of a zaaktype, including the objects
+related to those (checklist items, the informatieobjecttypen of the
+resultaattypen...). The copies are created with a single ``bulk_create`` per model,
+in the order of their foreign keys, and the foreign keys between the copies are
+remapped to the new objects.
+"""
+import uuid
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Iterable, List, Type
+
+from django.db import models, transaction
+from django.db.models import Q
+
+from graphlib import TopologicalSorter
+
+from openzaak.utils.models import clone_object
+
+from .snapshot import bump_generation
+
+PkMap = Dict[Type[models.Model], Dict[int, int]]
+
+
+def _get_relations(
+    model: Type[models.Model], exclude: Iterable[str] = ()
+) -> List[models.ForeignObjectRel]:
+    # m2m relations are included as the one_to_many relations of the through models
+    return [
+        field
+        for field in model._meta.get_fields(include_hidden=True)
+        if field.auto_created
+        and not field.concrete
+        and (field.one_to_many or field.one_to_one)
+        and field.name not in exclude
+    ]
+
+
+def _is_local(model: Type[models.Model]) -> bool:
+    return model._meta.app_label == "catalogi"
+
+
+def _in_dependency_order(
+    fields: Dict[Type[models.Model], List[models.ForeignKey]]
+) -> List[Type[models.Model]]:
+    """
+    Order the models so that the copies a model refers to are created first.
+    """
+    sorter = TopologicalSorter()
+    for model in fields:
+        sorter.add(
+            model,
+            *{
+                field.related_model
+                for field in model._meta.concrete_fields
+                if field.is_relation
+                and field.related_model in fields
+                and field.related_model is not model
+            },
+        )
+    return list(sorter.static_order())
+
+
+def _copy(objs: List[models.Model], pk_map: PkMap) -> List[int]:
+    old_pks = []
+    for obj in objs:
+        old_pks.append(obj.pk)
+        obj.pk = None
+        obj._state.adding = True
+        for field in obj._meta.concrete_fields:
+            if not field.is_relation or field.related_model not in pk_map:
+                continue
+            value = getattr(obj, field.attname)
+            if value in pk_map[field.related_model]:
+                setattr(obj, field.attname, pk_map[field.related_model][value])
+        if hasattr(obj, "uuid"):
+            obj.uuid = uuid.uuid4()
+        # calculated on the next request
+        if hasattr(obj, "_etag"):
+            obj._etag = ""
+    return old_pks
+
+
+def _copy_related(
+    fields: Dict[Type[models.Model], List[models.ForeignKey]], pk_map: PkMap
+) -> None:
+    for model in _in_dependency_order(fields):
+        query = Q()
+        for field in fields[model]:
+            query |= Q(**{f"{field.name}__in": list(pk_map[field.related_model])})
+        objs = list(model._default_manager.filter(query).order_by("pk"))
+        old_pks = _copy(objs, pk_map)
+        if _is_local(model):
+            # ⚡️ a single query per model instead of a save per object, the pks of
+            # the copies are set by the database
+            model._default_manager.bulk_create(objs)
+        else:
+            # the models of other components can rely on their save or signals
+            for obj in objs:
+                obj.save()
+        pk_map[model] = dict(zip(old_pks, (obj.pk for obj in objs)))
+
+
+@transaction.atomic
+def create_new_version(original: models.Model, exclude: Iterable[str] = ()):
+    """
+    Create a concept copy of ``original`` and all its related objects.
+
+    :param exclude: the names of the relations of ``original`` that are not copied
+    """
+    new_obj = clone_object(original)
+    version_date = date.today()
+
+    new_obj.uuid = uuid.uuid4()
+    new_obj.datum_begin_geldigheid = version_date
+    new_obj.versiedatum = version_date
+    new_obj.datum_einde_geldigheid = None
+    new_obj.concept = True
+    new_obj.save()
+
+    model = type(original)
+    pk_map: PkMap = {model: {original.pk: new_obj.pk}}
+
+    # the objects related to the original
+    children = defaultdict(list)
+    for relation in _get_relations(model, exclude=exclude):
+        children[relation.related_model].append(relation.field)
+    _copy_related(children, pk_map)
+
+    # the objects of the catalogi related to those copies
+    grandchildren = defaultdict(list)
+    for child in children:
+        if not _is_local(child):
+            continue
+        for relation in _get_relations(child):
+            related_model = relation.related_model
+            if related_model in children or related_model is model:
+                continue
+            if not _is_local(related_model):
+                continue
+            grandchildren[related_model].append(relation.field)
+    _copy_related(grandchildren, pk_map)
+
+    # ⚡️ the bulk created objects don't send signals, so the snapshots are
+    # invalidated once for the complete version
+    bump_generation()
+    return new_obj
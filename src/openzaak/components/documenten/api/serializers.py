@@ -32,6 +32,7 @@ from vng_api_common.serializers import (
 from vng_api_common.utils import get_help_text
 
 from openzaak.contrib.verzoeken.validators import verzoek_validator
+from openzaak.utils.compiled import CompiledRepresentationMixin
 from openzaak.utils.serializer_fields import (
     FKOrServiceUrlField,
     LengthHyperlinkedRelatedField,
@@ -259,7 +260,9 @@ class BestandsDeelSerializer(serializers.HyperlinkedModelSerializer):
         return valid_attrs
 
 
-class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
+class EnkelvoudigInformatieObjectSerializer(
+    CompiledRepresentationMixin, serializers.HyperlinkedModelSerializer
+):
     """
     Serializer for the EnkelvoudigInformatieObject model
     """
@@ -16,7 +16,6 @@ from drf_spectacular.utils import (
     extend_schema,
     extend_schema_view,
 )
-from notifications_api_common.viewsets import NotificationViewSetMixin
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.pagination import PageNumberPagination
@@ -24,11 +23,11 @@ from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.response import Response
 from rest_framework.serializers import ErrorDetail, ValidationError
 from rest_framework.settings import api_settings
-from vng_api_common.audittrails.viewsets import AuditTrailViewsetMixin
 from vng_api_common.filters import Backend
 from vng_api_common.search import SearchMixin
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
+from openzaak.audit.viewsets import AuditTrailViewsetMixin
 from openzaak.components.documenten.import_utils import DocumentRow
 from openzaak.components.documenten.tasks import import_documents
 from openzaak.import_data.models import ImportStatusChoices, ImportTypeChoices
@@ -39,11 +38,13 @@ from openzaak.import_data.views import (
     ImportStatusView,
     ImportUploadView,
 )
+from openzaak.notifications.viewsets import NotificationViewSetMixin
 from openzaak.utils.data_filtering import ListFilterByAuthorizationsMixin
 from openzaak.utils.exceptions import CMISNotSupportedException
 from openzaak.utils.help_text import mark_experimental
 from openzaak.utils.mixins import (
     CMISConnectionPoolMixin,
+    CompiledRepresentationViewSetMixin,
     ConvertCMISAdapterExceptions,
     ExpandMixin,
 )
@@ -214,6 +215,7 @@ class EnkelvoudigInformatieObjectViewSet(
     CheckQueryParamsMixin,
     SearchMixin,
     ExpandMixin,
+    CompiledRepresentationViewSetMixin,
     NotificationViewSetMixin,
     ListFilterByAuthorizationsMixin,
     AuditTrailViewsetMixin,
@@ -359,6 +361,8 @@ class EnkelvoudigInformatieObjectViewSet(
         )
         lock_serializer.is_valid(raise_exception=True)
         lock_serializer.save()
+        # the lock is part of the representation of every version
+        eio.invalidate_etag()
         return Response(lock_serializer.data)
 
     @extend_schema(
@@ -401,6 +405,7 @@ class EnkelvoudigInformatieObjectViewSet(
         )
         unlock_serializer.is_valid(raise_exception=True)
         unlock_serializer.save()
+        eio.invalidate_etag()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     @extend_schema(
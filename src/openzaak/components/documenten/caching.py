@@ -1,10 +1,11 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2022 Dimpact
 from functools import partial
-from typing import Optional, Set
+from typing import Optional, Set, Tuple
+from uuid import uuid4
 
 from django.conf import settings
-from django.core.cache import cache
+from django.core.cache import cache, caches
 from django.db import models
 
 from rest_framework_condition.decorators import condition as drf_condition
@@ -13,20 +14,78 @@ from vng_api_common.caching.registry import extract_dependencies
 
 from openzaak.utils.decorators import convert_cmis_adapter_exceptions
 
+# version of the format of the cached ETag values, the values used to be plain
+# strings and are now (generation, etag) tuples
+ETAG_CACHE_VERSION = 2
+
 
 def get_etag_cache_key(obj: models.Model) -> str:
     resource = obj._meta.model_name
     uuid = obj.uuid
     versie = getattr(obj, "versie", 1)
-    return f"{resource}-{uuid}-{versie}"
+    return f"{resource}-{uuid}-{versie}:v{ETAG_CACHE_VERSION}"
+
+
+def get_generation_cache_key(obj: models.Model) -> str:
+    return f"{obj._meta.model_name}-{obj.uuid}-generation"
+
+
+class ETagStore:
+    """
+    Access to the ETag values in the cache.
+
+    Every value is stored with the generation of the resource it was calculated
+    for. Bumping the generation invalidates the values of all the versions of the
+    resource at once. A value is only valid for the generation it was stored with,
+    so the generation must be read before the value is calculated.
+    """
+
+    def __init__(self, cache_alias: str = "default"):
+        self.cache_alias = cache_alias
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def get(self, obj: models.Model) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Return the ETag value (if it is still valid) and the current generation of
+        the resource, in a single round trip.
+        """
+        generation_key = get_generation_cache_key(obj)
+        values = self.cache.get_many([generation_key, get_etag_cache_key(obj)])
+        generation = values.get(generation_key)
+        stored = values.get(get_etag_cache_key(obj))
+        if stored is None or stored[0] != generation:
+            return None, generation
+        return stored[1], generation
+
+    def get_generation(self, obj: models.Model) -> Optional[str]:
+        return self.cache.get(get_generation_cache_key(obj))
+
+    def set(self, obj: models.Model, etag: str, generation: Optional[str]) -> None:
+        """
+        Store the ETag value calculated for the ``generation`` of the resource.
+        """
+        self.cache.set(get_etag_cache_key(obj), (generation, etag))
+
+    def invalidate(self, obj: models.Model) -> None:
+        """
+        Invalidate the ETag values of all the versions of the resource.
+        """
+        self.cache.set(get_generation_cache_key(obj), uuid4().hex, timeout=None)
+
+
+etag_store = ETagStore()
 
 
 def set_etag(key: str, etag_value: str) -> None:
-    cache.set(key, etag_value)
+    cache.set(key, (None, etag_value))
 
 
 def get_etag(key: str) -> Optional[str]:
-    return cache.get(key)
+    stored = cache.get(key)
+    return stored[1] if stored is not None else None
 
 
 class CMISETagMixin:
@@ -47,16 +106,27 @@ class CMISETagMixin:
 
     @property
     def _etag(self):
-        return get_etag(get_etag_cache_key(self))
+        etag, generation = etag_store.get(self)
+        # ⚡️ a missing value is calculated right after it was read, for the
+        # generation that was read along with it
+        self._etag_generation = generation
+        return etag
 
     def calculate_etag_value(self) -> str:
         """
         Calculate and save the ETag value.
         """
+        if "_etag_generation" in self.__dict__:
+            generation = self.__dict__.pop("_etag_generation")
+        else:
+            generation = etag_store.get_generation(self)
         etag = calculate_etag(self)
-        set_etag(get_etag_cache_key(self), etag)
+        etag_store.set(self, etag, generation)
         return etag
 
+    def invalidate_etag(self) -> None:
+        etag_store.invalidate(self)
+
 
 def cmis_conditional_retrieve(
     action="retrieve",
@@ -712,6 +712,7 @@ class Gebruiksrechten(APIMixin, CMISETagMixin, models.Model, CMISClientMixin):
         if not informatieobject_versie.indicatie_gebruiksrecht:
             informatieobject_versie.indicatie_gebruiksrecht = True
             informatieobject_versie.save()
+            informatieobject_versie.invalidate_etag()
         super().save(*args, **kwargs)
 
     @transaction.atomic
@@ -726,6 +727,7 @@ class Gebruiksrechten(APIMixin, CMISETagMixin, models.Model, CMISClientMixin):
                 informatieobject_versie = self.informatieobject.latest_version
                 informatieobject_versie.indicatie_gebruiksrecht = None
                 informatieobject_versie.save()
+                informatieobject_versie.invalidate_etag()
         else:
             # Check if there are other Gebruiksrechten for the EnkelvoudigInformatieObject in alfresco
             eio_url = self.get_informatieobject_url()
@@ -733,6 +735,7 @@ class Gebruiksrechten(APIMixin, CMISETagMixin, models.Model, CMISClientMixin):
                 eio = self.get_informatieobject()
                 eio.indicatie_gebruiksrecht = None
                 eio.save()
+                eio.invalidate_etag()
             self.cmis_client.delete_content_object(
                 self.uuid, object_type="gebruiksrechten"
             )
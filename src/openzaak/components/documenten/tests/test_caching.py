@@ -3,6 +3,10 @@
 """
 Test that the caching mechanisms are in place.
 """
+from unittest.mock import patch
+
+from django.core.cache import cache
+
 from rest_framework import status
 from rest_framework.test import APITestCase, APITransactionTestCase
 from vng_api_common.tests import CacheMixin, JWTAuthMixin, reverse
@@ -10,7 +14,7 @@ from vng_api_common.tests import CacheMixin, JWTAuthMixin, reverse
 from openzaak.components.zaken.tests.factories import ZaakInformatieObjectFactory
 from openzaak.tests.utils import get_spec
 
-from ..caching import get_etag_cache_key, set_etag
+from ..caching import etag_store, get_etag, get_etag_cache_key, set_etag
 from ..models import ObjectInformatieObject
 from ..tests.factories import EnkelvoudigInformatieObjectFactory, GebruiksrechtenFactory
 
@@ -194,3 +198,70 @@ class EnkelvoudigInformatieObjectCacheTransactionTests(
 
         response = self.client.get(reverse(eio), headers={"if-none-match": f"{_etag}"})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class ETagStoreTests(CacheMixin, JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_get_and_set(self):
+        eio1, eio2 = EnkelvoudigInformatieObjectFactory.create_batch(2)
+
+        etag_store.set(eio1, "etag1", etag_store.get_generation(eio1))
+
+        with self.assertNumQueries(0):
+            self.assertEqual(etag_store.get(eio1)[0], "etag1")
+            self.assertIsNone(etag_store.get(eio2)[0])
+
+    def test_values_of_previous_format_are_ignored(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(versie=1)
+        # plain strings, stored by previous versions of Open Zaak
+        cache.set(f"enkelvoudiginformatieobject-{eio.uuid}-1", "old-etag")
+
+        self.assertIsNone(etag_store.get(eio)[0])
+        self.assertIsNone(get_etag(get_etag_cache_key(eio)))
+
+    def test_invalidate_all_versions(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(versie=1)
+        new_version = EnkelvoudigInformatieObjectFactory.create(
+            canonical=eio.canonical, uuid=eio.uuid, versie=2
+        )
+        other = EnkelvoudigInformatieObjectFactory.create()
+        for obj, etag in ((eio, "v1"), (new_version, "v2"), (other, "other")):
+            etag_store.set(obj, etag, etag_store.get_generation(obj))
+
+        eio.invalidate_etag()
+
+        self.assertIsNone(etag_store.get(eio)[0])
+        self.assertIsNone(etag_store.get(new_version)[0])
+        self.assertEqual(etag_store.get(other)[0], "other")
+
+    def test_invalidate_during_calculation(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+
+        def _calculate(obj):
+            # the resource is changed while its ETag value is calculated
+            etag_store.invalidate(obj)
+            return "stale"
+
+        with patch(
+            "openzaak.components.documenten.caching.calculate_etag",
+            side_effect=_calculate,
+        ):
+            eio.calculate_etag_value()
+
+        self.assertIsNone(etag_store.get(eio)[0])
+
+    def test_lock_invalidates_etag(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        _etag = eio.calculate_etag_value()
+
+        response = self.client.post(
+            reverse("enkelvoudiginformatieobject-lock", kwargs={"uuid": eio.uuid})
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(
+            reverse(eio), headers={"if-none-match": f'"{_etag}"'}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], f'"{_etag}"')
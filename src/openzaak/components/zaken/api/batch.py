@@ -0,0 +1,266 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+"""
+Create multiple sub-resources of a single zaak in one request.
+
+The sub-resources are validated and created with their regular viewsets and
+serializers, so all the validation and side effects of the individual endpoints
+still apply. The zaak lookup, permission checks, audit trail writes and notification
+scheduling are shared by all the sub-resources in the batch.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple, Type
+
+from django.conf import settings
+from django.db import models, transaction
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from django_loose_fk.virtual_models import ProxyMixin
+from djangorestframework_camel_case.util import camelize
+from notifications_api_common.api.serializers import NotificatieSerializer
+from notifications_api_common.models import NotificationsConfig
+from notifications_api_common.settings import get_setting
+from notifications_api_common.tasks import send_notification
+from rest_framework import serializers, viewsets
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.request import Request
+from rest_framework.reverse import reverse
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.constants import CommonResourceAction
+from vng_api_common.permissions import bypass_permissions
+
+from openzaak.audit.models import AuditTrailKey
+from openzaak.audit.outbox import async_enabled, enqueue_audittrails
+from openzaak.audit.utils import get_audittrail_kwargs
+from openzaak.notifications.outbox import enqueue_notification, outbox_enabled
+from openzaak.utils.permissions import cache_resolved_object
+
+from ..models import Zaak
+from .audits import AUDIT_ZRC
+from .kanalen import KANAAL_ZAKEN
+
+
+@dataclass
+class BatchEntry:
+    key: str
+    viewset: viewsets.GenericViewSet
+    serializers: List[serializers.Serializer] = field(default_factory=list)
+
+
+class ZaakBatch:
+    """
+    Validate and create the sub-resources of a zaak as a single unit of work.
+    """
+
+    def __init__(self, zaak: Zaak, zaak_url: str, request: Request, main_view):
+        self.zaak = zaak
+        self.zaak_url = zaak_url
+        self.request = request
+        self.main_view = main_view
+        self.entries: List[BatchEntry] = []
+        self.created: List[Tuple[viewsets.GenericViewSet, models.Model, dict]] = []
+        self._permission_fields = None
+
+    def get_viewset(self, viewset_cls: Type[viewsets.GenericViewSet]):
+        viewset = viewset_cls(
+            request=self.request,
+            format_kwarg=None,
+            action="create",
+            basename=viewset_cls.queryset.model._meta.model_name,
+            args=(),
+            kwargs={"zaak_uuid": self.zaak.uuid},
+        )
+        # nested viewsets look up the zaak from the URL kwargs - avoid the query
+        viewset._zaak = self.zaak
+        return viewset
+
+    def check_permissions(self, viewset) -> None:
+        if bypass_permissions(self.request):
+            return
+
+        if self._permission_fields is None:
+            permission = self.main_view.get_permissions()[0]
+            self._permission_fields = permission.get_fields(
+                permission.format_data(self.zaak, self.request)
+            )
+        fields = self._permission_fields
+        component = viewset.queryset.model._meta.app_label
+        scopes = viewset.required_scopes["create"]
+        if not self.request.jwt_auth.has_auth(scopes, component, **fields):
+            raise PermissionDenied(
+                detail=f"Missing scopes to create {viewset.basename} resources"
+            )
+
+    def prime_cache(self) -> None:
+        """
+        Make the zaak and the types of its zaaktype available to the serializers.
+
+        Every sub-resource refers to the zaak and to a type of the zaaktype, which
+        would otherwise be resolved from their URLs one by one.
+        """
+        cache_resolved_object(self.request, self.zaak_url, self.zaak)
+
+        zaaktype = self.zaak.zaaktype
+        # external zaaktypen are resolved through the (cached) remote loader
+        if isinstance(zaaktype, ProxyMixin):
+            return
+
+        related_types = (
+            zaaktype.statustypen.all(),
+            zaaktype.roltype_set.all(),
+            zaaktype.eigenschap_set.all(),
+        )
+        for queryset in related_types:
+            for obj in queryset:
+                url = reverse(
+                    f"{obj._meta.model_name}-detail",
+                    kwargs={"uuid": obj.uuid},
+                    request=self.request,
+                )
+                cache_resolved_object(self.request, url, obj)
+
+    @staticmethod
+    def _has_external_document(serializer: serializers.Serializer) -> bool:
+        """
+        Check if the sub-resource relates an external document.
+
+        The external Documenten API creates its side of the relation after
+        checking the relation in this API, which can't see it before the
+        transaction of the batch is committed.
+        """
+        document = serializer.validated_data.get("informatieobject")
+        return document is not None and not settings.CMIS_ENABLED and not document.pk
+
+    def validate(self, resources: Dict[str, Type[viewsets.GenericViewSet]], data):
+        """
+        Validate all sub-resources and collect all the errors at once.
+        """
+        self.prime_cache()
+
+        errors = {}
+        for key, viewset_cls in resources.items():
+            items = data.get(key)
+            if not items:
+                continue
+
+            viewset = self.get_viewset(viewset_cls)
+            self.check_permissions(viewset)
+
+            entry = BatchEntry(key=key, viewset=viewset)
+            for index, item in enumerate(items):
+                serializer = viewset.get_serializer(
+                    data={**item, "zaak": self.zaak_url}
+                )
+                if not serializer.is_valid():
+                    errors.setdefault(key, {})[str(index)] = serializer.errors
+                elif self._has_external_document(serializer):
+                    errors.setdefault(key, {})[str(index)] = {
+                        "informatieobject": [
+                            serializers.ErrorDetail(
+                                _(
+                                    "Documents of an external Documenten API can't "
+                                    "be related in the same request, the relation "
+                                    "must be created afterwards."
+                                ),
+                                code="external-document",
+                            )
+                        ]
+                    }
+                entry.serializers.append(serializer)
+            self.entries.append(entry)
+
+        if errors:
+            raise serializers.ValidationError(errors)
+
+    def save(self) -> Dict[str, List[dict]]:
+        """
+        Create the validated sub-resources.
+
+        The caller is responsible for the transaction, and for calling
+        :meth:`create_audittrails` and :meth:`notify` afterwards.
+        """
+        results = {}
+        for entry in self.entries:
+            results[entry.key] = []
+            for serializer in entry.serializers:
+                entry.viewset.perform_create(serializer)
+                data = serializer.data
+                results[entry.key].append(data)
+                self.created.append((entry.viewset, serializer.instance, data))
+        return results
+
+    def create_audittrails(self) -> None:
+        common = get_audittrail_kwargs(
+            self.request,
+            AUDIT_ZRC,
+            CommonResourceAction.create,
+            status_code=201,
+            main_object=self.zaak_url,
+        )
+        records = [
+            dict(
+                resource=viewset.basename,
+                resource_url=data["url"],
+                resource_weergave=instance.unique_representation(),
+                oud=None,
+                nieuw=data,
+                **common,
+            )
+            for viewset, instance, data in self.created
+        ]
+        if async_enabled():
+            enqueue_audittrails(records)
+            return
+
+        audittrails = AuditTrail.objects.bulk_create(
+            [AuditTrail(**record) for record in records]
+        )
+        # bulk_create doesn't send the post_save signal that creates the lookup keys
+        AuditTrailKey.objects.create_for(audittrails)
+
+    def _get_kenmerken(self) -> dict:
+        # ⚡️ read from the zaak, instead of serializing the complete zaak
+        zaaktype = self.zaak.zaaktype
+        zaaktype_url = (
+            zaaktype.get_absolute_api_url(request=self.request)
+            if zaaktype.pk
+            else zaaktype._loose_fk_data["url"]
+        )
+        return KANAAL_ZAKEN.get_kenmerken(self.zaak, {"zaaktype": zaaktype_url})
+
+    def notify(self) -> None:
+        if not self.created or get_setting("NOTIFICATIONS_DISABLED"):
+            return
+
+        kenmerken = self._get_kenmerken()
+        now = timezone.now()
+
+        messages = []
+        for viewset, instance, data in self.created:
+            model: models.Model = viewset.queryset.model
+            message_data = {
+                "kanaal": KANAAL_ZAKEN.label,
+                "hoofd_object": self.zaak_url,
+                "resource": model._meta.model_name,
+                "resource_url": data["url"],
+                "actie": "create",
+                "aanmaakdatum": now,
+                "kenmerken": kenmerken,
+            }
+            serializer = NotificatieSerializer(instance=message_data)
+            messages.append(camelize(serializer.data))
+
+        if outbox_enabled():
+            for message in messages:
+                enqueue_notification(message)
+            return
+
+        if NotificationsConfig.get_client() is None:
+            raise RuntimeError("Could not build a client for Notifications API")
+
+        def _send():
+            for message in messages:
+                send_notification.delay(message)
+
+        transaction.on_commit(_send)
@@ -11,6 +11,7 @@ from vng_api_common.serializers import add_choice_values_help_text
 from vng_api_common.validators import IsImmutableValidator, URLValidator
 
 from openzaak.utils.auth import get_auth
+from openzaak.utils.serializer_fields import MainObjectHyperlinkedRelatedField
 from openzaak.utils.validators import (
     LooseFkIsImmutableValidator,
     LooseFkResourceValidator,
@@ -92,6 +93,8 @@ class ObjectTypeOverigeDefinitieSerializer(serializers.Serializer):
 
 
 class ZaakObjectSerializer(PolymorphicSerializer):
+    serializer_related_field = MainObjectHyperlinkedRelatedField
+
     discriminator = Discriminator(
         discriminator_field="object_type",
         mapping={
@@ -32,6 +32,8 @@ from vng_api_common.serializers import (
 from vng_api_common.utils import get_help_text
 from vng_api_common.validators import IsImmutableValidator, UntilNowValidator
 
+from openzaak.components.catalogi.models import StatusType
+from openzaak.components.catalogi.snapshot import get_record
 from openzaak.components.documenten.api.fields import EnkelvoudigInformatieObjectField
 from openzaak.contrib.verzoeken.validators import verzoek_validator
 from openzaak.utils.api import (
@@ -40,8 +42,12 @@ from openzaak.utils.api import (
     create_remote_oio,
 )
 from openzaak.utils.auth import get_auth
+from openzaak.utils.compiled import CompiledRepresentationMixin
 from openzaak.utils.exceptions import DetermineProcessEndDateException
-from openzaak.utils.serializer_fields import FKOrServiceUrlField
+from openzaak.utils.serializer_fields import (
+    FKOrServiceUrlField,
+    MainObjectHyperlinkedRelatedField,
+)
 from openzaak.utils.validators import (
     LooseFkIsImmutableValidator,
     LooseFkResourceValidator,
@@ -172,6 +178,7 @@ class ProcessobjectSerializer(GegevensGroepSerializer):
 
 
 class ZaakSerializer(
+    CompiledRepresentationMixin,
     NestedGegevensGroepMixin,
     NestedCreateMixin,
     NestedUpdateMixin,
@@ -530,6 +537,17 @@ class ZaakSerializer(
 
         return obj
 
+    def reset_created_relations(self, obj: Zaak) -> None:
+        """
+        Undo the optimizations of :meth:`create` for the output serialization, once
+        objects related to the just created zaak were created as well.
+        """
+        for field in ("eigenschappen", "deelzaken"):
+            source_attrs = self.fields[field].source_attrs
+            if source_attrs[-1:] == ["none"]:
+                source_attrs.pop()
+        obj.__dict__.pop("_current_status_uuid", None)
+
 
 class GeoWithinSerializer(serializers.Serializer):
     within = GeometryField(required=False)
@@ -552,7 +570,54 @@ class ZaakZoekSerializer(serializers.Serializer):
         model = Zaak
 
 
-class StatusSerializer(serializers.HyperlinkedModelSerializer):
+class ZaakBatchSerializer(serializers.Serializer):
+    rollen = serializers.ListField(
+        child=serializers.DictField(),
+        required=False,
+        help_text=_(
+            "ROLlen om aan te maken bij de ZAAK, in het formaat van de ROL resource. "
+            "Het attribuut `zaak` wordt afgeleid uit de URL."
+        ),
+    )
+    zaakobjecten = serializers.ListField(
+        child=serializers.DictField(),
+        required=False,
+        help_text=_(
+            "ZAAKOBJECTen om aan te maken bij de ZAAK, in het formaat van de "
+            "ZAAKOBJECT resource. Het attribuut `zaak` wordt afgeleid uit de URL."
+        ),
+    )
+    zaakeigenschappen = serializers.ListField(
+        child=serializers.DictField(),
+        required=False,
+        help_text=_(
+            "ZAAKEIGENSCHAPpen om aan te maken bij de ZAAK, in het formaat van de "
+            "ZAAKEIGENSCHAP resource. Het attribuut `zaak` wordt afgeleid uit de URL."
+        ),
+    )
+    statussen = serializers.ListField(
+        child=serializers.DictField(),
+        required=False,
+        help_text=_(
+            "STATUSsen om aan te maken bij de ZAAK, in het formaat van de STATUS "
+            "resource. Het attribuut `zaak` wordt afgeleid uit de URL. STATUSsen "
+            "worden als laatste aangemaakt."
+        ),
+    )
+
+    def validate(self, attrs):
+        if not any(attrs.values()):
+            raise serializers.ValidationError(
+                _("At least one sub-resource must be provided."), code="empty-batch"
+            )
+        return attrs
+
+
+class StatusSerializer(
+    CompiledRepresentationMixin, serializers.HyperlinkedModelSerializer
+):
+    serializer_related_field = MainObjectHyperlinkedRelatedField
+
     class Meta:
         model = Status
         fields = (
@@ -619,7 +684,11 @@ class StatusSerializer(serializers.HyperlinkedModelSerializer):
         if isinstance(statustype, ProxyMixin):
             attrs["__is_eindstatus"] = statustype._initial_data["is_eindstatus"]
         else:
-            attrs["__is_eindstatus"] = statustype.is_eindstatus()
+            # ⚡️ read from the catalogi snapshot instead of querying the statustypen
+            record = get_record(StatusType, statustype.pk)
+            attrs["__is_eindstatus"] = (
+                record.is_eindstatus if record else statustype.is_eindstatus()
+            )
         return attrs
 
     def validate(self, attrs):
@@ -717,6 +786,8 @@ class StatusSerializer(serializers.HyperlinkedModelSerializer):
 
 
 class ZaakInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
+    serializer_related_field = MainObjectHyperlinkedRelatedField
+
     aard_relatie_weergave = serializers.ChoiceField(
         source="get_aard_relatie_display",
         read_only=True,
@@ -822,7 +893,7 @@ class ZaakInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
 
 class ZaakEigenschapSerializer(NestedHyperlinkedModelSerializer):
     parent_lookup_kwargs = {"zaak_uuid": "zaak__uuid"}
-    zaak = serializers.HyperlinkedRelatedField(
+    zaak = MainObjectHyperlinkedRelatedField(
         queryset=Zaak.objects.all(),
         view_name="zaak-detail",
         lookup_field="uuid",
@@ -864,6 +935,8 @@ class ZaakEigenschapSerializer(NestedHyperlinkedModelSerializer):
 
 
 class KlantContactSerializer(serializers.HyperlinkedModelSerializer):
+    serializer_related_field = MainObjectHyperlinkedRelatedField
+
     class Meta:
         model = KlantContact
         fields = (
@@ -891,7 +964,9 @@ class ContactPersoonRolSerializer(GegevensGroepSerializer):
         gegevensgroep = "contactpersoon_rol"
 
 
-class RolSerializer(PolymorphicSerializer):
+class RolSerializer(CompiledRepresentationMixin, PolymorphicSerializer):
+    serializer_related_field = MainObjectHyperlinkedRelatedField
+
     discriminator = Discriminator(
         discriminator_field="betrokkene_type",
         mapping={
@@ -1014,6 +1089,8 @@ class RolSerializer(PolymorphicSerializer):
 
 
 class ResultaatSerializer(serializers.HyperlinkedModelSerializer):
+    serializer_related_field = MainObjectHyperlinkedRelatedField
+
     class Meta:
         model = Resultaat
         fields = ("url", "uuid", "zaak", "resultaattype", "toelichting")
@@ -1070,6 +1147,8 @@ class ZaakBesluitSerializer(NestedHyperlinkedModelSerializer):
 
 
 class ZaakContactMomentSerializer(serializers.HyperlinkedModelSerializer):
+    serializer_related_field = MainObjectHyperlinkedRelatedField
+
     class Meta:
         model = ZaakContactMoment
         fields = ("url", "uuid", "zaak", "contactmoment")
@@ -1125,6 +1204,8 @@ class ZaakContactMomentSerializer(serializers.HyperlinkedModelSerializer):
 
 
 class ZaakVerzoekSerializer(serializers.HyperlinkedModelSerializer):
+    serializer_related_field = MainObjectHyperlinkedRelatedField
+
     class Meta:
         model = ZaakVerzoek
         fields = ("url", "uuid", "zaak", "verzoek")
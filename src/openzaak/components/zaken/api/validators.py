@@ -148,6 +148,13 @@ class CorrectZaaktypeValidator:
         if not url or not zaak:
             return
 
+        # ⚡️ compare the local types by their foreign keys, without queries
+        zaaktype_id = getattr(url, "zaaktype_id", None)
+        if zaaktype_id is not None and getattr(zaak, "_zaaktype_id", None):
+            if zaaktype_id != zaak._zaaktype_id:
+                raise serializers.ValidationError(self.message, code=self.code)
+            return
+
         if url.zaaktype != zaak.zaaktype:
             raise serializers.ValidationError(self.message, code=self.code)
 
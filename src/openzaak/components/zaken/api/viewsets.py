@@ -15,21 +15,12 @@ from drf_spectacular.utils import (
     extend_schema,
     extend_schema_view,
 )
-from notifications_api_common.viewsets import (
-    NotificationCreateMixin,
-    NotificationDestroyMixin,
-    NotificationViewSetMixin,
-)
 from rest_framework import mixins, serializers, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied, ValidationError
+from rest_framework.response import Response
 from rest_framework.reverse import reverse
 from rest_framework.settings import api_settings
-from vng_api_common.audittrails.viewsets import (
-    AuditTrailCreateMixin,
-    AuditTrailDestroyMixin,
-    AuditTrailViewsetMixin,
-)
 from vng_api_common.caching import conditional_retrieve
 from vng_api_common.filters import Backend
 from vng_api_common.geo import GeoMixin
@@ -38,13 +29,23 @@ from vng_api_common.utils import lookup_kwargs_to_filters
 from vng_api_common.viewsets import CheckQueryParamsMixin, NestedViewSetMixin
 from zgw_consumers.models import Service
 
+from openzaak.audit.viewsets import (
+    AuditTrailCreateMixin,
+    AuditTrailDestroyMixin,
+    AuditTrailViewsetMixin,
+)
+from openzaak.notifications.viewsets import (
+    NotificationCreateMixin,
+    NotificationDestroyMixin,
+    NotificationViewSetMixin,
+)
 from openzaak.utils.api import (
     delete_remote_objectcontactmoment,
     delete_remote_objectverzoek,
     delete_remote_oio,
 )
 from openzaak.utils.data_filtering import ListFilterByAuthorizationsMixin
-from openzaak.utils.mixins import ExpandMixin
+from openzaak.utils.mixins import CompiledRepresentationViewSetMixin, ExpandMixin
 from openzaak.utils.pagination import OptimizedPagination
 from openzaak.utils.permissions import AuthRequired
 from openzaak.utils.schema import (
@@ -70,6 +71,7 @@ from ..models import (
     ZaakVerzoek,
 )
 from .audits import AUDIT_ZRC
+from .batch import ZaakBatch
 from .filters import (
     KlantContactFilter,
     ResultaatFilter,
@@ -100,6 +102,7 @@ from .serializers import (
     ResultaatSerializer,
     RolSerializer,
     StatusSerializer,
+    ZaakBatchSerializer,
     ZaakBesluitSerializer,
     ZaakContactMomentSerializer,
     ZaakEigenschapSerializer,
@@ -155,6 +158,13 @@ ZAAK_UUID_PARAMETER = OpenApiParameter(
             '- `archiefstatus` kan alleen een waarde anders dan "nog_te_archiveren" '
             "hebben indien van alle gerelateeerde INFORMATIEOBJECTen het attribuut "
             '`status` de waarde "gearchiveerd" heeft.'
+            "\n"
+            "**Opmerkingen**\n"
+            "- `status`, `rollen`, `zaakobjecten`, `eigenschappen` en "
+            "`zaakinformatieobjecten` kunnen optioneel inline (als objecten in plaats "
+            "van URL-referenties) meegestuurd worden. Deze worden in dezelfde "
+            "transactie aangemaakt, met dezelfde validaties als bij de afzonderlijke "
+            "endpoints. Het attribuut `zaak` wordt daarbij automatisch gezet."
         ),
     ),
     update=extend_schema(
@@ -227,6 +237,7 @@ ZAAK_UUID_PARAMETER = OpenApiParameter(
 )
 @conditional_retrieve(extra_depends_on={"status"})
 class ZaakViewSet(
+    CompiledRepresentationViewSetMixin,
     ExpandMixin,
     NotificationViewSetMixin,
     AuditTrailViewsetMixin,
@@ -276,6 +287,11 @@ class ZaakViewSet(
         "list": SCOPE_ZAKEN_ALLES_LEZEN,
         "retrieve": SCOPE_ZAKEN_ALLES_LEZEN,
         "_zoek": SCOPE_ZAKEN_ALLES_LEZEN,
+        "_batch": SCOPE_ZAKEN_CREATE
+        | SCOPE_ZAKEN_BIJWERKEN
+        | SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN
+        | SCOPE_STATUSSEN_TOEVOEGEN
+        | SCOPEN_ZAKEN_HEROPENEN,
         "create": SCOPE_ZAKEN_CREATE,
         "update": SCOPE_ZAKEN_BIJWERKEN | SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
         "partial_update": SCOPE_ZAKEN_BIJWERKEN | SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
@@ -284,6 +300,7 @@ class ZaakViewSet(
     notifications_kanaal = KANAAL_ZAKEN
     audit = AUDIT_ZRC
     _generated_identificatie: Optional[ZaakIdentificatie] = None
+    _inline_batch: Optional[ZaakBatch] = None
 
     def get_queryset(self):
         qs = super().get_queryset()
@@ -342,6 +359,52 @@ class ZaakViewSet(
 
     _zoek.is_search_action = True
 
+    @extend_schema(
+        "zaak__batch",
+        summary="Maak meerdere sub-resources van een ZAAK in een keer aan.",
+        description=(
+            "ROLlen, ZAAKOBJECTen, ZAAKEIGENSCHAPpen en STATUSsen van een ZAAK "
+            "worden samen gevalideerd en in een enkele transactie aangemaakt. "
+            "Dezelfde validaties als bij het aanmaken via de afzonderlijke endpoints "
+            "zijn van toepassing.\n"
+            "\n"
+            "**Opmerkingen**\n"
+            "- het attribuut `zaak` wordt afgeleid uit de URL.\n"
+            "- STATUSsen worden als laatste aangemaakt, zodat een eindstatus de ZAAK "
+            "pas afsluit nadat de overige sub-resources zijn aangemaakt.\n"
+            "- sub-resources in dezelfde batch kunnen niet naar elkaar verwijzen."
+        ),
+        request=ZaakBatchSerializer,
+        responses={
+            status.HTTP_201_CREATED: ZaakBatchSerializer,
+            **VALIDATION_ERROR_RESPONSES,
+            **COMMON_ERROR_RESPONSES,
+        },
+    )
+    @action(methods=("post",), detail=True, url_path="_batch", name="zaak__batch")
+    def _batch(self, request, *args, **kwargs):
+        zaak = self.get_object()
+        serializer = ZaakBatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        zaak_url = reverse("zaak-detail", kwargs={"uuid": zaak.uuid}, request=request)
+        batch = ZaakBatch(zaak, zaak_url, request, main_view=self)
+        # order matters - a final status closes the zaak
+        batch.validate(
+            {
+                "rollen": RolViewSet,
+                "zaakobjecten": ZaakObjectViewSet,
+                "zaakeigenschappen": ZaakEigenschapViewSet,
+                "statussen": StatusViewSet,
+            },
+            serializer.validated_data,
+        )
+        with transaction.atomic():
+            results = batch.save()
+            batch.create_audittrails()
+            batch.notify()
+        return Response(results, status=status.HTTP_201_CREATED)
+
     def get_serializer_context(self):
         context = super().get_serializer_context()
         return {
@@ -362,6 +425,58 @@ class ZaakViewSet(
 
         return super().create(request, *args, **kwargs)
 
+    def perform_create(self, serializer):
+        super().perform_create(serializer)
+
+        # the related resources are read-only URL references on the zaak itself,
+        # inline objects are created with their own viewsets after the zaak exists
+        inline_data = {}
+        for key in (
+            "rollen",
+            "zaakobjecten",
+            "eigenschappen",
+            "zaakinformatieobjecten",
+        ):
+            items = self.request.data.get(key)
+            if isinstance(items, list) and items:
+                inline_data[key] = [item for item in items if isinstance(item, dict)]
+        if isinstance(self.request.data.get("status"), dict):
+            inline_data["status"] = [self.request.data["status"]]
+
+        if not any(inline_data.values()):
+            return
+
+        zaak = serializer.instance
+        zaak_url = reverse(
+            "zaak-detail", kwargs={"uuid": zaak.uuid}, request=self.request
+        )
+        batch = ZaakBatch(zaak, zaak_url, self.request, main_view=self)
+        # order matters - the status is set last, a final status closes the zaak
+        batch.validate(
+            {
+                "rollen": RolViewSet,
+                "zaakobjecten": ZaakObjectViewSet,
+                "eigenschappen": ZaakEigenschapViewSet,
+                "zaakinformatieobjecten": ZaakInformatieObjectViewSet,
+                "status": StatusViewSet,
+            },
+            inline_data,
+        )
+        batch.save()
+        self._inline_batch = batch
+        # the response and audit trail show the just created sub-resources
+        serializer.reset_created_relations(zaak)
+
+    def create_audittrail(self, *args, **kwargs):
+        super().create_audittrail(*args, **kwargs)
+        if self._inline_batch is not None:
+            self._inline_batch.create_audittrails()
+
+    def notify(self, *args, **kwargs):
+        super().notify(*args, **kwargs)
+        if self._inline_batch is not None:
+            self._inline_batch.notify()
+
     @transaction.atomic()
     def _generate_zaakidentificatie(self, data: dict):
         serializer = GenerateZaakIdentificatieSerializer(data=data)
@@ -461,6 +576,7 @@ class ZaakViewSet(
 )
 @conditional_retrieve()
 class StatusViewSet(
+    CompiledRepresentationViewSetMixin,
     NotificationCreateMixin,
     AuditTrailCreateMixin,
     CheckQueryParamsMixin,
@@ -931,6 +1047,7 @@ class KlantContactViewSet(
 )
 @conditional_retrieve()
 class RolViewSet(
+    CompiledRepresentationViewSetMixin,
     NotificationCreateMixin,
     NotificationDestroyMixin,
     AuditTrailCreateMixin,
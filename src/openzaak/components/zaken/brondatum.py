@@ -11,6 +11,8 @@ from glom import Path, glom
 from relativedeltafield.utils import parse_relativedelta
 from vng_api_common.constants import BrondatumArchiefprocedureAfleidingswijze
 
+from openzaak.components.catalogi.models import ResultaatType
+from openzaak.components.catalogi.snapshot import get_record
 from openzaak.utils import parse_isodatetime
 from openzaak.utils.exceptions import DetermineProcessEndDateException
 
@@ -26,7 +28,7 @@ class BrondatumCalculator:
         if self.zaak.archiefactiedatum:
             return
 
-        resultaattype = self.zaak.resultaat.resultaattype
+        resultaattype = self.get_resultaattype()
 
         archiefactietermijn = resultaattype.archiefactietermijn
         if not archiefactietermijn:
@@ -57,8 +59,14 @@ class BrondatumCalculator:
 
         return brondatum + archiefactietermijn
 
+    def get_resultaattype(self):
+        resultaat = self.zaak.resultaat
+        # ⚡️ local resultaattypen are read from the catalogi snapshot
+        record = get_record(ResultaatType, resultaat._resultaattype_id)
+        return record or resultaat.resultaattype
+
     def get_archiefnominatie(self) -> str:
-        resultaattype = self.zaak.resultaat.resultaattype
+        resultaattype = self.get_resultaattype()
         return resultaattype.archiefnominatie
 
 
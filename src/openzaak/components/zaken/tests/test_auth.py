@@ -5,13 +5,19 @@ Guarantee that the proper authorization machinery is in place.
 """
 from unittest.mock import patch
 
+from django.db import connection
 from django.test import override_settings, tag
+from django.test.utils import CaptureQueriesContext
 
 from mozilla_django_oidc_db.models import OpenIDConnectConfig
 from rest_framework import status
 from rest_framework.test import APITestCase
 from vng_api_common.authorizations.models import Autorisatie
-from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
+from vng_api_common.constants import (
+    ComponentTypes,
+    VertrouwelijkheidsAanduiding,
+    ZaakobjectTypes,
+)
 from vng_api_common.tests import AuthCheckMixin, reverse
 
 from openzaak.components.autorisaties.models import AutorisatieSpec
@@ -385,6 +391,42 @@ class ZaakObjectTests(JWTAuthMixin, APITestCase):
 
                 self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
+    @override_settings(LINK_FETCHER="vng_api_common.mocks.link_fetcher_200")
+    def test_create_zaakobject_looks_up_zaak_once(self):
+        """
+        Assert that the zaak resolved for the permission checks is re-used.
+        """
+        zaak = ZaakFactory.create(
+            zaaktype=self.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        data = {
+            "zaak": f"http://testserver{reverse(zaak)}",
+            "object": "https://example.com/objecten/1",
+            "objectType": ZaakobjectTypes.overige,
+            "objectTypeOverige": "test",
+            "relatieomschrijving": "test",
+        }
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(reverse("zaakobject-list"), data)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        queries = [query["sql"] for query in context.captured_queries]
+        insert_index = next(
+            index
+            for index, sql in enumerate(queries)
+            if sql.startswith('INSERT INTO "zaken_zaakobject"')
+        )
+        zaak_lookups = [
+            sql
+            for sql in queries[:insert_index]
+            if sql.startswith("SELECT")
+            and 'FROM "zaken_zaak"' in sql
+            and '"zaken_zaak"."uuid" =' in sql
+        ]
+        self.assertEqual(len(zaak_lookups), 1)
+
 
 class ZaakInformatieObjectTests(JWTAuthMixin, APITestCase):
     scopes = [SCOPE_ZAKEN_ALLES_LEZEN, SCOPE_ZAKEN_BIJWERKEN]
@@ -0,0 +1,348 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+import uuid
+from unittest.mock import patch
+
+from django.test import override_settings
+
+import requests_mock
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.constants import (
+    ComponentTypes,
+    RolOmschrijving,
+    RolTypes,
+    VertrouwelijkheidsAanduiding,
+    ZaakobjectTypes,
+)
+from vng_api_common.tests import get_validation_errors, reverse
+from zgw_consumers.constants import APITypes, AuthTypes
+from zgw_consumers.models import Service
+
+from openzaak.components.catalogi.tests.factories import (
+    EigenschapFactory,
+    RolTypeFactory,
+    StatusTypeFactory,
+    ZaakTypeFactory,
+    ZaakTypeInformatieObjectTypeFactory,
+)
+from openzaak.notifications.models import OutboxNotification
+from openzaak.tests.utils import JWTAuthMixin, get_eio_response, mock_drc_oas_get
+
+from ..api.scopes import SCOPE_ZAKEN_ALLES_LEZEN, SCOPE_ZAKEN_BIJWERKEN
+from ..models import Rol, Status, Zaak, ZaakEigenschap, ZaakObject
+from .factories import ZaakFactory
+from .utils import ZAAK_WRITE_KWARGS
+
+BEHANDELAAR = "https://example.com/api/organisatorische-eenheid/1"
+
+
+@override_settings(LINK_FETCHER="vng_api_common.mocks.link_fetcher_200")
+class ZaakBatchTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+        self.zaak = ZaakFactory.create()
+        zaaktype = self.zaak.zaaktype
+        self.roltype = RolTypeFactory.create(
+            zaaktype=zaaktype, omschrijving_generiek=RolOmschrijving.behandelaar
+        )
+        self.statustype = StatusTypeFactory.create(zaaktype=zaaktype)
+        StatusTypeFactory.create(zaaktype=zaaktype)
+        self.eigenschap = EigenschapFactory.create(
+            eigenschapnaam="foobar", zaaktype=zaaktype
+        )
+        self.url = reverse("zaak--batch", kwargs={"uuid": self.zaak.uuid})
+
+    def _get_data(self) -> dict:
+        return {
+            "rollen": [
+                {
+                    "betrokkene": BEHANDELAAR,
+                    "betrokkeneType": RolTypes.organisatorische_eenheid,
+                    "roltype": f"http://testserver{reverse(self.roltype)}",
+                    "roltoelichting": "behandelaar",
+                }
+            ],
+            "zaakobjecten": [
+                {
+                    "object": "https://example.com/objecten/1",
+                    "objectType": ZaakobjectTypes.overige,
+                    "objectTypeOverige": "test",
+                    "relatieomschrijving": "test",
+                },
+                {
+                    "object": "https://example.com/objecten/2",
+                    "objectType": ZaakobjectTypes.overige,
+                    "objectTypeOverige": "test",
+                    "relatieomschrijving": "test",
+                },
+            ],
+            "zaakeigenschappen": [
+                {
+                    "eigenschap": f"http://testserver{reverse(self.eigenschap)}",
+                    "waarde": "overlast_water",
+                }
+            ],
+            "statussen": [
+                {
+                    "statustype": f"http://testserver{reverse(self.statustype)}",
+                    "datumStatusGezet": "2024-01-01T00:00:00",
+                }
+            ],
+        }
+
+    def test_create_batch(self):
+        response = self.client.post(self.url, self._get_data())
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        data = response.json()
+        self.assertEqual(len(data["rollen"]), 1)
+        self.assertEqual(len(data["zaakobjecten"]), 2)
+        self.assertEqual(len(data["zaakeigenschappen"]), 1)
+        self.assertEqual(len(data["statussen"]), 1)
+
+        zaak_url = f"http://testserver{reverse(self.zaak)}"
+        self.assertEqual(data["rollen"][0]["zaak"], zaak_url)
+        self.assertEqual(Rol.objects.filter(zaak=self.zaak).count(), 1)
+        self.assertEqual(ZaakObject.objects.filter(zaak=self.zaak).count(), 2)
+        self.assertEqual(ZaakEigenschap.objects.filter(zaak=self.zaak).count(), 1)
+        self.assertEqual(Status.objects.filter(zaak=self.zaak).count(), 1)
+
+        audittrails = AuditTrail.objects.filter(hoofd_object=zaak_url)
+        self.assertEqual(audittrails.count(), 5)
+        self.assertEqual(
+            set(audittrails.values_list("resource", flat=True)),
+            {"rol", "zaakobject", "zaakeigenschap", "status"},
+        )
+
+    @override_settings(NOTIFICATIONS_DISABLED=False, NOTIFICATIONS_OUTBOX_ENABLED=True)
+    @patch("openzaak.components.zaken.api.batch.NotificationsConfig.get_client")
+    def test_create_batch_notifications(self, mock_get_client):
+        response = self.client.post(self.url, self._get_data())
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        # the client is only needed to send the notifications directly
+        mock_get_client.assert_not_called()
+        messages = OutboxNotification.objects.values_list("message", flat=True)
+        self.assertEqual(len(messages), 5)
+        for message in messages:
+            self.assertEqual(
+                message["kenmerken"],
+                {
+                    "bronorganisatie": self.zaak.bronorganisatie,
+                    "zaaktype": f"http://testserver{reverse(self.zaak.zaaktype)}",
+                    "vertrouwelijkheidaanduiding": (
+                        self.zaak.vertrouwelijkheidaanduiding
+                    ),
+                },
+            )
+
+    def test_create_batch_validation_errors_are_aggregated(self):
+        data = self._get_data()
+        data["zaakobjecten"][1]["objectType"] = "invalid"
+        data["statussen"][0]["statustype"] = "https://example.com/invalid"
+
+        response = self.client.post(self.url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIsNotNone(
+            get_validation_errors(response, "zaakobjecten.1.objectType")
+        )
+        self.assertIsNotNone(get_validation_errors(response, "statussen.0.statustype"))
+        # nothing is created if any of the sub-resources is invalid
+        self.assertFalse(Rol.objects.exists())
+        self.assertFalse(ZaakObject.objects.exists())
+        self.assertFalse(AuditTrail.objects.exists())
+
+    def test_create_empty_batch(self):
+        response = self.client.post(self.url, {})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "nonFieldErrors")
+        self.assertEqual(error["code"], "empty-batch")
+
+
+@override_settings(LINK_FETCHER="vng_api_common.mocks.link_fetcher_200")
+class ZaakCreateInlineTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.zaaktype = ZaakTypeFactory.create(concept=False)
+        cls.roltype = RolTypeFactory.create(
+            zaaktype=cls.zaaktype, omschrijving_generiek=RolOmschrijving.behandelaar
+        )
+        cls.statustype = StatusTypeFactory.create(zaaktype=cls.zaaktype)
+        StatusTypeFactory.create(zaaktype=cls.zaaktype)
+        cls.eigenschap = EigenschapFactory.create(
+            eigenschapnaam="foobar", zaaktype=cls.zaaktype
+        )
+
+    def _get_data(self) -> dict:
+        return {
+            "zaaktype": f"http://testserver{reverse(self.zaaktype)}",
+            "bronorganisatie": "517439943",
+            "verantwoordelijkeOrganisatie": "517439943",
+            "registratiedatum": "2024-01-01",
+            "startdatum": "2024-01-01",
+            "rollen": [
+                {
+                    "betrokkene": BEHANDELAAR,
+                    "betrokkeneType": RolTypes.organisatorische_eenheid,
+                    "roltype": f"http://testserver{reverse(self.roltype)}",
+                    "roltoelichting": "behandelaar",
+                }
+            ],
+            "zaakobjecten": [
+                {
+                    "object": "https://example.com/objecten/1",
+                    "objectType": ZaakobjectTypes.overige,
+                    "objectTypeOverige": "test",
+                    "relatieomschrijving": "test",
+                }
+            ],
+            "eigenschappen": [
+                {
+                    "eigenschap": f"http://testserver{reverse(self.eigenschap)}",
+                    "waarde": "overlast_water",
+                }
+            ],
+            "status": {
+                "statustype": f"http://testserver{reverse(self.statustype)}",
+                "datumStatusGezet": "2024-01-01T00:00:00",
+            },
+        }
+
+    def test_create_zaak_with_inline_resources(self):
+        response = self.client.post(
+            reverse("zaak-list"), self._get_data(), **ZAAK_WRITE_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        zaak = Zaak.objects.get()
+        self.assertEqual(Rol.objects.get().zaak, zaak)
+        self.assertEqual(ZaakObject.objects.get().zaak, zaak)
+        self.assertEqual(ZaakEigenschap.objects.get().zaak, zaak)
+        self.assertEqual(Status.objects.get().zaak, zaak)
+
+        data = response.json()
+        self.assertEqual(len(data["rollen"]), 1)
+        self.assertEqual(len(data["zaakobjecten"]), 1)
+        self.assertEqual(len(data["eigenschappen"]), 1)
+        self.assertIsNotNone(data["status"])
+
+        audittrails = AuditTrail.objects.filter(hoofd_object=data["url"]).order_by("pk")
+        self.assertEqual(
+            list(audittrails.values_list("resource", flat=True)),
+            ["zaak", "rol", "zaakobject", "zaakeigenschap", "status"],
+        )
+
+    def test_create_zaak_invalid_inline_resource_rolls_back(self):
+        data = self._get_data()
+        data["rollen"][0]["roltype"] = "https://example.com/invalid"
+
+        response = self.client.post(reverse("zaak-list"), data, **ZAAK_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIsNotNone(get_validation_errors(response, "rollen.0.roltype"))
+        self.assertFalse(Zaak.objects.exists())
+        self.assertFalse(Status.objects.exists())
+        self.assertFalse(AuditTrail.objects.exists())
+
+    @requests_mock.Mocker()
+    def test_create_zaak_with_inline_external_document(self, m):
+        base = "https://external.documenten.nl/api/v1/"
+        Service.objects.create(
+            api_root=base,
+            api_type=APITypes.drc,
+            label="external documents",
+            auth_type=AuthTypes.no_auth,
+        )
+        ziot = ZaakTypeInformatieObjectTypeFactory.create(
+            zaaktype=self.zaaktype, informatieobjecttype__concept=False
+        )
+        document = f"{base}enkelvoudiginformatieobjecten/{uuid.uuid4()}"
+        mock_drc_oas_get(m)
+        m.get(
+            document,
+            json=get_eio_response(
+                document,
+                informatieobjecttype=(
+                    f"http://testserver{reverse(ziot.informatieobjecttype)}"
+                ),
+            ),
+        )
+        data = {
+            **self._get_data(),
+            "zaakinformatieobjecten": [{"informatieobject": document}],
+        }
+
+        response = self.client.post(reverse("zaak-list"), data, **ZAAK_WRITE_KWARGS)
+
+        # the external Documenten API can't see the relation before it's committed
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(
+            response, "zaakinformatieobjecten.0.informatieobject"
+        )
+        self.assertEqual(error["code"], "external-document")
+        self.assertFalse(Zaak.objects.exists())
+
+    def test_create_zaak_without_inline_resources(self):
+        data = self._get_data()
+        for key in ("rollen", "zaakobjecten", "eigenschappen", "status"):
+            del data[key]
+
+        response = self.client.post(reverse("zaak-list"), data, **ZAAK_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.assertFalse(Rol.objects.exists())
+        self.assertEqual(AuditTrail.objects.count(), 1)
+
+
+class ZaakBatchAuthTests(JWTAuthMixin, APITestCase):
+    scopes = [SCOPE_ZAKEN_ALLES_LEZEN, SCOPE_ZAKEN_BIJWERKEN]
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.openbaar
+    component = ComponentTypes.zrc
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.zaaktype = ZaakTypeFactory.create()
+        super().setUpTestData()
+
+    def test_batch_requires_scopes_for_each_resource(self):
+        zaak = ZaakFactory.create(
+            zaaktype=self.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        statustype = StatusTypeFactory.create(zaaktype=self.zaaktype)
+        url = reverse("zaak--batch", kwargs={"uuid": zaak.uuid})
+
+        response = self.client.post(
+            url,
+            {
+                "statussen": [
+                    {
+                        "statustype": f"http://testserver{reverse(statustype)}",
+                        "datumStatusGezet": "2024-01-01T00:00:00",
+                    }
+                ]
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Status.objects.exists())
+
+    def test_batch_limited_to_authorized_zaken(self):
+        zaak = ZaakFactory.create(
+            zaaktype=self.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.vertrouwelijk,
+        )
+        url = reverse("zaak--batch", kwargs={"uuid": zaak.uuid})
+
+        response = self.client.post(url, {"zaakobjecten": [{"object": "foo"}]})
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
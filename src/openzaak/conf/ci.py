@@ -17,6 +17,7 @@ os.environ.setdefault("ENVIRONMENT", "CI")
 from .includes.base import *  # noqa isort:skip
 
 NOTIFICATIONS_DISABLED = True
+SELECTIELIJST_SYNC_ON_MIGRATE = False
 
 CACHES = {
     "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
@@ -16,9 +16,15 @@ ZAKEN_API_VERSION = "1.5.1"
 REST_FRAMEWORK = BASE_REST_FRAMEWORK.copy()
 REST_FRAMEWORK["PAGE_SIZE"] = 100
 
-REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = REST_FRAMEWORK[
-    "DEFAULT_RENDERER_CLASSES"
-] + ("openzaak.utils.renderers.ProblemJSONRenderer",)
+# ⚡️ drop-in replacement of the camelCase renderer, encoding with orjson if installed
+REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = tuple(
+    (
+        "openzaak.utils.renderers.CamelCaseJSONRenderer"
+        if renderer == "djangorestframework_camel_case.render.CamelCaseJSONRenderer"
+        else renderer
+    )
+    for renderer in REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"]
+) + ("openzaak.utils.renderers.ProblemJSONRenderer",)
 
 REST_FRAMEWORK["DEFAULT_SCHEMA_CLASS"] = "openzaak.utils.schema.AutoSchema"
 
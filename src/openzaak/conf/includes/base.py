@@ -35,10 +35,29 @@ DATABASES = {
 GEOS_LIBRARY_PATH = config("GEOS_LIBRARY_PATH", None)
 GDAL_LIBRARY_PATH = config("GDAL_LIBRARY_PATH", None)
 
-CACHES["import_requests"] = {
-    "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-    "LOCATION": "import_requests",
-}
+# Maximum number of responses kept in the cache for the requests made when importing
+# catalogi, the entries closest to their expiry are evicted first
+IMPORT_REQUESTS_CACHE_MAX_ENTRIES = config("IMPORT_REQUESTS_CACHE_MAX_ENTRIES", 10000)
+# ⚡️ a shared cache lets the workers of an import (and concurrent imports) reuse
+# the responses of each other
+IMPORT_REQUESTS_CACHE = config("IMPORT_REQUESTS_CACHE", "")
+
+if IMPORT_REQUESTS_CACHE:
+    CACHES["import_requests"] = {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": f"redis://{IMPORT_REQUESTS_CACHE}",
+        "KEY_PREFIX": "import_requests",
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            "IGNORE_EXCEPTIONS": True,
+        },
+    }
+else:
+    CACHES["import_requests"] = {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "import_requests",
+        "OPTIONS": {"MAX_ENTRIES": IMPORT_REQUESTS_CACHE_MAX_ENTRIES},
+    }
 
 #
 # APPLICATIONS enabled for this project
@@ -71,6 +90,7 @@ INSTALLED_APPS = (
         "openzaak.config",
         "openzaak.selectielijst",
         "openzaak.notifications",
+        "openzaak.audit",
     ]
     + PLUGIN_INSTALLED_APPS
 )
@@ -229,7 +249,23 @@ CELERY_BEAT_SCHEDULE = {
     "daily-remove-imports": {
         "task": "openzaak.import_data.tasks.remove_imports",
         "schedule": crontab(hour="9"),
-    }
+    },
+    "dispatch-notifications": {
+        "task": "openzaak.notifications.tasks.dispatch_notifications",
+        "schedule": crontab(),
+    },
+    "write-audittrails": {
+        "task": "openzaak.audit.tasks.write_audittrails",
+        "schedule": crontab(),
+    },
+    "refresh-etags": {
+        "task": "openzaak.utils.tasks.refresh_etags",
+        "schedule": crontab(minute="*/15"),
+    },
+    "sync-selectielijst": {
+        "task": "openzaak.selectielijst.tasks.sync_selectielijst",
+        "schedule": crontab(hour="3", minute="0"),
+    },
 }
 
 #
@@ -239,6 +275,28 @@ CELERY_BEAT_SCHEDULE = {
 
 STORE_FAILED_NOTIFS = True
 
+# Deliver notifications through the transactional outbox
+NOTIFICATIONS_OUTBOX_ENABLED = config("NOTIFICATIONS_OUTBOX_ENABLED", default=False)
+NOTIFICATIONS_OUTBOX_BATCH_SIZE = config("NOTIFICATIONS_OUTBOX_BATCH_SIZE", 100)
+NOTIFICATIONS_OUTBOX_CONCURRENCY = config("NOTIFICATIONS_OUTBOX_CONCURRENCY", 4)
+NOTIFICATIONS_OUTBOX_CLAIM_TIMEOUT = config("NOTIFICATIONS_OUTBOX_CLAIM_TIMEOUT", 300)
+# Number of concurrent requests when resending failed notifications in bulk
+NOTIFICATIONS_RESEND_CONCURRENCY = config("NOTIFICATIONS_RESEND_CONCURRENCY", 4)
+
+# Schedule the sync of the empty Selectielijst mirror after migrating
+SELECTIELIJST_SYNC_ON_MIGRATE = config("SELECTIELIJST_SYNC_ON_MIGRATE", default=True)
+
+# Store the audit trail entries of updates as changes instead of full representations
+AUDIT_TRAIL_COMPACT = config("AUDIT_TRAIL_COMPACT", default=False)
+AUDIT_TRAIL_SNAPSHOT_INTERVAL = config("AUDIT_TRAIL_SNAPSHOT_INTERVAL", 10)
+# Write the audit trail entries from the API in the background
+AUDIT_TRAIL_ASYNC = config("AUDIT_TRAIL_ASYNC", default=False)
+AUDIT_TRAIL_OUTBOX_BATCH_SIZE = config("AUDIT_TRAIL_OUTBOX_BATCH_SIZE", 500)
+
+# Clear the ETag values of changed resources instead of recalculating them
+ETAG_DEFERRED = config("ETAG_DEFERRED", default=False)
+ETAG_SWEEP_BATCH_SIZE = config("ETAG_SWEEP_BATCH_SIZE", 1000)
+
 # Expiry time in seconds for JWT
 JWT_EXPIRY = config("JWT_EXPIRY", default=3600)
 # leeway when comparing timestamps - non-zero value account for clock drift
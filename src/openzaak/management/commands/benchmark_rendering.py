@@ -0,0 +1,135 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+import statistics
+import time
+from typing import Callable, Dict, List
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+from django.test import RequestFactory
+
+from djangorestframework_camel_case.render import (
+    CamelCaseJSONRenderer as LibraryCamelCaseJSONRenderer,
+)
+from rest_framework.request import Request
+from rest_framework.versioning import URLPathVersioning
+
+from openzaak.components.catalogi.api.viewsets import ZaakTypeViewSet
+from openzaak.components.documenten.api.viewsets import (
+    EnkelvoudigInformatieObjectViewSet,
+)
+from openzaak.components.zaken.api.viewsets import ZaakViewSet
+from openzaak.utils import renderers
+from openzaak.utils.compiled import COMPILED_REPRESENTATION
+from openzaak.utils.renderers import CamelCaseJSONRenderer
+
+RESOURCES = {
+    "zaken": ZaakViewSet,
+    "documenten": EnkelvoudigInformatieObjectViewSet,
+    "zaaktypen": ZaakTypeViewSet,
+}
+
+
+def _get_request(host: str) -> Request:
+    request = Request(RequestFactory().get("/", HTTP_HOST=host))
+    request.version = "1"
+    request.versioning_scheme = URLPathVersioning()
+    return request
+
+
+def _time(render: Callable[[], bytes], repeat: int) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the serialization and rendering of a page of zaken, documenten "
+        "and zaaktypen, comparing the generic serializers and the camelCase renderer "
+        "of djangorestframework-camel-case with the compiled serializers and the "
+        "Open Zaak renderer. Uses the existing data, see 'generate_data'."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--resource",
+            action="append",
+            dest="resources",
+            choices=list(RESOURCES),
+            help="Only benchmark this resource. Can be repeated.",
+        )
+        parser.add_argument(
+            "--page-size",
+            type=int,
+            default=settings.REST_FRAMEWORK["PAGE_SIZE"],
+            help="Number of objects on the page.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=20,
+            help="Number of times each page is rendered.",
+        )
+        parser.add_argument(
+            "--host",
+            default=next(
+                (host for host in settings.ALLOWED_HOSTS if "*" not in host),
+                "localhost",
+            ),
+            help="Host of the URLs in the responses.",
+        )
+
+    def handle(self, **options):
+        request = _get_request(options["host"])
+        self.stdout.write(
+            f"orjson: {'installed' if renderers.orjson else 'not installed'}"
+        )
+
+        for name in options["resources"] or RESOURCES:
+            viewset = RESOURCES[name]
+            # the queries are done once, only the rendering is measured
+            page = list(viewset.queryset[: options["page_size"]])
+            if not page:
+                self.stderr.write(f"No {name} to render, skipping.")
+                continue
+
+            paths = self.get_paths(viewset, page, request)
+            outputs = {label: render() for label, render in paths.items()}
+            if len(set(outputs.values())) != 1:
+                raise CommandError(f"The rendered {name} are not identical.")
+
+            self.stdout.write(f"\n{name} ({len(page)} per page):")
+            results = {
+                label: _time(render, options["repeat"])
+                for label, render in paths.items()
+            }
+            baseline = statistics.median(next(iter(results.values())))
+            for label, timings in results.items():
+                median = statistics.median(timings)
+                self.stdout.write(
+                    f"  {label:<10} median {median * 1000:8.2f} ms, "
+                    f"min {min(timings) * 1000:8.2f} ms "
+                    f"({baseline / median:.2f}x)"
+                )
+
+    def get_paths(
+        self, viewset, page: list, request: Request
+    ) -> Dict[str, Callable[[], bytes]]:
+        serializer_class = viewset.serializer_class
+
+        def _render(renderer, compiled: bool) -> Callable[[], bytes]:
+            def render() -> bytes:
+                context = {"request": request, COMPILED_REPRESENTATION: compiled}
+                serializer = serializer_class(page, many=True, context=context)
+                return renderer.render({"results": serializer.data})
+
+            return render
+
+        return {
+            "library": _render(LibraryCamelCaseJSONRenderer(), compiled=False),
+            "openzaak": _render(CamelCaseJSONRenderer(), compiled=True),
+        }
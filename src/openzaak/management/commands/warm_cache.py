@@ -1,13 +1,68 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2022 Dimpact
-from django.core.management import BaseCommand
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Deque, Iterator, List, Tuple
+
+from django.core.cache import cache
+from django.core.management import BaseCommand, CommandError
+from django.db import connections
 
 from openzaak.api_standards import SPECIFICATIONS
+from openzaak.utils.etags import calculate_etags, get_etag_models
+
+
+def _chunked(iterator: Iterator[int], size: int) -> Iterator[List[int]]:
+    chunk = []
+    for pk in iterator:
+        chunk.append(pk)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
 
 
 class Command(BaseCommand):
     help = "Populate any and all Open Zaak caches"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--etags",
+            action="store_true",
+            help="Also calculate the missing ETag values of the API resources.",
+        )
+        parser.add_argument(
+            "--recalculate",
+            action="store_true",
+            help=(
+                "Recalculate all ETag values instead of only the missing ones. An "
+                "interrupted run continues where it stopped."
+            ),
+        )
+        parser.add_argument(
+            "--model",
+            action="append",
+            dest="models",
+            metavar="APP_LABEL.MODEL",
+            help="Only calculate the ETag values of this model. Can be repeated.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Number of ETag values to calculate and store per batch.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count(),
+            help="Number of worker processes, 0 calculates in the current process.",
+        )
+
     def handle(self, **options):
         verbosity = options["verbosity"]
 
@@ -26,3 +81,92 @@ class Command(BaseCommand):
                     self.stdout.write(
                         self.style.SUCCESS(f"API spec for '{standard.alias}' written.")
                     )
+
+        if options["etags"]:
+            self.warm_etags(**options)
+
+    def warm_etags(self, models, recalculate, chunk_size, workers, verbosity, **opts):
+        etag_models = {model._meta.label_lower: model for model in get_etag_models()}
+        if models:
+            unknown = {label.lower() for label in models} - set(etag_models)
+            if unknown:
+                raise CommandError(
+                    f"Models without ETag values: {', '.join(sorted(unknown))}"
+                )
+            etag_models = {
+                label.lower(): etag_models[label.lower()] for label in models
+            }
+
+        executor = None
+        if workers:
+            # the forked worker processes must not share the database connections of
+            # this process, so they are started before any new connection is opened
+            connections.close_all()
+            executor = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("fork")
+            )
+            executor.submit(int).result()
+
+        try:
+            for label, model in etag_models.items():
+                if verbosity > 0:
+                    self.stdout.write(f"Calculating ETag values of '{label}'...")
+                count, duration = self.warm_model_etags(
+                    model, executor, recalculate, chunk_size, workers
+                )
+                if verbosity > 0:
+                    rate = count / duration if duration else 0
+                    self.stdout.write(
+                        self.style.SUCCESS(
+                            f"Calculated {count} ETag values of '{label}' "
+                            f"in {duration:.1f}s ({rate:.0f}/s)."
+                        )
+                    )
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    def warm_model_etags(
+        self, model, executor, recalculate: bool, chunk_size: int, workers: int
+    ) -> Tuple[int, float]:
+        label = model._meta.label
+        progress_key = f"warm_cache:etags:{label}"
+
+        queryset = model._default_manager.order_by("pk")
+        if recalculate:
+            # continue after the last batch an earlier run completed
+            last_pk = cache.get(progress_key)
+            if last_pk is not None:
+                queryset = queryset.filter(pk__gt=last_pk)
+        else:
+            # missing values are calculated only once, so a new run just continues
+            queryset = queryset.filter(_etag="")
+
+        start = time.monotonic()
+        count = 0
+        pks = queryset.values_list("pk", flat=True).iterator(chunk_size=chunk_size)
+
+        def _completed(chunk: List[int], result) -> None:
+            nonlocal count
+            count += result
+            if recalculate:
+                cache.set(progress_key, chunk[-1], timeout=None)
+
+        # in-flight batches, in order, so the progress only moves past completed ones
+        pending: Deque[Tuple[List[int], Future]] = deque()
+        for chunk in _chunked(pks, chunk_size):
+            if executor is None:
+                _completed(chunk, calculate_etags(label, chunk))
+                continue
+
+            pending.append((chunk, executor.submit(calculate_etags, label, chunk)))
+            if len(pending) >= workers * 2:
+                chunk, future = pending.popleft()
+                _completed(chunk, future.result())
+
+        while pending:
+            chunk, future = pending.popleft()
+            _completed(chunk, future.result())
+
+        cache.delete(progress_key)
+        return count, time.monotonic() - start
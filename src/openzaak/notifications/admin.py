@@ -1,8 +1,11 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2020 Dimpact
 import logging
+from typing import Any, Dict
 
-from django.contrib import admin
+from django.contrib import admin, messages
+from django.contrib.admin.utils import prepare_lookup_value
+from django.contrib.admin.views.main import IGNORED_PARAMS, PAGE_VAR, SEARCH_VAR
 from django.db import transaction
 from django.db.models import QuerySet
 from django.http import HttpRequest
@@ -10,8 +13,9 @@ from django.urls import reverse
 from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 
-from .models import FailedNotification
+from .models import FailedNotification, OutboxNotification
 from .resend import ResendFailure, resend_notification
+from .tasks import resend_failed_notifications
 
 logger = logging.getLogger(__name__)
 
@@ -35,13 +39,60 @@ def resend_notifications(
                 continue
 
 
+def _get_resend_filters(
+    modeladmin: admin.ModelAdmin, request: HttpRequest, queryset: QuerySet
+) -> Dict[str, Any]:
+    """
+    Return the filters of the notifications to resend, small enough to be passed to
+    the background task.
+    """
+    if request.POST.get("select_across") != "1":
+        # the selected rows are limited to a single page of the changelist
+        return {"pk__in": list(queryset.values_list("pk", flat=True))}
+
+    # all the rows matching the filters of the changelist
+    filters = {
+        key: prepare_lookup_value(key, value)
+        for key, value in request.GET.items()
+        if key not in IGNORED_PARAMS and key != PAGE_VAR
+    }
+    search_term = request.GET.get(SEARCH_VAR)
+    if search_term:
+        # the admin searches in a single field, see ``FailedNotificationAdmin``
+        (search_field,) = modeladmin.get_search_fields(request)
+        filters[f"{search_field}__icontains"] = search_term
+    return filters
+
+
+@admin.action(description=_("Resend %(verbose_name_plural)s in the background"))
+def resend_notifications_in_background(
+    modeladmin: admin.ModelAdmin, request: HttpRequest, queryset: QuerySet
+) -> None:
+    count = queryset.filter(retried_at__isnull=True).count()
+    if not count:
+        modeladmin.message_user(
+            request, _("There are no notifications to resend."), messages.WARNING
+        )
+        return
+
+    # ⚡️ the task walks the matching rows in chunks, instead of receiving every pk
+    resend_failed_notifications.delay(
+        _get_resend_filters(modeladmin, request, queryset)
+    )
+    modeladmin.message_user(
+        request,
+        _("Scheduled the resend of {count} notification(s).").format(count=count),
+        messages.SUCCESS,
+    )
+
+
 @admin.register(FailedNotification)
 class FailedNotificationAdmin(admin.ModelAdmin):
     list_display = ("msg", "kanaal", "aanmaakdatum", "retried_at", "statuslog")
     list_filter = ("retried_at",)
     date_hierarchy = "create_datetime"
     search_fields = ("message__kanaal",)
-    actions = [resend_notifications]
+    actions = [resend_notifications, resend_notifications_in_background]
 
     def kanaal(self, obj) -> str:
         return obj.message["kanaal"]
@@ -54,3 +105,11 @@ class FailedNotificationAdmin(admin.ModelAdmin):
             "admin:django_db_logger_statuslog_change", args=(obj.statuslog_ptr_id,)
         )
         return format_html('<a href="{href}">Log entry</a>', href=href)
+
+
+@admin.register(OutboxNotification)
+class OutboxNotificationAdmin(admin.ModelAdmin):
+    list_display = ("kanaal", "created_at", "attempts", "next_attempt_at")
+    list_filter = ("kanaal",)
+    date_hierarchy = "created_at"
+    readonly_fields = ("kanaal", "message", "created_at", "attempts")
@@ -0,0 +1,63 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+# Generated by Django 4.2.15 on 2024-09-02 10:12
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications_log", "0004_alter_failednotification_status_code"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OutboxNotification",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("kanaal", models.CharField(max_length=50, verbose_name="kanaal")),
+                (
+                    "message",
+                    models.JSONField(
+                        help_text="Content of the notification to send.",
+                        verbose_name="notification message",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="created at"),
+                ),
+                (
+                    "attempts",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Number of failed delivery attempts.",
+                        verbose_name="attempts",
+                    ),
+                ),
+                (
+                    "next_attempt_at",
+                    models.DateTimeField(
+                        db_index=True,
+                        default=django.utils.timezone.now,
+                        help_text="The notification is not sent before this moment.",
+                        verbose_name="next attempt at",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "outbox notification",
+                "verbose_name_plural": "outbox notifications",
+            },
+        ),
+    ]
@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2020 Dimpact
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from django_db_logger.models import StatusLog
@@ -39,3 +40,37 @@ class FailedNotification(StatusLog):
     @property
     def retried(self) -> bool:
         return self.retried_at is not None
+
+
+class OutboxNotification(models.Model):
+    """
+    A notification waiting to be delivered to the Notifications API.
+
+    Outbox entries are written in the same database transaction as the change they
+    describe and are removed by the dispatcher once they have been delivered.
+    """
+
+    kanaal = models.CharField(_("kanaal"), max_length=50)
+    message = models.JSONField(
+        _("notification message"),
+        help_text=_("Content of the notification to send."),
+    )
+    created_at = models.DateTimeField(_("created at"), auto_now_add=True)
+    attempts = models.PositiveIntegerField(
+        _("attempts"),
+        default=0,
+        help_text=_("Number of failed delivery attempts."),
+    )
+    next_attempt_at = models.DateTimeField(
+        _("next attempt at"),
+        default=timezone.now,
+        db_index=True,
+        help_text=_("The notification is not sent before this moment."),
+    )
+
+    class Meta:
+        verbose_name = _("outbox notification")
+        verbose_name_plural = _("outbox notifications")
+
+    def __str__(self):
+        return f"{self.kanaal} ({self.pk})"
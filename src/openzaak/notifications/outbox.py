@@ -0,0 +1,212 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+"""
+Transactional outbox for notifications.
+
+Instead of scheduling a Celery task per message after the transaction commits, the
+notification is stored in the database as part of the transaction that made the
+change. The dispatcher picks up the stored notifications in batches and delivers
+them, so the API response never waits for (or fails because of) the Notifications
+API.
+
+Within a kanaal the notifications are delivered in the order they were created,
+different kanalen are delivered concurrently.
+
+The dispatcher claims a batch of notifications in a short transaction by moving
+their next attempt past a claim timeout, and delivers them after the commit, so no
+rows are locked and no transaction is open while waiting for the Notifications API.
+A dispatcher that dies while delivering leaves its notifications to be picked up
+again after the claim timeout.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from itertools import groupby
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, Min, OuterRef
+from django.utils import timezone
+
+import requests
+from celery.utils.time import get_exponential_backoff_interval
+from notifications_api_common.models import NotificationsConfig
+from zds_client import ClientError
+
+from .models import OutboxNotification
+
+logger = logging.getLogger(__name__)
+
+# use the same logger as the notifications library, so that undeliverable messages
+# end up as FailedNotification records
+notifs_logger = logging.getLogger("notifications_api_common.tasks")
+
+
+def outbox_enabled() -> bool:
+    return settings.NOTIFICATIONS_OUTBOX_ENABLED
+
+
+def _wake_up_dispatcher() -> None:
+    from .tasks import dispatch_notifications
+
+    dispatch_notifications.delay()
+
+
+def _schedule_dispatch() -> None:
+    connection = transaction.get_connection()
+    # ⚡️ a single dispatch per transaction, however many notifications it stores.
+    # Callbacks of rolled back (savepoints of) transactions are discarded by Django,
+    # so these don't prevent a later dispatch.
+    if connection.in_atomic_block and any(
+        callback[1] is _wake_up_dispatcher for callback in connection.run_on_commit
+    ):
+        return
+    transaction.on_commit(_wake_up_dispatcher)
+
+
+def enqueue_notification(message: dict) -> OutboxNotification:
+    """
+    Store the message in the outbox and wake up the dispatcher after the commit.
+    """
+    entry = OutboxNotification.objects.create(kanaal=message["kanaal"], message=message)
+    _schedule_dispatch()
+    return entry
+
+
+def _deliver(
+    client, entries: List[OutboxNotification]
+) -> Tuple[List[int], Optional[str]]:
+    """
+    Deliver the notifications of a single kanaal in order.
+
+    Delivery stops at the first failure, so that the remaining notifications of
+    the kanaal are not delivered before the failed one.
+    """
+    delivered = []
+    for entry in entries:
+        try:
+            client.create("notificaties", entry.message)
+        except (ClientError, requests.RequestException) as exc:
+            return delivered, str(exc)
+        delivered.append(entry.pk)
+    return delivered, None
+
+
+def dispatch_outbox(batch_size: Optional[int] = None) -> int:
+    """
+    Deliver a batch of due notifications from the outbox.
+
+    The batch is claimed with ``SKIP LOCKED``, so multiple dispatchers can run at
+    the same time without delivering a notification twice. The notifications are
+    delivered after the claim is committed.
+
+    :return: the number of delivered notifications
+    """
+    config = NotificationsConfig.get_solo()
+    service = config.notifications_api_service
+    if service is None:
+        logger.warning(
+            "Could not build a client for Notifications API, not sending messages"
+        )
+        return 0
+
+    batch_size = batch_size or settings.NOTIFICATIONS_OUTBOX_BATCH_SIZE
+    now = timezone.now()
+
+    # a notification waits for the earlier notifications of its kanaal that are
+    # backed off or claimed by another dispatcher
+    waiting = OutboxNotification.objects.filter(
+        kanaal=OuterRef("kanaal"), pk__lt=OuterRef("pk"), next_attempt_at__gt=now
+    )
+    with transaction.atomic():
+        entries = list(
+            OutboxNotification.objects.select_for_update(skip_locked=True)
+            .filter(next_attempt_at__lte=now)
+            .exclude(Exists(waiting))
+            .order_by("kanaal", "pk")[:batch_size]
+        )
+        # earlier notifications that are locked by another dispatcher (which is
+        # still claiming them) are skipped rather than excluded above, so the
+        # notifications of a kanaal are only delivered if the batch starts at the
+        # first notification of the kanaal
+        selected_first_pks: Dict[str, int] = {}
+        for entry in entries:
+            selected_first_pks.setdefault(entry.kanaal, entry.pk)
+        first_pks = dict(
+            OutboxNotification.objects.filter(kanaal__in=selected_first_pks)
+            .values("kanaal")
+            .annotate(first_pk=Min("pk"))
+            .values_list("kanaal", "first_pk")
+        )
+        entries = [
+            entry
+            for entry in entries
+            if first_pks[entry.kanaal] == selected_first_pks[entry.kanaal]
+        ]
+        if not entries:
+            return 0
+
+        # claim the batch, the other dispatchers skip notifications that are not due
+        OutboxNotification.objects.filter(
+            pk__in=[entry.pk for entry in entries]
+        ).update(
+            next_attempt_at=now
+            + timedelta(seconds=settings.NOTIFICATIONS_OUTBOX_CLAIM_TIMEOUT)
+        )
+
+    per_kanaal: Dict[str, List[OutboxNotification]] = {
+        kanaal: list(group)
+        for kanaal, group in groupby(entries, key=lambda entry: entry.kanaal)
+    }
+    # one client (and connection pool) per kanaal, built outside the worker
+    # threads so these don't need their own database connections
+    clients = [service.build_client() for _ in per_kanaal]
+    with ThreadPoolExecutor(
+        max_workers=settings.NOTIFICATIONS_OUTBOX_CONCURRENCY
+    ) as executor:
+        results = list(executor.map(_deliver, clients, per_kanaal.values()))
+
+    delivered_ids = []
+    to_update, undeliverable = [], []
+    for kanaal_entries, (delivered, error) in zip(per_kanaal.values(), results):
+        delivered_ids += delivered
+        if error is None:
+            continue
+
+        pending = kanaal_entries[len(delivered) :]
+        failed, *blocked = pending
+        failed.attempts += 1
+        if failed.attempts > config.notification_delivery_max_retries:
+            notifs_logger.warning(
+                "Could not deliver message to %s: %s",
+                service.api_root,
+                error,
+                extra={"notification_msg": failed.message, "final_try": True},
+            )
+            undeliverable.append(failed.pk)
+            failed = None
+        else:
+            countdown = get_exponential_backoff_interval(
+                factor=config.notification_delivery_retry_backoff or 1,
+                retries=failed.attempts - 1,
+                maximum=config.notification_delivery_retry_backoff_max,
+            )
+            failed.next_attempt_at = now + timedelta(seconds=countdown)
+            to_update.append(failed)
+
+        # keep the order within the kanaal - the blocked notifications wait for
+        # the failed one
+        for entry in blocked:
+            entry.next_attempt_at = (
+                failed.next_attempt_at if failed is not None else now
+            )
+            to_update.append(entry)
+
+    with transaction.atomic():
+        OutboxNotification.objects.filter(pk__in=delivered_ids + undeliverable).delete()
+        OutboxNotification.objects.bulk_update(
+            to_update, fields=["attempts", "next_attempt_at"]
+        )
+
+    return len(delivered_ids)
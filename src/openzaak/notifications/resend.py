@@ -1,15 +1,22 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2020 Dimpact
 import logging
+import queue
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
 
+from django.conf import settings
+from django.db.models import QuerySet
 from django.utils import timezone
 
+import requests
 from notifications_api_common.models import NotificationsConfig
 from zds_client import ClientError
 
 from .models import FailedNotification
 
+logger = logging.getLogger(__name__)
 notifs_logger = logging.getLogger("notifications_api_common.tasks")
 
 
@@ -47,3 +54,92 @@ def resend_notification(notification: FailedNotification) -> None:
     finally:
         notification.retried_at = timezone.now()
         notification.save()
+
+
+def bulk_resend_notifications(
+    queryset: QuerySet,
+    chunk_size: int = 500,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> int:
+    """
+    Resend the not-retried failed notifications in the queryset.
+
+    The notifications are processed in chunks of primary keys. Within a chunk, they
+    are sent concurrently by a small pool of clients, and the ``retried_at`` of the
+    whole chunk is updated with a single query. Resends that fail on the
+    Notifications API (HTTP or connection errors) are logged again, exactly like
+    :func:`resend_notification`. Other failures leave the notification unretried.
+
+    :param progress: optional callback, called with the number of processed and
+      the total number of notifications after every chunk.
+    :return: the number of processed notifications
+    """
+    config = NotificationsConfig.get_solo()
+    service = config.notifications_api_service
+    if service is None:
+        raise ResendFailure("The Notifications API is not configured")
+
+    queryset = queryset.filter(retried_at__isnull=True)
+    # failed resends are logged as new records - don't pick those up in this run
+    last_pk = queryset.order_by("-pk").values_list("pk", flat=True).first()
+    if last_pk is None:
+        return 0
+    queryset = queryset.filter(pk__lte=last_pk).order_by("pk")
+    total = queryset.count()
+
+    concurrency = settings.NOTIFICATIONS_RESEND_CONCURRENCY
+    clients = queue.SimpleQueue()
+    for _ in range(concurrency):
+        clients.put(service.build_client())
+
+    def _send(message: dict) -> Optional[Exception]:
+        client = clients.get()
+        try:
+            client.create("notificaties", message)
+        except Exception as exc:
+            return exc
+        finally:
+            clients.put(client)
+
+    processed, last_seen = 0, 0
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        while True:
+            chunk = list(
+                queryset.filter(pk__gt=last_seen).values_list("pk", "message")[
+                    :chunk_size
+                ]
+            )
+            if not chunk:
+                break
+
+            pks, messages = zip(*chunk)
+            retried = []
+            # the worker threads only do the HTTP calls, failures are logged (and
+            # thus written to the database) from this thread
+            for pk, message, error in zip(pks, messages, executor.map(_send, messages)):
+                if error is None:
+                    retried.append(pk)
+                elif isinstance(error, (ClientError, requests.RequestException)):
+                    # including connection errors and timeouts - logged as a new
+                    # failed notification to retry later
+                    notifs_logger.warning(
+                        "Could not deliver message to %s",
+                        service.api_root,
+                        exc_info=error,
+                        extra={"notification_msg": message, "final_try": True},
+                    )
+                    retried.append(pk)
+                else:
+                    # not logged again, so the notification stays available for
+                    # another resend
+                    logger.error("Resend of notification %d failed", pk, exc_info=error)
+            FailedNotification.objects.filter(pk__in=retried).update(
+                retried_at=timezone.now()
+            )
+
+            processed += len(pks)
+            last_seen = pks[-1]
+            if progress is not None:
+                progress(processed, total)
+
+    return processed
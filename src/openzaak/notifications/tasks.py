@@ -0,0 +1,34 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+import logging
+
+from openzaak import celery_app
+
+from .models import FailedNotification
+from .outbox import dispatch_outbox
+from .resend import bulk_resend_notifications
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task()
+def dispatch_notifications():
+    delivered = dispatch_outbox()
+    if delivered:
+        logger.info("Delivered %d notification(s) from the outbox", delivered)
+
+
+@celery_app.task(bind=True)
+def resend_failed_notifications(self, filters: dict):
+    """
+    Resend the failed notifications matching the queryset ``filters``.
+    """
+
+    def report_progress(processed: int, total: int) -> None:
+        logger.info("Resent %d of %d failed notification(s)", processed, total)
+        self.update_state(
+            state="PROGRESS", meta={"processed": processed, "total": total}
+        )
+
+    queryset = FailedNotification.objects.filter(**filters)
+    return bulk_resend_notifications(queryset, progress=report_progress)
@@ -23,3 +23,13 @@ class FailedNotificationFactory(factory.django.DjangoModelFactory):
 
     class Meta:
         model = "notifications_log.FailedNotification"
+
+
+class OutboxNotificationFactory(factory.django.DjangoModelFactory):
+    kanaal = "zaken"
+    message = factory.LazyAttribute(
+        lambda o: {**FailedNotificationFactory.message, "kanaal": o.kanaal}
+    )
+
+    class Meta:
+        model = "notifications_log.OutboxNotification"
@@ -4,6 +4,7 @@
 Test that notifications can be send again through the admin.
 """
 from typing import List
+from unittest.mock import patch
 
 from django.urls import reverse
 from django.utils import timezone
@@ -129,3 +130,46 @@ class FailedNotificationAdminTests(NotificationsConfigMixin, WebTest):
 
         qs = FailedNotification.objects.filter(retried_at__isnull=True)
         self.assertFalse(qs.exists())
+
+    @patch("openzaak.notifications.admin.resend_failed_notifications.delay")
+    def test_resend_in_background(self, m, mock_resend):
+        fn1 = FailedNotificationFactory.create(retried_at=None)
+        FailedNotificationFactory.create(retried_at=timezone.now())
+        response = self.app.get(self.url)
+        form = response.forms["changelist-form"]
+        form["action"].select("resend_notifications_in_background")
+        form["select_across"] = "1"
+
+        response = form.submit("index")
+
+        self.assertEqual(response.status_code, 302)
+        # the task receives the filters of the changelist instead of the selected pks
+        mock_resend.assert_called_once_with({})
+        self.assertFalse(m.called)
+        self.assertIsNone(FailedNotification.objects.get(pk=fn1.pk).retried_at)
+
+    @patch("openzaak.notifications.admin.resend_failed_notifications.delay")
+    def test_resend_in_background_filtered(self, m, mock_resend):
+        FailedNotificationFactory.create(retried_at=None)
+        response = self.app.get(self.url, {"retried_at__isnull": "True", "q": "zaken"})
+        form = response.forms["changelist-form"]
+        form["action"].select("resend_notifications_in_background")
+        form["select_across"] = "1"
+
+        form.submit("index")
+
+        mock_resend.assert_called_once_with(
+            {"retried_at__isnull": True, "message__kanaal__icontains": "zaken"}
+        )
+
+    @patch("openzaak.notifications.admin.resend_failed_notifications.delay")
+    def test_resend_in_background_selection(self, m, mock_resend):
+        fn1, _fn2 = FailedNotificationFactory.create_batch(2, retried_at=None)
+        response = self.app.get(self.url)
+        form = response.forms["changelist-form"]
+        form["action"].select("resend_notifications_in_background")
+        form.set("_selected_action", index=0, value=fn1.pk)
+
+        form.submit("index")
+
+        mock_resend.assert_called_once_with({"pk__in": [fn1.pk]})
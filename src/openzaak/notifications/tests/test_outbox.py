@@ -0,0 +1,170 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.db import transaction
+from django.test import TestCase, override_settings, tag
+from django.utils import timezone
+
+import requests_mock
+from freezegun import freeze_time
+from notifications_api_common.models import NotificationsConfig
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import reverse
+
+from openzaak.components.catalogi.tests.factories import ZaakTypeFactory
+from openzaak.components.zaken.tests.utils import ZAAK_WRITE_KWARGS
+from openzaak.tests.utils import JWTAuthMixin
+
+from ..models import FailedNotification, OutboxNotification
+from ..outbox import dispatch_outbox, enqueue_notification
+from . import mock_notification_send, mock_nrc_oas_get
+from .factories import OutboxNotificationFactory
+from .mixins import NotificationsConfigMixin
+
+
+@tag("notifications")
+@override_settings(NOTIFICATIONS_DISABLED=False, NOTIFICATIONS_OUTBOX_ENABLED=True)
+@patch("openzaak.notifications.tasks.dispatch_notifications.delay")
+@patch("notifications_api_common.viewsets.send_notification.delay")
+class OutboxEnqueueTests(NotificationsConfigMixin, JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_notification_is_stored_in_outbox(self, mock_send, mock_dispatch):
+        zaaktype = ZaakTypeFactory.create(concept=False)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse("zaak-list"),
+                {
+                    "zaaktype": f"http://testserver{reverse(zaaktype)}",
+                    "bronorganisatie": "517439943",
+                    "verantwoordelijkeOrganisatie": "517439943",
+                    "registratiedatum": "2024-01-01",
+                    "startdatum": "2024-01-01",
+                },
+                **ZAAK_WRITE_KWARGS,
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        entry = OutboxNotification.objects.get()
+        self.assertEqual(entry.kanaal, "zaken")
+        self.assertEqual(entry.message["resourceUrl"], response.json()["url"])
+        mock_send.assert_not_called()
+        mock_dispatch.assert_called_once()
+
+    def test_single_dispatch_per_transaction(self, mock_send, mock_dispatch):
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                for _ in range(3):
+                    enqueue_notification({"kanaal": "zaken"})
+
+        self.assertEqual(OutboxNotification.objects.count(), 3)
+        mock_dispatch.assert_called_once()
+
+
+@tag("notifications")
+@requests_mock.Mocker()
+@freeze_time("2024-01-01T12:00:00")
+class DispatchOutboxTests(NotificationsConfigMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+
+        config = NotificationsConfig.get_solo()
+        config.notification_delivery_max_retries = 2
+        config.notification_delivery_retry_backoff = 3
+        config.notification_delivery_retry_backoff_max = 48
+        config.save()
+
+    def test_deliver_batch(self, m):
+        mock_nrc_oas_get(m)
+        mock_notification_send(m)
+        OutboxNotificationFactory.create_batch(2, kanaal="zaken")
+        OutboxNotificationFactory.create(kanaal="documenten")
+
+        delivered = dispatch_outbox()
+
+        self.assertEqual(delivered, 3)
+        self.assertFalse(OutboxNotification.objects.exists())
+        requests = [req for req in m.request_history if req.method == "POST"]
+        self.assertEqual(len(requests), 3)
+
+    def test_batch_is_claimed_before_delivery(self, m):
+        mock_nrc_oas_get(m)
+        entry = OutboxNotificationFactory.create(kanaal="zaken")
+        claimed = []
+
+        def _send(request, context):
+            # the notification is delivered outside the claiming transaction, and
+            # is no longer due for other dispatchers
+            entry.refresh_from_db()
+            claimed.append(entry.next_attempt_at > timezone.now())
+            context.status_code = 201
+            return {"dummy": "json"}
+
+        mock_notification_send(m, json=_send)
+
+        delivered = dispatch_outbox()
+
+        self.assertEqual(delivered, 1)
+        self.assertEqual(claimed, [True])
+        self.assertFalse(OutboxNotification.objects.exists())
+
+    def test_notifications_not_due_are_skipped(self, m):
+        mock_nrc_oas_get(m)
+        mock_notification_send(m)
+        OutboxNotificationFactory.create(
+            next_attempt_at=timezone.now() + timedelta(minutes=1)
+        )
+
+        delivered = dispatch_outbox()
+
+        self.assertEqual(delivered, 0)
+        self.assertTrue(OutboxNotification.objects.exists())
+
+    def test_notifications_wait_for_backed_off_notification_of_kanaal(self, m):
+        mock_nrc_oas_get(m)
+        mock_notification_send(m)
+        backed_off = OutboxNotificationFactory.create(
+            kanaal="zaken", next_attempt_at=timezone.now() + timedelta(minutes=1)
+        )
+        waiting = OutboxNotificationFactory.create(kanaal="zaken")
+        OutboxNotificationFactory.create(kanaal="documenten")
+
+        delivered = dispatch_outbox()
+
+        self.assertEqual(delivered, 1)
+        self.assertEqual(
+            list(OutboxNotification.objects.order_by("pk")), [backed_off, waiting]
+        )
+
+    def test_failure_backs_off_and_keeps_order(self, m):
+        mock_nrc_oas_get(m)
+        mock_notification_send(m, status_code=503, json={})
+        first, second = OutboxNotificationFactory.create_batch(2, kanaal="zaken")
+
+        delivered = dispatch_outbox()
+
+        self.assertEqual(delivered, 0)
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual(first.attempts, 1)
+        self.assertEqual(first.next_attempt_at, timezone.now() + timedelta(seconds=3))
+        # the next notification of the kanaal waits for the failed one
+        self.assertEqual(second.attempts, 0)
+        self.assertEqual(second.next_attempt_at, first.next_attempt_at)
+        requests = [req for req in m.request_history if req.method == "POST"]
+        self.assertEqual(len(requests), 1)
+
+    def test_undeliverable_notification_is_logged(self, m):
+        mock_nrc_oas_get(m)
+        mock_notification_send(m, status_code=503, json={})
+        entry = OutboxNotificationFactory.create(attempts=2)
+
+        dispatch_outbox()
+
+        self.assertFalse(OutboxNotification.objects.exists())
+        failed = FailedNotification.objects.get()
+        self.assertEqual(failed.message, entry.message)
@@ -0,0 +1,59 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+from django.test import TestCase
+from django.utils import timezone
+
+import requests
+import requests_mock
+
+from ..models import FailedNotification
+from ..resend import bulk_resend_notifications
+from . import mock_notification_send, mock_nrc_oas_get
+from .factories import FailedNotificationFactory
+from .mixins import NotificationsConfigMixin
+
+
+@requests_mock.Mocker()
+class BulkResendTests(NotificationsConfigMixin, TestCase):
+    def test_resend_in_chunks(self, m):
+        mock_nrc_oas_get(m)
+        mock_notification_send(m)
+        FailedNotificationFactory.create_batch(5)
+        FailedNotificationFactory.create(retried_at=timezone.now())
+        progress = []
+
+        processed = bulk_resend_notifications(
+            FailedNotification.objects.all(),
+            chunk_size=2,
+            progress=lambda done, total: progress.append((done, total)),
+        )
+
+        self.assertEqual(processed, 5)
+        self.assertEqual(progress, [(2, 5), (4, 5), (5, 5)])
+        self.assertFalse(FailedNotification.objects.filter(retried_at=None).exists())
+        requests = [req for req in m.request_history if req.method == "POST"]
+        self.assertEqual(len(requests), 5)
+
+    def test_failed_resends_are_logged_again(self, m):
+        mock_nrc_oas_get(m)
+        mock_notification_send(m, status_code=403, json={"dummy": "response"})
+        FailedNotificationFactory.create_batch(2)
+
+        processed = bulk_resend_notifications(FailedNotification.objects.all())
+
+        # the new failures are not resent in the same run
+        self.assertEqual(processed, 2)
+        qs = FailedNotification.objects.filter(retried_at__isnull=True)
+        self.assertEqual(qs.count(), 2)
+
+    def test_connection_errors_are_logged_again(self, m):
+        mock_nrc_oas_get(m)
+        mock_notification_send(m, exc=requests.ConnectionError)
+        failed = FailedNotificationFactory.create()
+
+        bulk_resend_notifications(FailedNotification.objects.all())
+
+        failed.refresh_from_db()
+        self.assertIsNotNone(failed.retried_at)
+        new_failure = FailedNotification.objects.get(retried_at__isnull=True)
+        self.assertEqual(new_failure.message, failed.message)
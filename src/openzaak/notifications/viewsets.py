@@ -0,0 +1,56 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+"""
+Drop-in replacements for the notification viewset mixins of
+:mod:`notifications_api_common`, which use the outbox if it is enabled.
+"""
+import logging
+from typing import Dict, List, Union
+
+from django.db import models
+
+from notifications_api_common import viewsets
+from notifications_api_common.settings import get_setting
+
+from .outbox import enqueue_notification, outbox_enabled
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxNotificationMixin:
+    def notify(
+        self, status_code: int, data: Union[List, Dict], instance: models.Model = None
+    ) -> None:
+        if not outbox_enabled():
+            return super().notify(status_code, data, instance=instance)
+
+        if get_setting("NOTIFICATIONS_DISABLED"):
+            return
+
+        if not 200 <= status_code < 300:
+            logger.info(
+                "Not notifying, status code '%s' does not represent success.",
+                status_code,
+            )
+            return
+
+        message = self.construct_message(data, instance=instance)
+        enqueue_notification(message)
+
+
+class NotificationCreateMixin(
+    OutboxNotificationMixin, viewsets.NotificationCreateMixin
+):
+    pass
+
+
+class NotificationDestroyMixin(
+    OutboxNotificationMixin, viewsets.NotificationDestroyMixin
+):
+    pass
+
+
+class NotificationViewSetMixin(
+    OutboxNotificationMixin, viewsets.NotificationViewSetMixin
+):
+    pass
@@ -5,25 +5,79 @@ from urllib.parse import parse_qs, urlparse
 
 from openzaak.utils.decorators import cache, cache_uuid
 
-from .models import ReferentieLijstConfig
+from .constants import MirroredResources
+from .models import MirroredObject, ReferentieLijstConfig, ReferentieLijstCopy
 
 # Typing
 
 JsonPrimitive = Union[str, int, float, bool]
 ResultList = List[Dict[str, JsonPrimitive]]
 
+# ⚡️ stale results are served for another day while a single caller refreshes them,
+# and the last fetched results remain available if the Selectielijst API is down
+CACHE_OPTIONS = {"stale_timeout": 60 * 60 * 24, "store": ReferentieLijstCopy.objects}
+
+
+def get_mirrored_list(resource: str, **filters) -> Optional[ResultList]:
+    """
+    Read a list of objects from the local mirror.
+
+    Returns ``None`` if no mirrored objects match the filters, because the resource
+    is not mirrored (yet) or the objects (e.g. of a year) were not part of the last
+    synchronization. The objects are then fetched from the API instead.
+    """
+    results = list(
+        MirroredObject.objects.filter(resource=resource, **filters)
+        .order_by("pk")
+        .values_list("data")
+    )
+    if not results:
+        return None
+    return [data for data, in results]
+
+
+def get_mirrored_object(
+    url: str, resource: Optional[str] = None
+) -> Optional[Dict[str, JsonPrimitive]]:
+    """
+    Read an object from the local mirror by URL, optionally of the given resource.
+    """
+    queryset = MirroredObject.objects.filter(url=url)
+    if resource:
+        queryset = queryset.filter(resource=resource)
+    return queryset.values_list("data", flat=True).first()
+
+
+def fetch_resultaten(client, query_params: Optional[dict] = None) -> ResultList:
+    """
+    Fetch the resultaten from all the pages of the Selectielijst API.
+    """
+    result_list = client.list("resultaat", query_params=query_params or {})
+    results = result_list["results"]
+    while result_list["next"]:
+        parsed = urlparse(result_list["next"])
+        query = parse_qs(parsed.query)
+        result_list = client.list("resultaat", query_params=query)
+        results += result_list["results"]
+    return results
+
 
 def get_procestypen(procestype_jaar=None) -> ResultList:
     """
     Fetch a list of Procestypen.
 
-    Results are cached for 24 hours.
+    Results are read from the local mirror, or cached for 24 hours.
     """
+    filters = {"jaar": procestype_jaar} if procestype_jaar else {}
+    mirrored = get_mirrored_list(MirroredResources.procestype, **filters)
+    if mirrored is not None:
+        return mirrored
+
     key = "selectielijst:procestypen"
     if procestype_jaar:
         key = f"{key}-{procestype_jaar}"
 
-    @cache(key, timeout=60 * 60 * 24)
+    @cache(key, timeout=60 * 60 * 24, **CACHE_OPTIONS)
     def inner():
         client = ReferentieLijstConfig.get_client()
         query_params = query_params = (
@@ -40,71 +94,102 @@ def get_resultaten(proces_type: Optional[str] = None) -> ResultList:
 
     Optionally filtered by a procestype URL.
 
-    Results are cached for 24 hours.
+    Results are read from the local mirror, or cached for 24 hours.
     """
+    filters = {"procestype": proces_type} if proces_type else {}
+    mirrored = get_mirrored_list(MirroredResources.resultaat, **filters)
+    if mirrored is not None:
+        return mirrored
+
     key = "selectielijst:resultaten"
     if proces_type:
         uuid = proces_type.split("/")[-1]
         key = f"{key}:pt-{uuid}"
 
-    @cache(key, timeout=60 * 60 * 24)
+    @cache(key, timeout=60 * 60 * 24, **CACHE_OPTIONS)
     def inner():
         query_params = {}
         if proces_type:
             query_params["procesType"] = proces_type
 
         client = ReferentieLijstConfig.get_client()
-        result_list = client.list("resultaat", query_params=query_params)
-        results = result_list["results"]
-        while result_list["next"]:
-            parsed = urlparse(result_list["next"])
-            query = parse_qs(parsed.query)
-            result_list = client.list("resultaat", query_params=query)
-            results += result_list["results"]
-        return results
+        return fetch_resultaten(client, query_params)
 
     return inner()
 
 
-@cache("referentielijsten:resultaattypeomschrijvinggeneriek", timeout=60 * 60)
 def get_resultaattype_omschrijvingen() -> ResultList:
     """
     Fetch a list of generic resultaattype omschrijvingen.
 
-    Results are cached for an hour.
+    Results are read from the local mirror, or cached for an hour.
     """
+    mirrored = get_mirrored_list(MirroredResources.resultaattypeomschrijving)
+    if mirrored is not None:
+        return mirrored
+    return _get_resultaattype_omschrijvingen()
+
+
+@cache(
+    "referentielijsten:resultaattypeomschrijvinggeneriek",
+    timeout=60 * 60,
+    **CACHE_OPTIONS,
+)
+def _get_resultaattype_omschrijvingen() -> ResultList:
     client = ReferentieLijstConfig.get_client()
     return client.list("resultaattypeomschrijvinggeneriek")
 
 
-@cache_uuid("selectielijst:procestypen", timeout=60 * 60 * 24)
 def retrieve_procestype(url: str) -> Dict[str, JsonPrimitive]:
     """
     Fetch a procestype.
 
-    Results are cached for 24 hours.
+    Results are read from the local mirror, or cached for 24 hours.
     """
+    return get_mirrored_object(
+        url, MirroredResources.procestype
+    ) or _retrieve_procestype(url)
+
+
+@cache_uuid("selectielijst:procestypen", timeout=60 * 60 * 24, **CACHE_OPTIONS)
+def _retrieve_procestype(url: str) -> Dict[str, JsonPrimitive]:
     client = ReferentieLijstConfig.get_client()
     return client.retrieve("procestype", url)
 
 
-@cache_uuid("selectielijst:resultaten", timeout=60 * 60 * 24)
 def retrieve_resultaat(url: str) -> Dict[str, JsonPrimitive]:
     """
     Fetch a resultaat
 
-    Results are cached for 24 hours.
+    Results are read from the local mirror, or cached for 24 hours.
     """
+    return get_mirrored_object(url, MirroredResources.resultaat) or _retrieve_resultaat(
+        url
+    )
+
+
+@cache_uuid("selectielijst:resultaten", timeout=60 * 60 * 24, **CACHE_OPTIONS)
+def _retrieve_resultaat(url: str) -> Dict[str, JsonPrimitive]:
     client = ReferentieLijstConfig.get_client()
     return client.retrieve("resultaat", url)
 
 
-@cache_uuid("referentielijsten:resultaattypeomschrijvinggeneriek", timeout=60 * 60)
 def retrieve_resultaattype_omschrijvingen(url: str) -> Dict[str, JsonPrimitive]:
     """
     Fetch a generic resultaattype omschrijvingen
 
-    Results are cached for an hours.
+    Results are read from the local mirror, or cached for an hour.
     """
+    return get_mirrored_object(
+        url, MirroredResources.resultaattypeomschrijving
+    ) or _retrieve_resultaattype_omschrijvingen(url)
+
+
+@cache_uuid(
+    "referentielijsten:resultaattypeomschrijvinggeneriek",
+    timeout=60 * 60,
+    **CACHE_OPTIONS,
+)
+def _retrieve_resultaattype_omschrijvingen(url: str) -> Dict[str, JsonPrimitive]:
     client = ReferentieLijstConfig.get_client()
     return client.retrieve("resultaattypeomschrijvinggeneriek", url)
@@ -1,7 +1,13 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class SelectielijstConfig(AppConfig):
     name = "openzaak.selectielijst"
+
+    def ready(self):
+        from .signals import schedule_initial_sync
+
+        post_migrate.connect(schedule_initial_sync, sender=self)
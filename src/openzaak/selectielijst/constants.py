@@ -0,0 +1,13 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class MirroredResources(models.TextChoices):
+    procestype = "procestype", _("Procestype")
+    resultaat = "resultaat", _("Resultaat")
+    resultaattypeomschrijving = (
+        "resultaattypeomschrijvinggeneriek",
+        _("Resultaattypeomschrijving generiek"),
+    )
@@ -0,0 +1,42 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+# Generated by Django 4.2.15 on 2024-09-30 09:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("selectielijst", "0007_alter_referentielijstconfig_default_year"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReferentieLijstCopy",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "key",
+                    models.CharField(max_length=255, unique=True, verbose_name="key"),
+                ),
+                ("data", models.JSONField(verbose_name="data")),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="updated at"),
+                ),
+            ],
+            options={
+                "verbose_name": "Selectielijstkopie",
+                "verbose_name_plural": "Selectielijstkopieën",
+            },
+        ),
+    ]
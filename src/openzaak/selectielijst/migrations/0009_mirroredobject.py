@@ -0,0 +1,83 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+# Generated by Django 4.2.15 on 2024-10-02 08:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("selectielijst", "0008_referentielijstcopy"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MirroredObject",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "resource",
+                    models.CharField(
+                        choices=[
+                            ("procestype", "Procestype"),
+                            ("resultaat", "Resultaat"),
+                            (
+                                "resultaattypeomschrijvinggeneriek",
+                                "Resultaattypeomschrijving generiek",
+                            ),
+                        ],
+                        max_length=50,
+                        verbose_name="resource",
+                    ),
+                ),
+                (
+                    "url",
+                    models.URLField(max_length=1000, unique=True, verbose_name="url"),
+                ),
+                (
+                    "procestype",
+                    models.URLField(
+                        blank=True,
+                        db_index=True,
+                        help_text="URL-referentie naar het procestype van een resultaat.",
+                        max_length=1000,
+                        verbose_name="procestype",
+                    ),
+                ),
+                (
+                    "jaar",
+                    models.PositiveIntegerField(
+                        blank=True,
+                        help_text="Het jaar van de selectielijst van een procestype of resultaat.",
+                        null=True,
+                        verbose_name="jaar",
+                    ),
+                ),
+                (
+                    "data",
+                    models.JSONField(
+                        help_text="Het object uit de API.", verbose_name="data"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "gespiegeld Selectielijstobject",
+                "verbose_name_plural": "gespiegelde Selectielijstobjecten",
+                "indexes": [
+                    models.Index(
+                        fields=["resource", "jaar"],
+                        name="selectielij_resourc_406fd4_idx",
+                    )
+                ],
+            },
+        ),
+    ]
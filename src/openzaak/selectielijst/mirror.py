@@ -0,0 +1,78 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+"""
+Local mirror of the Selectielijst API.
+
+The complete dataset is small and changes rarely, so it is copied into the database
+periodically. The functions in :mod:`openzaak.selectielijst.api` read from the
+mirror first, which saves the outgoing requests for validation and the admin.
+"""
+from typing import List
+
+from django.db import transaction
+
+from .api import ResultList, fetch_resultaten
+from .constants import MirroredResources
+from .models import MirroredObject, ReferentieLijstConfig
+
+
+def _fetch_procestypen(client, years: List[int]) -> ResultList:
+    if not years:
+        return client.list("procestype")
+
+    # the procestypen of every allowed year, like they are requested by the
+    # validation and the admin
+    procestypen = {}
+    for year in years:
+        for procestype in client.list("procestype", query_params={"jaar": year}):
+            procestype.setdefault("jaar", year)
+            procestypen.setdefault(procestype["url"], procestype)
+    return list(procestypen.values())
+
+
+def sync_mirror() -> int:
+    """
+    Replace the mirrored objects with the current data of the Selectielijst API.
+
+    :return: the number of mirrored objects
+    """
+    config = ReferentieLijstConfig.get_solo()
+    client = ReferentieLijstConfig.get_client()
+    # everything is fetched first, so a failing request keeps the current mirror
+    procestypen = _fetch_procestypen(client, config.allowed_years)
+    resultaten = fetch_resultaten(client)
+    omschrijvingen = client.list("resultaattypeomschrijvinggeneriek")
+
+    jaren = {procestype["url"]: procestype.get("jaar") for procestype in procestypen}
+    objects = [
+        MirroredObject(
+            resource=MirroredResources.procestype,
+            url=procestype["url"],
+            jaar=procestype.get("jaar"),
+            data=procestype,
+        )
+        for procestype in procestypen
+    ]
+    objects += [
+        MirroredObject(
+            resource=MirroredResources.resultaat,
+            url=resultaat["url"],
+            procestype=resultaat["procesType"],
+            jaar=jaren.get(resultaat["procesType"]),
+            data=resultaat,
+        )
+        for resultaat in resultaten
+    ]
+    objects += [
+        MirroredObject(
+            resource=MirroredResources.resultaattypeomschrijving,
+            url=omschrijving["url"],
+            data=omschrijving,
+        )
+        for omschrijving in omschrijvingen
+    ]
+
+    with transaction.atomic():
+        MirroredObject.objects.all().delete()
+        MirroredObject.objects.bulk_create(objects, batch_size=500)
+    return len(objects)
@@ -7,6 +7,8 @@ from django_better_admin_arrayfield.models.fields import ArrayField
 from vng_api_common.decorators import field_default
 from vng_api_common.models import ClientConfig
 
+from .constants import MirroredResources
+
 
 @field_default("api_root", "https://selectielijst.openzaak.nl/api/v1/")
 class ReferentieLijstConfig(ClientConfig):
@@ -26,3 +28,65 @@ class ReferentieLijstConfig(ClientConfig):
         null=True,
         default=2020,
     )
+
+
+class ReferentieLijstCopyManager(models.Manager):
+    """
+    Persistent store of the last fetched Selectielijst data, for the cache decorator.
+    """
+
+    def load(self, key: str):
+        copy = self.filter(key=key).first()
+        return copy.data if copy else None
+
+    def save(self, key: str, value) -> None:
+        self.update_or_create(key=key, defaults={"data": value})
+
+
+class ReferentieLijstCopy(models.Model):
+    key = models.CharField(_("key"), max_length=255, unique=True)
+    data = models.JSONField(_("data"))
+    updated_at = models.DateTimeField(_("updated at"), auto_now=True)
+
+    objects = ReferentieLijstCopyManager()
+
+    class Meta:
+        verbose_name = _("Selectielijstkopie")
+        verbose_name_plural = _("Selectielijstkopieën")
+
+    def __str__(self):
+        return self.key
+
+
+class MirroredObject(models.Model):
+    """
+    Local copy of an object of the Selectielijst API, kept up to date by the
+    ``sync_selectielijst`` task.
+    """
+
+    resource = models.CharField(
+        _("resource"), max_length=50, choices=MirroredResources.choices
+    )
+    url = models.URLField(_("url"), max_length=1000, unique=True)
+    procestype = models.URLField(
+        _("procestype"),
+        max_length=1000,
+        blank=True,
+        db_index=True,
+        help_text=_("URL-referentie naar het procestype van een resultaat."),
+    )
+    jaar = models.PositiveIntegerField(
+        _("jaar"),
+        null=True,
+        blank=True,
+        help_text=_("Het jaar van de selectielijst van een procestype of resultaat."),
+    )
+    data = models.JSONField(_("data"), help_text=_("Het object uit de API."))
+
+    class Meta:
+        verbose_name = _("gespiegeld Selectielijstobject")
+        verbose_name_plural = _("gespiegelde Selectielijstobjecten")
+        indexes = [models.Index(fields=["resource", "jaar"])]
+
+    def __str__(self):
+        return self.url
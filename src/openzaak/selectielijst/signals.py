@@ -0,0 +1,32 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+import logging
+
+from django.conf import settings
+
+from kombu.exceptions import OperationalError
+
+from .models import MirroredObject
+from .tasks import sync_selectielijst
+
+logger = logging.getLogger(__name__)
+
+
+def schedule_initial_sync(sender, using: str = "default", **kwargs):
+    """
+    Schedule the sync of the Selectielijst mirror if it's empty, instead of waiting
+    for the daily sync.
+    """
+    if not settings.SELECTIELIJST_SYNC_ON_MIGRATE:
+        return
+    if MirroredObject.objects.using(using).exists():
+        return
+
+    try:
+        sync_selectielijst.delay()
+    except OperationalError:
+        # the migrations must not fail on an unavailable broker, the mirror is
+        # filled by the daily sync in that case
+        logger.warning(
+            "Could not schedule the sync of the Selectielijst mirror", exc_info=True
+        )
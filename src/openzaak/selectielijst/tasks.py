@@ -0,0 +1,18 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+import logging
+
+from openzaak import celery_app
+
+from .mirror import sync_mirror
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task()
+def sync_selectielijst():
+    """
+    Copy the Selectielijst dataset into the local mirror.
+    """
+    synced = sync_mirror()
+    logger.info("Mirrored %d Selectielijst object(s)", synced)
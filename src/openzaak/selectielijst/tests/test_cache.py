@@ -0,0 +1,85 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+from django.core.cache import cache
+from django.test import TestCase
+
+import requests_mock
+from freezegun import freeze_time
+
+from openzaak.tests.utils import ClearCachesMixin
+
+from ..api import get_resultaten
+from ..models import ReferentieLijstConfig, ReferentieLijstCopy
+from . import mock_selectielijst_oas_get
+
+RESULTATEN_URL = "https://selectielijst.openzaak.nl/api/v1/resultaten"
+
+
+def _page(results: list) -> dict:
+    return {"previous": None, "next": None, "count": len(results), "results": results}
+
+
+@requests_mock.Mocker()
+class SelectieLijstCacheTests(ClearCachesMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        ReferentieLijstConfig.get_solo()
+
+    def _resultaten_requests(self, m) -> list:
+        return [req for req in m.request_history if req.url == RESULTATEN_URL]
+
+    def test_stale_result_is_returned_while_refreshing(self, m):
+        mock_selectielijst_oas_get(m)
+        m.get(RESULTATEN_URL, json=_page([{"nummer": 1}]))
+        with freeze_time("2024-01-01T12:00:00Z"):
+            get_resultaten()
+
+        m.get(RESULTATEN_URL, json=_page([{"nummer": 2}]))
+        with freeze_time("2024-01-02T13:00:00Z"):
+            # another caller is refreshing the stale result
+            cache.add("selectielijst:resultaten:lock", True)
+
+            results = get_resultaten()
+
+        self.assertEqual(results, [{"nummer": 1}])
+        self.assertEqual(len(self._resultaten_requests(m)), 1)
+
+    def test_stale_result_is_refreshed(self, m):
+        mock_selectielijst_oas_get(m)
+        m.get(RESULTATEN_URL, json=_page([{"nummer": 1}]))
+        with freeze_time("2024-01-01T12:00:00Z"):
+            get_resultaten()
+
+        m.get(RESULTATEN_URL, json=_page([{"nummer": 2}]))
+        with freeze_time("2024-01-02T13:00:00Z"):
+            results = get_resultaten()
+            cached = get_resultaten()
+
+        self.assertEqual(results, [{"nummer": 2}])
+        self.assertEqual(cached, [{"nummer": 2}])
+        self.assertEqual(len(self._resultaten_requests(m)), 2)
+
+    def test_last_fetched_result_is_used_during_outage(self, m):
+        mock_selectielijst_oas_get(m)
+        m.get(RESULTATEN_URL, json=_page([{"nummer": 1}]))
+        get_resultaten()
+        self._clear_caches()
+
+        m.get(RESULTATEN_URL, status_code=503)
+        results = get_resultaten()
+
+        self.assertEqual(results, [{"nummer": 1}])
+        self.assertEqual(
+            ReferentieLijstCopy.objects.get(key="selectielijst:resultaten").data,
+            [{"nummer": 1}],
+        )
+
+    def test_result_of_previous_format_is_ignored(self, m):
+        mock_selectielijst_oas_get(m)
+        m.get(RESULTATEN_URL, json=_page([{"nummer": 1}]))
+        # stored as-is by previous versions of Open Zaak
+        cache.set("selectielijst:resultaten", [{"nummer": 0}])
+
+        results = get_resultaten()
+
+        self.assertEqual(results, [{"nummer": 1}])
@@ -0,0 +1,122 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+import requests_mock
+
+from openzaak.tests.utils import ClearCachesMixin
+
+from ..api import get_procestypen, get_resultaten, retrieve_resultaat
+from ..constants import MirroredResources
+from ..mirror import sync_mirror
+from ..models import MirroredObject, ReferentieLijstConfig
+from ..signals import schedule_initial_sync
+from . import mock_resource_list, mock_selectielijst_oas_get
+
+PROCESTYPE_URL = (
+    "https://selectielijst.openzaak.nl/api/v1/procestypen/"
+    "e1b73b12-b2f6-4c4e-8929-94f84dd2a57d"
+)
+RESULTAAT_URL = (
+    "https://selectielijst.openzaak.nl/api/v1/resultaten/"
+    "cc5ae4e3-a9e6-4386-bcee-46be4986a829"
+)
+
+
+@requests_mock.Mocker()
+class SelectieLijstMirrorTests(ClearCachesMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        ReferentieLijstConfig.get_solo()
+
+    def _sync(self, m):
+        mock_selectielijst_oas_get(m)
+        mock_resource_list(m, "procestypen")
+        mock_resource_list(m, "resultaten")
+        mock_resource_list(m, "resultaattypeomschrijvingen")
+        sync_mirror()
+        m.reset_mock()
+
+    def test_sync(self, m):
+        self._sync(m)
+
+        self.assertEqual(
+            MirroredObject.objects.filter(
+                resource=MirroredResources.procestype
+            ).count(),
+            29,
+        )
+        resultaat = MirroredObject.objects.get(url=RESULTAAT_URL)
+        self.assertEqual(resultaat.procestype, PROCESTYPE_URL)
+        self.assertEqual(resultaat.jaar, 2017)
+
+    def test_read_from_mirror(self, m):
+        self._sync(m)
+
+        procestypen = get_procestypen(procestype_jaar=2017)
+        resultaten = get_resultaten(PROCESTYPE_URL)
+        resultaat = retrieve_resultaat(RESULTAAT_URL)
+
+        self.assertTrue(procestypen)
+        self.assertTrue(all(procestype["jaar"] == 2017 for procestype in procestypen))
+        self.assertEqual(len(resultaten), 8)
+        self.assertEqual(resultaat["url"], RESULTAAT_URL)
+        self.assertFalse(m.called)
+
+    def test_sync_per_allowed_year(self, m):
+        config = ReferentieLijstConfig.get_solo()
+        config.allowed_years = [2017, 2020]
+        config.save()
+        mock_selectielijst_oas_get(m)
+        mock_resource_list(
+            m,
+            "procestypen",
+            {"procestypen": {"jaar": 2017}, "procestypen_2020": {"jaar": 2020}},
+        )
+        mock_resource_list(m, "resultaten")
+        mock_resource_list(m, "resultaattypeomschrijvingen")
+
+        sync_mirror()
+
+        procestypen = MirroredObject.objects.filter(
+            resource=MirroredResources.procestype
+        )
+        self.assertEqual(procestypen.filter(jaar=2017).count(), 29)
+        self.assertEqual(procestypen.filter(jaar=2020).count(), 29)
+
+    def test_fall_back_to_api_for_year_not_mirrored(self, m):
+        self._sync(m)
+        mock_resource_list(m, "procestypen", {"procestypen_2020": {"jaar": 2020}})
+
+        procestypen = get_procestypen(procestype_jaar=2020)
+
+        self.assertEqual(len(procestypen), 29)
+        self.assertTrue(all(procestype["jaar"] == 2020 for procestype in procestypen))
+        self.assertTrue(m.called)
+
+    def test_failed_sync_keeps_mirror(self, m):
+        self._sync(m)
+        m.get("https://selectielijst.openzaak.nl/api/v1/resultaten", status_code=500)
+
+        with self.assertRaises(Exception):
+            sync_mirror()
+
+        self.assertTrue(MirroredObject.objects.filter(url=RESULTAAT_URL).exists())
+
+    @override_settings(SELECTIELIJST_SYNC_ON_MIGRATE=True)
+    @patch("openzaak.selectielijst.signals.sync_selectielijst.delay")
+    def test_sync_is_scheduled_after_migrate(self, m, mock_sync):
+        schedule_initial_sync(sender=None)
+
+        mock_sync.assert_called_once_with()
+
+    @override_settings(SELECTIELIJST_SYNC_ON_MIGRATE=True)
+    @patch("openzaak.selectielijst.signals.sync_selectielijst.delay")
+    def test_no_sync_after_migrate_if_mirrored(self, m, mock_sync):
+        self._sync(m)
+
+        schedule_initial_sync(sender=None)
+
+        mock_sync.assert_not_called()
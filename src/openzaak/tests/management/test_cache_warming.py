@@ -4,12 +4,17 @@ import shutil
 from io import StringIO
 from pathlib import Path
 
-from django.core.management import call_command
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
 from django.test import TestCase, override_settings
 
 import requests_mock
 from vng_api_common.oas import fetcher
 
+from openzaak.components.besluiten.models import Besluit
+from openzaak.components.besluiten.tests.factories import BesluitFactory
+from openzaak.components.zaken.models import Zaak
+from openzaak.components.zaken.tests.factories import ZaakFactory
 from openzaak.selectielijst.tests import mock_selectielijst_oas_get
 
 from ..utils import (
@@ -117,3 +122,68 @@ class WarmCacheCommandTests(ClearCachesMixin, TestCase):
                 "Failed populating the API spec cache for 'verzoeken-2021-06-21'.",
             ]
             self.assertEqual(err, expected_errors)
+
+
+@override_settings(BASE_DIR=str(SCHEMAS))
+@requests_mock.Mocker()
+class WarmETagsCommandTests(ClearCachesMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(lambda: shutil.rmtree(CACHE_DIR, ignore_errors=True))
+        self.addCleanup(fetcher.cache.clear)
+
+    def test_missing_etags_are_calculated(self, m):
+        zaak = ZaakFactory.create()
+        Zaak.objects.update(_etag="")
+        besluit = BesluitFactory.create()
+        Besluit.objects.update(_etag="")
+        stdout = StringIO()
+
+        call_command(
+            "warm_cache",
+            etags=True,
+            models=["zaken.Zaak"],
+            chunk_size=1,
+            workers=0,
+            stdout=stdout,
+            stderr=StringIO(),
+        )
+
+        zaak.refresh_from_db()
+        besluit.refresh_from_db()
+        self.assertNotEqual(zaak._etag, "")
+        self.assertEqual(besluit._etag, "")
+        self.assertIn("Calculated 1 ETag values of 'zaken.zaak'", stdout.getvalue())
+
+    def test_recalculate_continues_after_interruption(self, m):
+        zaak1, zaak2 = ZaakFactory.create_batch(2)
+        Zaak.objects.update(_etag="stale")
+        cache.set("warm_cache:etags:zaken.Zaak", min(zaak1.pk, zaak2.pk))
+
+        call_command(
+            "warm_cache",
+            etags=True,
+            recalculate=True,
+            models=["zaken.Zaak"],
+            workers=0,
+            stdout=StringIO(),
+            stderr=StringIO(),
+        )
+
+        self.assertEqual(
+            Zaak.objects.filter(_etag="stale").count(),
+            1,
+        )
+        self.assertIsNone(cache.get("warm_cache:etags:zaken.Zaak"))
+
+    def test_unknown_model(self, m):
+        with self.assertRaises(CommandError):
+            call_command(
+                "warm_cache",
+                etags=True,
+                models=["accounts.User"],
+                workers=0,
+                stdout=StringIO(),
+                stderr=StringIO(),
+            )
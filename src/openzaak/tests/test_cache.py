@@ -1,7 +1,11 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2022 Dimpact
+from types import SimpleNamespace
+
 from django.test import TestCase
 
+from freezegun import freeze_time
+
 from openzaak.utils.cache import DjangoCacheStorage
 
 
@@ -52,3 +56,30 @@ class DjangoCacheStorageTestCase(TestCase):
 
         self.assertFalse("foo" in self.storage)
         self.assertFalse("bar" in self.storage)
+
+    def test_iter_and_len(self):
+        self.storage["foo"] = "bar"
+        self.storage["bar"] = "foo"
+
+        self.assertEqual(set(self.storage), {"foo", "bar"})
+        self.assertEqual(len(self.storage), 2)
+        self.assertEqual(dict(self.storage.items()), {"foo": "bar", "bar": "foo"})
+
+    def test_iter_skips_expired_and_evicted_items(self):
+        with freeze_time("2024-01-01T12:00:00Z"):
+            self.storage["foo"] = SimpleNamespace(ttl=60)
+            self.storage["bar"] = "foo"
+        self.storage.cache.delete("bar")
+
+        with freeze_time("2024-01-01T12:05:00Z"):
+            self.assertEqual(list(self.storage), [])
+            self.assertEqual(len(self.storage), 0)
+
+    def test_delete_removes_key_from_index(self):
+        self.storage["foo"] = "bar"
+        self.storage["bar"] = "foo"
+
+        del self.storage["foo"]
+        self.storage.bulk_delete(["bar"])
+
+        self.assertEqual(len(self.storage), 0)
@@ -0,0 +1,98 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+from datetime import timedelta
+
+from django.test import RequestFactory
+
+from djangorestframework_camel_case.render import (
+    CamelCaseJSONRenderer as LibraryCamelCaseJSONRenderer,
+)
+from rest_framework.request import Request
+from rest_framework.test import APITestCase
+from rest_framework.versioning import URLPathVersioning
+from vng_api_common.constants import RolTypes
+
+from openzaak.components.documenten.api.serializers import (
+    EnkelvoudigInformatieObjectSerializer,
+)
+from openzaak.components.documenten.tests.factories import (
+    EnkelvoudigInformatieObjectFactory,
+)
+from openzaak.components.zaken.api.serializers import (
+    RolSerializer,
+    StatusSerializer,
+    ZaakSerializer,
+)
+from openzaak.components.zaken.models import NatuurlijkPersoon, ZaakKenmerk
+from openzaak.components.zaken.tests.factories import (
+    RolFactory,
+    StatusFactory,
+    ZaakFactory,
+)
+from openzaak.utils.camel_case import CamelizedDict
+from openzaak.utils.compiled import COMPILED_REPRESENTATION
+from openzaak.utils.renderers import CamelCaseJSONRenderer
+
+
+def _get_request() -> Request:
+    request = Request(RequestFactory().get("/"))
+    request.version = "1"
+    request.versioning_scheme = URLPathVersioning()
+    return request
+
+
+class CompiledRepresentationTests(APITestCase):
+    maxDiff = None
+
+    def assertSameRepresentation(self, serializer_class, instances):
+        request = _get_request()
+        generic = serializer_class(instances, many=True, context={"request": request})
+        compiled = serializer_class(
+            instances,
+            many=True,
+            context={"request": request, COMPILED_REPRESENTATION: True},
+        )
+
+        # the compiled representation is camelized already
+        self.assertIsInstance(compiled.data[0], CamelizedDict)
+        self.assertEqual(
+            CamelCaseJSONRenderer().render(compiled.data),
+            LibraryCamelCaseJSONRenderer().render(generic.data),
+        )
+
+    def test_zaak(self):
+        zaak1 = ZaakFactory.create(
+            verlenging_reden="reden",
+            verlenging_duur=timedelta(days=5),
+            opschorting_indicatie=True,
+            opschorting_reden="opgeschort",
+            processobject_datumkenmerk="einddatum",
+        )
+        ZaakKenmerk.objects.create(zaak=zaak1, kenmerk="kenmerk", bron="bron")
+        StatusFactory.create(zaak=zaak1)
+        zaak2 = ZaakFactory.create(hoofdzaak=zaak1)
+
+        self.assertSameRepresentation(ZaakSerializer, [zaak1, zaak2])
+
+    def test_status(self):
+        self.assertSameRepresentation(StatusSerializer, StatusFactory.create_batch(2))
+
+    def test_rol(self):
+        rol1 = RolFactory.create(
+            betrokkene_type=RolTypes.natuurlijk_persoon,
+            contactpersoon_rol_naam="naam",
+        )
+        NatuurlijkPersoon.objects.create(rol=rol1, inp_a_nummer="1234567890")
+        rol2 = RolFactory.create(betrokkene_type=RolTypes.medewerker)
+
+        self.assertSameRepresentation(RolSerializer, [rol1, rol2])
+
+    def test_enkelvoudiginformatieobject(self):
+        eio1 = EnkelvoudigInformatieObjectFactory.create(
+            integriteit_algoritme="crc_16", integriteit_waarde="waarde"
+        )
+        eio2 = EnkelvoudigInformatieObjectFactory.create()
+
+        self.assertSameRepresentation(
+            EnkelvoudigInformatieObjectSerializer, [eio1, eio2]
+        )
@@ -0,0 +1,75 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+from unittest.mock import patch
+
+from django.db import transaction
+from django.test import override_settings
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import CacheMixin, JWTAuthMixin, reverse
+
+from openzaak.components.zaken.models import Zaak
+from openzaak.components.zaken.tests.factories import StatusFactory, ZaakFactory
+from openzaak.components.zaken.tests.utils import ZAAK_READ_KWARGS
+from openzaak.utils.etags import calculate_etags, refresh_stale_etags
+
+
+@override_settings(ETAG_DEFERRED=True)
+class DeferredETagTests(CacheMixin, JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+        self.zaak = ZaakFactory.create()
+        self.zaak.calculate_etag_value()
+        self.etag = self.zaak._etag
+        assert self.etag
+
+        # reset the on_commit callbacks from the test setup
+        transaction.get_connection().run_on_commit = []
+
+    def test_change_clears_etag_of_dependent_objects(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            status_obj = StatusFactory.create(zaak=self.zaak)
+
+        # nothing is calculated on commit
+        self.assertEqual(callbacks, [])
+        self.zaak.refresh_from_db()
+        self.assertEqual(self.zaak._etag, "")
+        status_obj.refresh_from_db()
+        self.assertEqual(status_obj._etag, "")
+
+    def test_etag_is_calculated_on_request(self):
+        StatusFactory.create(zaak=self.zaak)
+
+        response = self.client.get(reverse(self.zaak), **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertHasETag(response)
+        self.zaak.refresh_from_db()
+        self.assertNotIn(self.zaak._etag, ("", self.etag))
+        self.assertEqual(response["ETag"], f'"{self.zaak._etag}"')
+
+    def test_sweeper_calculates_missing_etags(self):
+        StatusFactory.create(zaak=self.zaak)
+
+        refreshed = refresh_stale_etags()
+
+        self.assertGreaterEqual(refreshed, 2)
+        self.assertFalse(Zaak.objects.filter(_etag="").exists())
+        self.zaak.refresh_from_db()
+        self.assertNotEqual(self.zaak._etag, self.etag)
+
+    def test_calculation_does_not_overwrite_cleared_etag(self):
+        def _calculate(obj):
+            # the object is changed while its ETag value is calculated
+            Zaak.objects.filter(pk=obj.pk).update(_etag="")
+            return "stale"
+
+        with patch("openzaak.utils.etags.calculate_etag", side_effect=_calculate):
+            stored = calculate_etags("zaken.Zaak", [self.zaak.pk])
+
+        self.assertEqual(stored, 0)
+        self.zaak.refresh_from_db()
+        self.assertEqual(self.zaak._etag, "")
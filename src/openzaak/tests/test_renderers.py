@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy as _
+
+from djangorestframework_camel_case.render import (
+    CamelCaseJSONRenderer as LibraryCamelCaseJSONRenderer,
+)
+from rest_framework.renderers import JSONRenderer as DRFJSONRenderer
+
+from openzaak.utils import renderers
+from openzaak.utils.camel_case import CamelizedDict
+from openzaak.utils.renderers import CamelCaseJSONRenderer, JSONRenderer
+
+DATA = {
+    "zaak_type": "http://testserver/catalogi/api/v1/zaaktypen/1",
+    "datum_status_gezet": datetime(2024, 1, 1, 12, 30, 5, 123456, tzinfo=timezone.utc),
+    "registratiedatum": date(2024, 1, 1),
+    "tijd": time(10, 15),
+    "duur": timedelta(days=5),
+    "bedrag": Decimal("12.50"),
+    "uuid": uuid.UUID("f7d8d8a5-7f7b-4a3c-9a37-5c8e2f1b2a3b"),
+    "omschrijving": _('Omschrijving met speciale tekens: é   \x01 "\\'),
+    "zaakgeometrie": {"type": "Point", "coordinates": [4.9, 52.3]},
+    "kenmerken": [{"kenmerk": "kenmerk", "bron_organisatie": None}],
+    "inp_a_nummer": True,
+}
+
+
+class JSONRendererTests(SimpleTestCase):
+    def test_same_output_as_drf(self):
+        for value in (
+            DATA,
+            [DATA, DATA],
+            {"floats": [1e-05, 1e16, 2.5e-7, 0.0001, 1e15, -0.0]},
+            {"integers": [0, -1, 2**63, 2**70]},
+            {1: "non-string key"},
+            {},
+            [],
+        ):
+            with self.subTest(value=value):
+                self.assertEqual(
+                    JSONRenderer().render(value), DRFJSONRenderer().render(value)
+                )
+
+    def test_non_finite_floats_are_refused(self):
+        for value in (float("nan"), float("inf"), float("-inf")):
+            with self.subTest(value=value):
+                data = {"results": [{"bedrag": value, "omschrijving": None}]}
+
+                with self.assertRaises(ValueError):
+                    DRFJSONRenderer().render(data)
+                with self.assertRaises(ValueError):
+                    JSONRenderer().render(data)
+
+    def test_indented(self):
+        self.assertEqual(
+            JSONRenderer().render(DATA, "application/json; indent=4"),
+            DRFJSONRenderer().render(DATA, "application/json; indent=4"),
+        )
+
+    def test_none(self):
+        self.assertEqual(JSONRenderer().render(None), b"")
+
+    @patch.object(renderers, "orjson", None)
+    def test_without_orjson(self):
+        self.assertEqual(JSONRenderer().render(DATA), DRFJSONRenderer().render(DATA))
+
+
+class CamelCaseJSONRendererTests(SimpleTestCase):
+    def test_same_output_as_library(self):
+        self.assertEqual(
+            CamelCaseJSONRenderer().render(DATA),
+            LibraryCamelCaseJSONRenderer().render(DATA),
+        )
+
+    def test_camelized_data_is_not_camelized_again(self):
+        data = CamelizedDict(zaak_type="keep as-is")
+
+        rendered = CamelCaseJSONRenderer().render({"results": [data]})
+
+        self.assertEqual(rendered, b'{"results":[{"zaak_type":"keep as-is"}]}')
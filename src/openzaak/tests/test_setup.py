@@ -0,0 +1,27 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+MANAGE_PY = Path(__file__).resolve().parents[2] / "manage.py"
+
+
+class SetupTests(SimpleTestCase):
+    def test_apps_load_in_a_new_process(self):
+        """
+        Assert that the project boots from scratch, the test process has loaded the
+        apps already and doesn't catch imports of models at module level.
+        """
+        result = subprocess.run(
+            [sys.executable, str(MANAGE_PY), "check"],
+            env={**os.environ, "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE},
+            capture_output=True,
+            text=True,
+        )
+
+        self.assertEqual(result.returncode, 0, msg=result.stderr)
@@ -0,0 +1,91 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+import uuid
+
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from rest_framework.request import Request
+from rest_framework.reverse import reverse
+from rest_framework.versioning import URLPathVersioning
+
+from openzaak.utils.middleware import override_request_host
+from openzaak.utils.url_builder import build_url
+
+
+def _get_request(path="/zaken/api/v1/zaken", **extra) -> Request:
+    request = Request(RequestFactory().get(path, **extra))
+    request.version = "1"
+    request.versioning_scheme = URLPathVersioning()
+    return request
+
+
+class BuildURLTests(SimpleTestCase):
+    def test_same_url_as_reverse(self):
+        request = _get_request()
+        for view_name, kwargs in (
+            ("zaak-detail", {"uuid": uuid.uuid4()}),
+            ("zaaktype-detail", {"uuid": str(uuid.uuid4())}),
+            ("enkelvoudiginformatieobject-detail", {"uuid": uuid.uuid4()}),
+            ("besluit-detail", {"version": "1", "uuid": uuid.uuid4()}),
+        ):
+            with self.subTest(view_name=view_name):
+                self.assertEqual(
+                    build_url(view_name, kwargs, request),
+                    reverse(view_name, kwargs=dict(kwargs), request=request),
+                )
+
+    def test_without_request(self):
+        zaak_uuid = uuid.uuid4()
+
+        url = build_url("zaak-detail", {"version": "1", "uuid": zaak_uuid})
+
+        self.assertEqual(url, f"/zaken/api/v1/zaken/{zaak_uuid}")
+
+    @override_settings(ALLOWED_HOSTS=["openzaak.example.com", "other.example.com"])
+    def test_url_per_host(self):
+        zaak_uuid = uuid.uuid4()
+
+        url1 = build_url(
+            "zaak-detail",
+            {"uuid": zaak_uuid},
+            _get_request(HTTP_HOST="openzaak.example.com"),
+        )
+        url2 = build_url(
+            "zaak-detail",
+            {"uuid": zaak_uuid},
+            _get_request(HTTP_HOST="other.example.com"),
+        )
+
+        self.assertEqual(
+            url1, f"http://openzaak.example.com/zaken/api/v1/zaken/{zaak_uuid}"
+        )
+        self.assertEqual(
+            url2, f"http://other.example.com/zaken/api/v1/zaken/{zaak_uuid}"
+        )
+
+    @override_settings(
+        OPENZAAK_REWRITE_HOST=True,
+        OPENZAAK_DOMAIN="openzaak.example.com",
+        ALLOWED_HOSTS=["*"],
+    )
+    def test_rewritten_host(self):
+        request = _get_request(HTTP_HOST="proxy.example.com")
+        override_request_host(request._request)
+        zaak_uuid = uuid.uuid4()
+
+        url = build_url("zaak-detail", {"uuid": zaak_uuid}, request)
+
+        self.assertEqual(
+            url, f"http://openzaak.example.com/zaken/api/v1/zaken/{zaak_uuid}"
+        )
+
+    def test_format_override_falls_back_to_reverse(self):
+        request = _get_request("/zaken/api/v1/zaken?format=json")
+        zaak_uuid = uuid.uuid4()
+
+        url = build_url("zaak-detail", {"uuid": zaak_uuid}, request)
+
+        self.assertEqual(
+            url, reverse("zaak-detail", kwargs={"uuid": zaak_uuid}, request=request)
+        )
+        self.assertTrue(url.endswith("?format=json"))
@@ -5,6 +5,7 @@ from urllib.parse import urlencode
 
 from django.conf import settings
 from django.contrib import admin
+from django.contrib.admin.utils import unquote
 from django.core.exceptions import PermissionDenied
 from django.db import transaction
 from django.db.models.base import Model, ModelBase
@@ -20,6 +21,8 @@ from rest_framework.settings import api_settings
 from vng_api_common.audittrails.models import AuditTrail
 from vng_api_common.constants import CommonResourceAction
 
+from .mixins import AuditTrailMixin
+
 
 def link_to_related_objects(
     model: ModelBase, obj: Model, rel_field_name: Optional[str] = None
@@ -138,6 +141,17 @@ class EditInlineAdminMixin:
 class AuditTrailAdminMixin:
     viewset = None
 
+    def history_view(self, request, object_id, extra_context=None):
+        obj = self.get_object(request, unquote(object_id))
+        if isinstance(obj, AuditTrailMixin):
+            extra_context = {
+                **(extra_context or {}),
+                "audittrail_page": obj.get_audittrail_page(
+                    request.GET.get("audittrail_page")
+                ),
+            }
+        return super().history_view(request, object_id, extra_context=extra_context)
+
     def get_viewset(self, request):
         if not self.viewset:
             raise NotImplementedError(
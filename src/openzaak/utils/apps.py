@@ -14,13 +14,18 @@ class UtilsConfig(AppConfig):
     name = "openzaak.utils"
 
     def ready(self):
+        from vng_api_common.caching.etags import EtagUpdate
+        from vng_api_common.models import APIMixin
+
         from . import (  # noqa
             checks,
+            etags,
             fields,
             handlers,
             lookups,
             oas_extensions,
             serializer_fields,
+            url_builder,
         )
         from .signals import update_admin_index
 
@@ -38,6 +43,14 @@ class UtilsConfig(AppConfig):
         # register one-to-one field (for multi-table inheritance of Zaak)
         HANDLERS[models.OneToOneField] = FKHandler
 
+        # clear the ETag values of affected objects instead of recalculating them
+        # if ``ETAG_DEFERRED`` is enabled
+        EtagUpdate.mark_affected = classmethod(etags.mark_affected)
+
+        # build the URLs of the API resources from cached URL templates
+        serializers.HyperlinkedRelatedField.get_url = url_builder.get_url
+        APIMixin.get_absolute_api_url = url_builder.get_absolute_api_url
+
 
 def default_user_agent(name=settings.USER_AGENT):
     """
@@ -1,26 +1,119 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2022 Dimpact
+import time
 from contextlib import contextmanager
-from typing import Iterable, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from django.conf import settings
 from django.core.cache import caches
 
 import requests_cache
-from requests_cache import BaseCache, clear, install_cache, uninstall_cache
+from requests_cache import (
+    BaseCache,
+    clear,
+    install_cache,
+    remove_expired_responses,
+    uninstall_cache,
+)
 from requests_cache.backends.base import KEY_FN
 from requests_cache.cache_keys import create_key
 
+ITER_CHUNK_SIZE = 500
+
+
+class LocalKeyIndex:
+    """
+    Index of the keys in a storage, kept in memory.
+
+    Only suitable for caches that are local to the process as well.
+    """
+
+    def __init__(self):
+        self._expires: Dict[str, float] = {}
+
+    def add(self, key: str, expires_at: float) -> List[str]:
+        self._expires[key] = expires_at
+        return []
+
+    def remove(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._expires.pop(key, None)
+
+    def keys(self) -> List[str]:
+        now = time.time()
+        return [key for key, expires in self._expires.items() if expires > now]
+
+    def count(self) -> int:
+        return len(self.keys())
+
+    def clear(self) -> None:
+        self._expires.clear()
+
+
+class RedisKeyIndex:
+    """
+    Index of the keys in a storage, kept in a Redis sorted set.
+
+    The keys are scored by their expiry time, so expired keys are skipped without
+    reading them and the keys closest to their expiry are evicted first.
+    """
+
+    def __init__(self, cache, name: str, max_entries: Optional[int] = None):
+        self.client = cache.client.get_client(write=True)
+        self.name = cache.make_key(name)
+        self.max_entries = max_entries
+
+    def add(self, key: str, expires_at: float) -> List[str]:
+        """
+        Add the key and return the keys evicted to stay within the maximum size.
+        """
+        pipeline = self.client.pipeline()
+        pipeline.zadd(self.name, {key: expires_at})
+        pipeline.zremrangebyscore(self.name, "-inf", time.time())
+        pipeline.zcard(self.name)
+        *_, size = pipeline.execute()
+
+        if not self.max_entries or size <= self.max_entries:
+            return []
+        evicted = self.client.zpopmin(self.name, size - self.max_entries)
+        return [member.decode("utf-8") for member, _ in evicted]
+
+    def remove(self, keys: Iterable[str]) -> None:
+        keys = list(keys)
+        if keys:
+            self.client.zrem(self.name, *keys)
+
+    def keys(self) -> List[str]:
+        members = self.client.zrangebyscore(self.name, time.time(), "+inf")
+        return [member.decode("utf-8") for member in members]
+
+    def count(self) -> int:
+        return self.client.zcount(self.name, time.time(), "+inf")
+
+    def clear(self) -> None:
+        self.client.delete(self.name)
+
 
 class DjangoCacheStorage(requests_cache.BaseStorage):
     """
     Custom storage for requests-cache that uses the Django cache framework
     """
 
-    def __init__(self, cache_name: str, **kwargs):
+    def __init__(self, cache_name: str, namespace: str = "responses", **kwargs):
         super().__init__(**kwargs)
 
         self.cache = caches[cache_name]
+        self.namespace = namespace
+        # ⚡️ a shared (Redis) cache keeps the index next to the items, so all
+        # processes see the same keys
+        if hasattr(self.cache, "client") and hasattr(self.cache.client, "get_client"):
+            self.index = RedisKeyIndex(
+                self.cache,
+                f"requests-cache-index:{namespace}",
+                max_entries=settings.IMPORT_REQUESTS_CACHE_MAX_ENTRIES,
+            )
+        else:
+            self.index = LocalKeyIndex()
 
     def __contains__(self, key) -> bool:
         return key in self.cache
@@ -30,34 +123,57 @@ class DjangoCacheStorage(requests_cache.BaseStorage):
 
     def __setitem__(self, key, item):
         """Save an item to the cache, optionally with TTL"""
-        if getattr(item, "ttl", None):
-            self.cache.set(key, item, timeout=item.ttl)
+        ttl = getattr(item, "ttl", None)
+        if ttl:
+            self.cache.set(key, item, timeout=ttl)
         else:
             self.cache.set(key, item)
 
+        timeout = ttl or self.cache.default_timeout
+        expires_at = time.time() + timeout if timeout is not None else float("inf")
+        evicted = self.index.add(key, expires_at)
+        if evicted:
+            self.cache.delete_many(evicted)
+
     def __delitem__(self, key):
         self.cache.delete(key)
-
-    def __iter__(self):
-        """
-        Has to be defined for the abstract base class `requests_cache.BaseStorage`, but
-        is never actually used
-        """
-        raise NotImplementedError
-
-    def __len__(self):
-        """
-        Has to be defined for the abstract base class `requests_cache.BaseStorage`, but
-        is never actually used
-        """
-        raise NotImplementedError
+        self.index.remove([key])
+
+    def __iter__(self) -> Iterator[str]:
+        keys = self.index.keys()
+        for start in range(0, len(keys), ITER_CHUNK_SIZE):
+            chunk = keys[start : start + ITER_CHUNK_SIZE]
+            # skip (and forget) the keys the cache evicted by itself
+            found = self.cache.get_many(chunk)
+            self.index.remove(key for key in chunk if key not in found)
+            yield from (key for key in chunk if key in found)
+
+    def __len__(self) -> int:
+        return self.index.count()
+
+    def items(self) -> Iterator[Tuple[str, object]]:
+        keys = self.index.keys()
+        for start in range(0, len(keys), ITER_CHUNK_SIZE):
+            found = self.cache.get_many(keys[start : start + ITER_CHUNK_SIZE])
+            yield from found.items()
+
+    def values(self) -> Iterator[object]:
+        for _, value in self.items():
+            yield value
 
     def bulk_delete(self, keys: Iterable[str]):
         """Delete multiple keys from the cache, without raising errors for missing keys"""
+        keys = list(keys)
         self.cache.delete_many(keys)
+        self.index.remove(keys)
 
     def clear(self):
-        self.cache.clear()
+        if isinstance(self.index, RedisKeyIndex):
+            # the cache is shared, only remove the keys of this storage
+            self.cache.delete_many(self.index.keys())
+        else:
+            self.cache.clear()
+        self.index.clear()
 
     def __str__(self):
         return f"DjangoCacheStorage(cache_name={self.cache})"
@@ -77,7 +193,9 @@ class DjangoRequestsCache(requests_cache.BaseCache):
         **kwargs,
     ):
         self.responses = DjangoCacheStorage(cache_name=cache_name)
-        self.redirects = DjangoCacheStorage(cache_name=cache_name)
+        self.redirects = DjangoCacheStorage(
+            cache_name=cache_name, namespace="redirects"
+        )
         self.cache_name = cache_name
 
         self.ignored_parameters = ignored_parameters
@@ -101,10 +219,16 @@ def requests_cache_enabled(*args, **kwargs):
     """
     Custom context manager for requests-cache, to actually clear the contents of
     the cache, before uninstalling it
+
+    A shared cache is only cleared of the expired responses, so that concurrent
+    imports keep the responses they have in common.
     """
     install_cache(*args, **kwargs)
     try:
         yield
     finally:
-        clear()
+        if settings.IMPORT_REQUESTS_CACHE:
+            remove_expired_responses()
+        else:
+            clear()
         uninstall_cache()
@@ -0,0 +1,83 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+"""
+camelCase conversion of the API responses.
+
+The renderers of :mod:`djangorestframework_camel_case` rebuild the complete response
+before encoding it, running a regular expression on every key of every object. Here,
+the conversion of a key is done once per process, and the representations that are
+already camelized (:class:`CamelizedDict`, emitted by the compiled serializers of
+:mod:`openzaak.utils.compiled`) are passed through as-is.
+"""
+import re
+from functools import lru_cache
+from typing import Any, Dict
+
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+
+from djangorestframework_camel_case import util
+from djangorestframework_camel_case.settings import api_settings
+from rest_framework.utils.serializer_helpers import ReturnDict
+
+
+class CamelizedDict(dict):
+    """
+    Representation of which all keys, including those of nested values, are already
+    camelized.
+    """
+
+
+def can_precamelize(options: Dict[str, Any] = None) -> bool:
+    """
+    Check that the keys can be camelized without knowing the rest of the response.
+    """
+    if options is None:
+        options = api_settings.JSON_UNDERSCOREIZE
+    return not options.get("ignore_fields") and not options.get("ignore_keys")
+
+
+@lru_cache(maxsize=4096)
+def camelize_key(key: str) -> str:
+    """
+    Return the camelCase version of a key.
+
+    Note that :func:`openzaak.setup.monkeypatch_drf_camel_case` changes the
+    expression at startup, before any key is camelized.
+    """
+    if "_" not in key:
+        return key
+    return re.sub(util.camelize_re, util.underscore_to_camel, key)
+
+
+def _camelize(data):
+    if isinstance(data, CamelizedDict):
+        return data
+    if isinstance(data, Promise):
+        data = force_str(data)
+    if isinstance(data, dict):
+        if isinstance(data, ReturnDict):
+            new_dict = ReturnDict(serializer=data.serializer)
+        else:
+            new_dict = {}
+        for key, value in data.items():
+            if isinstance(key, Promise):
+                key = force_str(key)
+            if isinstance(key, str):
+                key = camelize_key(key)
+            new_dict[key] = _camelize(value)
+        return new_dict
+    if isinstance(data, str):
+        return data
+    if isinstance(data, list) or util.is_iterable(data):
+        return [_camelize(item) for item in data]
+    return data
+
+
+def camelize(data, **options):
+    """
+    Drop-in replacement of :func:`djangorestframework_camel_case.util.camelize`.
+    """
+    if not can_precamelize(options):
+        return util.camelize(data, **options)
+    return _camelize(data)
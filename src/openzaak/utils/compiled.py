@@ -0,0 +1,281 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+"""
+Compiled read representation of serializers.
+
+:meth:`rest_framework.serializers.Serializer.to_representation` walks the fields of
+the serializer for every object, resolving the source of every field through
+:meth:`rest_framework.fields.Field.get_attribute`. On list endpoints that is done for
+every row of the page, with the same fields in the same order.
+
+Instead, the representation is generated once per serializer class (and set of
+fields) as the source code of a flat function, with a line per field:
+
+* model fields are read as plain attributes of the instance
+* gegevensgroepen with the default representation are compiled in turn, reading the
+  values from the dict of the descriptor
+* all other fields (relations, nested serializers, ``source="*"``...) go through
+  their own ``get_attribute`` and ``to_representation``
+
+The generated function is bound to the fields of a serializer instance once, and
+returns the same representation as the generic implementation, with the keys already
+camelized: the camelCase keys are part of the generated source, and only the values
+that can contain nested objects are camelized at runtime. The result is a
+:class:`openzaak.utils.camel_case.CamelizedDict`, which the renderers don't camelize
+again.
+"""
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple, Type
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+
+from rest_framework import fields
+from rest_framework.fields import Field, SkipField
+from rest_framework.relations import (
+    HyperlinkedRelatedField,
+    ManyRelatedField,
+    PKOnlyObject,
+    RelatedField,
+)
+from rest_framework.serializers import BaseSerializer, Serializer
+from vng_api_common.polymorphism import PolymorphicSerializer
+from vng_api_common.serializers import GegevensGroepSerializer
+
+from .camel_case import CamelizedDict, camelize, camelize_key, can_precamelize
+
+COMPILED_REPRESENTATION = "compiled_representation"
+
+Representation = Callable[[object], dict]
+
+# the value is a model field, read as an attribute of the instance
+_ATTRIBUTE = "attribute"
+# the value is read from the dict of a gegevensgroep
+_ITEM = "item"
+# the value is a gegevensgroep, which is compiled in turn
+_GEGEVENSGROEP = "gegevensgroep"
+# the field resolves its own value
+_FIELD = "field"
+
+# the fields of which the representation never contains nested objects, the
+# representation of other fields is camelized
+_FLAT_FIELDS = (
+    fields.BooleanField,
+    fields.CharField,
+    fields.ChoiceField,
+    fields.DateField,
+    fields.DateTimeField,
+    fields.DecimalField,
+    fields.DurationField,
+    fields.FloatField,
+    fields.IntegerField,
+    fields.TimeField,
+    fields.UUIDField,
+    HyperlinkedRelatedField,
+)
+
+Step = Tuple[str, str, Optional[str], Field]
+
+_factories: Dict[Tuple, Callable[..., Representation]] = {}
+
+
+def _get_model_attribute(
+    model: Optional[Type[models.Model]], field: Field
+) -> Optional[str]:
+    """
+    Return the attribute of the model field read by a plain serializer field.
+    """
+    if model is None or isinstance(
+        field, (RelatedField, ManyRelatedField, BaseSerializer)
+    ):
+        return None
+    if field.source == "*" or len(field.source_attrs) != 1:
+        return None
+
+    attr = field.source_attrs[0]
+    try:
+        model_field = model._meta.get_field(attr)
+    except FieldDoesNotExist:
+        return None
+    if not model_field.concrete or model_field.is_relation:
+        return None
+    if model_field.attname != attr:
+        return None
+    return attr
+
+
+def _is_default_gegevensgroep(field: Field) -> bool:
+    return (
+        isinstance(field, GegevensGroepSerializer)
+        and type(field).to_representation is GegevensGroepSerializer.to_representation
+    )
+
+
+def _get_steps(serializer: Serializer, items: bool) -> List[Step]:
+    model = getattr(getattr(serializer, "Meta", None), "model", None)
+    steps = []
+    for field in serializer._readable_fields:
+        attr = None
+        if items:
+            kind = _ITEM
+        elif _is_default_gegevensgroep(field):
+            kind = _GEGEVENSGROEP
+        else:
+            attr = _get_model_attribute(model, field)
+            kind = _ATTRIBUTE if attr is not None else _FIELD
+        steps.append((field.field_name, kind, attr, field))
+    return steps
+
+
+def _is_flat(field: Field) -> bool:
+    if isinstance(field, ManyRelatedField):
+        return _is_flat(field.child_relation)
+    return isinstance(field, _FLAT_FIELDS) and not isinstance(
+        field, fields.MultipleChoiceField
+    )
+
+
+def _generate_source(
+    name: str, steps: List[Step], polymorphic: bool, camelized: bool
+) -> str:
+    params = ["Data", "camelize", "SkipField", "PKOnlyObject", "discriminator"]
+    lines = ["    def represent(instance):", "        data = Data()"]
+    for index, (field_name, kind, attr, field) in enumerate(steps):
+        # ⚡️ the camelCase keys are computed once, as part of the source
+        key = repr(camelize_key(field_name) if camelized else field_name)
+        params += [f"get_{index}", f"repr_{index}"]
+        represent = f"repr_{index}(value)"
+        if camelized and kind != _GEGEVENSGROEP and not _is_flat(field):
+            represent = f"camelize({represent})"
+
+        if kind == _FIELD:
+            lines += [
+                "        try:",
+                f"            value = get_{index}(instance)",
+                "        except SkipField:",
+                "            pass",
+                "        else:",
+                "            check = value.pk if isinstance(value, PKOnlyObject)"
+                " else value",
+                f"            data[{key}] = None if check is None else {represent}",
+            ]
+            continue
+
+        if kind == _ATTRIBUTE:
+            lines.append(f"        value = instance.{attr}")
+        elif kind == _ITEM:
+            lines.append(f"        value = instance[{field_name!r}]")
+        else:
+            lines.append(f"        value = get_{index}(instance)")
+        lines.append(f"        data[{key}] = None if value is None else {represent}")
+
+    if polymorphic:
+        extra = "camelize(extra)" if camelized else "extra"
+        lines += [
+            "        extra = discriminator(instance)",
+            "        if extra:",
+            f"            data.update({extra})",
+        ]
+    lines.append("        return data")
+
+    return "\n".join(
+        [f"def {name}({', '.join(params)}):", *lines, "    return represent", ""]
+    )
+
+
+def _get_factory(
+    serializer: Serializer, steps: List[Step], items: bool, camelized: bool
+) -> Callable[..., Representation]:
+    polymorphic = not items and isinstance(serializer, PolymorphicSerializer)
+    key = (
+        type(serializer),
+        items,
+        polymorphic,
+        camelized,
+        tuple(
+            (field_name, kind, attr, type(field))
+            for field_name, kind, attr, field in steps
+        ),
+    )
+    factory = _factories.get(key)
+    if factory is None:
+        name = f"compile_{type(serializer).__name__}"
+        source = _generate_source(name, steps, polymorphic, camelized)
+        namespace = {}
+        code = compile(source, f"<compiled {type(serializer).__qualname__}>", "exec")
+        exec(code, namespace)
+        factory = _factories[key] = namespace[name]
+    return factory
+
+
+def compile_representation(
+    serializer: Serializer, items: bool = False, camelized: bool = False
+) -> Representation:
+    """
+    Return the compiled representation of the serializer, bound to its fields.
+
+    :param items: read the values from a dict (the value of a gegevensgroep) instead
+      of the attributes of an instance
+    :param camelized: return a :class:`openzaak.utils.camel_case.CamelizedDict`
+    """
+    steps = _get_steps(serializer, items)
+    factory = _get_factory(serializer, steps, items, camelized)
+
+    arguments = [
+        CamelizedDict if camelized else dict,
+        camelize,
+        SkipField,
+        PKOnlyObject,
+        None,
+    ]
+    if not items and isinstance(serializer, PolymorphicSerializer):
+        arguments[4] = serializer.discriminator.to_representation
+    for _field_name, kind, _attr, field in steps:
+        if kind == _GEGEVENSGROEP:
+            arguments += [
+                field.get_attribute,
+                compile_representation(field, items=True, camelized=camelized),
+            ]
+        else:
+            arguments += [field.get_attribute, field.to_representation]
+    return factory(*arguments)
+
+
+@lru_cache(maxsize=None)
+def _is_compilable(cls: Type[Serializer]) -> bool:
+    """
+    Check that no class between the mixin and DRF changes the representation.
+    """
+    mro = cls.__mro__
+    for klass in mro[mro.index(CompiledRepresentationMixin) + 1 :]:
+        if "to_representation" not in vars(klass) or klass is PolymorphicSerializer:
+            continue
+        return klass is Serializer
+    return False
+
+
+class CompiledRepresentationMixin:
+    """
+    Opt-in compiled representation of the serializer.
+
+    The compiled representation is used when the serializer context contains a
+    truthy :data:`COMPILED_REPRESENTATION`, which is set by
+    :class:`openzaak.utils.mixins.CompiledRepresentationViewSetMixin` for the list
+    endpoints. The keys of the representation are camelized, so it must only be
+    used for the representations that are rendered as-is.
+    """
+
+    def to_representation(self, instance):
+        if not self.context.get(COMPILED_REPRESENTATION) or not _is_compilable(
+            type(self)
+        ):
+            return super().to_representation(instance)
+
+        # ⚡️ bound once per serializer instance, the child of a list serializer is
+        # shared by all the rows of the page
+        represent = self.__dict__.get("_compiled_representation")
+        if represent is None:
+            represent = self._compiled_representation = compile_representation(
+                self, camelized=can_precamelize()
+            )
+        return represent(instance)
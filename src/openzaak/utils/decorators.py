@@ -1,6 +1,9 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
+import logging
+import time
 from functools import wraps
+from typing import Optional
 
 from django.core.cache import caches
 from django.utils.translation import gettext_lazy as _
@@ -9,33 +12,117 @@ from drc_cmis.webservice.utils import NoURLMappingException, URLTooLongException
 
 from openzaak.utils.exceptions import CMISAdapterException
 
+logger = logging.getLogger(__name__)
+
+
+# how long a single caller may take to (re)calculate a value before others take over
+LOCK_TIMEOUT = 60
+# how long concurrent callers wait for a missing value calculated by another caller
+WAIT_TIMEOUT = 10
+WAIT_INTERVAL = 0.1
+
+
+def _wait_for(_cache, key: str):
+    deadline = time.monotonic() + WAIT_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(WAIT_INTERVAL)
+        entry = _cache.get(key)
+        if entry is not None:
+            return entry[0]
+    return None
+
+
+def cache(
+    key: str,
+    alias: str = "default",
+    stale_timeout: Optional[int] = None,
+    store=None,
+    **set_options,
+):
+    """
+    Cache the result of the decorated function under ``key``.
+
+    With a ``stale_timeout``, a result is kept for that many seconds after its
+    ``timeout``. A stale result is returned while a single caller recalculates it,
+    and concurrent callers of a missing result wait for one caller to calculate it.
+
+    A ``store`` (with ``load(key)`` and ``save(key, value)`` methods) persists the
+    last calculated result, which is returned if the function fails without a cached
+    result to fall back on.
+    """
 
-def cache(key: str, alias: str = "default", **set_options):
     def decorator(func: callable):
         @wraps(func)
         def wrapped(*args, **kwargs):
             _cache = caches[alias]
-            result = _cache.get(key)
-            if result is not None:
+            if stale_timeout is None:
+                result = _cache.get(key)
+                if result is not None:
+                    return result
+
+                result = func(*args, **kwargs)
+                _cache.set(key, result, **set_options)
                 return result
 
-            result = func(*args, **kwargs)
-            _cache.set(key, result, **set_options)
-            return result
+            # the entries are stored under a versioned key, the results used to be
+            # stored as-is under ``key``
+            entry_key = f"{key}:v2"
+            lock_key = f"{key}:lock"
+            entry = _cache.get(entry_key)
+            if entry is not None:
+                result, refresh_at = entry
+                fresh = time.time() < refresh_at
+                # ⚡️ only one caller recalculates a stale result, the others keep
+                # using it in the meantime
+                if fresh or not _cache.add(lock_key, True, timeout=LOCK_TIMEOUT):
+                    return result
+            else:
+                result = None
+                if not _cache.add(lock_key, True, timeout=LOCK_TIMEOUT):
+                    result = _wait_for(_cache, entry_key)
+                    if result is not None:
+                        return result
+
+            try:
+                new_result = func(*args, **kwargs)
+            except Exception:
+                if result is None and store is not None:
+                    result = store.load(key)
+                if result is None:
+                    raise
+                # the lock is kept until it expires, which limits the retries
+                logger.warning(
+                    "Could not refresh the cached value of '%s', using the last known "
+                    "value",
+                    key,
+                    exc_info=True,
+                )
+                return result
+
+            timeout = set_options.get("timeout", _cache.default_timeout)
+            _cache.set(
+                entry_key,
+                (new_result, time.time() + timeout),
+                timeout=timeout + stale_timeout,
+            )
+            _cache.delete(lock_key)
+            if store is not None:
+                store.save(key, new_result)
+            return new_result
 
         return wrapped
 
     return decorator
 
 
-def cache_uuid(key, timeout):
+def cache_uuid(key, timeout, **cache_options):
     def decorator(func: callable):
         @wraps(func)
         def wrapped(*args, **kwargs):
             # use first argument of function to extract uuid
             uuid = args[0].split("/")[-1]
             key_uuid = f"{key}-{uuid}"
-            cached_func = cache(key_uuid, timeout=timeout)(func)
+            cached_func = cache(key_uuid, timeout=timeout, **cache_options)(func)
             result = cached_func(*args, **kwargs)
             return result
 
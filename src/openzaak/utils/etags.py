@@ -0,0 +1,99 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+"""
+Deferred ETag calculation.
+
+By default, every change schedules the ETag recalculation of the changed object and
+of all the objects depending on it after the commit, each of which serializes the
+complete resource. With ``ETAG_DEFERRED`` enabled, a change only clears the stored
+ETag values of the affected objects. A missing value is calculated on the next
+request for the resource, or by the background sweeper.
+"""
+from typing import List, Optional
+
+from django.apps import apps
+from django.conf import settings
+from django.db import models, transaction
+from django.urls import get_resolver
+
+from vng_api_common.caching.etags import EtagUpdate, calculate_etag
+from vng_api_common.caching.registry import MODEL_SERIALIZERS
+from vng_api_common.caching.signals import is_etag_model
+
+_mark_affected = EtagUpdate.mark_affected
+
+
+def etags_deferred() -> bool:
+    return settings.ETAG_DEFERRED
+
+
+def mark_affected(cls, obj: models.Model, using: Optional[str] = None) -> None:
+    """
+    Clear the stored ETag value of ``obj`` instead of scheduling its recalculation.
+
+    Replaces :meth:`vng_api_common.caching.etags.EtagUpdate.mark_affected`.
+    """
+    # objects without a database record (CMIS) store their ETag value elsewhere
+    if not etags_deferred() or obj.pk is None:
+        return _mark_affected(obj, using=using)
+
+    if getattr(obj, "_updating_etag", False):
+        return
+
+    # ⚡️ a single UPDATE instead of serializing the complete resource. The value is
+    # cleared even if it is already empty, so the row is locked until the change is
+    # committed and a concurrent calculation can't store a value of the old state
+    type(obj)._default_manager.using(using).filter(pk=obj.pk).update(_etag="")
+    obj._etag = ""
+
+
+def get_etag_models() -> List[type]:
+    # the serializers of the resources are registered when the viewsets are loaded
+    get_resolver().url_patterns
+    return [
+        model
+        for model in apps.get_models()
+        if is_etag_model(model) and model in MODEL_SERIALIZERS
+    ]
+
+
+def calculate_etags(model_label: str, pks: List[int]) -> int:
+    """
+    Calculate and store the ETag values of the objects with the ``pks``.
+
+    The objects are locked while their values are calculated, objects that are
+    being changed are skipped - their values are cleared again by the change. A
+    value is only stored if the stored value didn't change since it was read.
+
+    :return: the number of stored ETag values
+    """
+    model = apps.get_model(model_label)
+    manager = model._default_manager
+    stored = 0
+    with transaction.atomic():
+        objs = list(manager.select_for_update(skip_locked=True).filter(pk__in=pks))
+        for obj in objs:
+            # ⚡️ an UPDATE of a single column, without signals
+            stored += manager.filter(pk=obj.pk, _etag=obj._etag).update(
+                _etag=calculate_etag(obj)
+            )
+    return stored
+
+
+def refresh_stale_etags(batch_size: Optional[int] = None) -> int:
+    """
+    Calculate a batch of missing ETag values of every resource type.
+
+    :return: the number of calculated ETag values
+    """
+    batch_size = batch_size or settings.ETAG_SWEEP_BATCH_SIZE
+    refreshed = 0
+    for model in get_etag_models():
+        pks = list(
+            model._default_manager.filter(_etag="")
+            .order_by()
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        if pks:
+            refreshed += calculate_etags(model._meta.label, pks)
+    return refreshed
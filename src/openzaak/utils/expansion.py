@@ -8,7 +8,6 @@ from django.utils.module_loading import import_string
 
 from django_loose_fk.loaders import FetchError
 from django_loose_fk.virtual_models import ProxyMixin
-from djangorestframework_camel_case.render import CamelCaseJSONRenderer
 from rest_framework.serializers import BaseSerializer, Field, Serializer
 from rest_framework_inclusions.core import InclusionLoader
 from rest_framework_inclusions.renderer import (
@@ -17,6 +16,8 @@ from rest_framework_inclusions.renderer import (
     should_skip_inclusions,
 )
 
+from openzaak.utils.camel_case import CamelizedDict, camelize
+from openzaak.utils.renderers import CamelCaseJSONRenderer
 from openzaak.utils.serializer_fields import FKOrServiceUrlField
 
 logger = logging.getLogger(__name__)
@@ -324,6 +325,14 @@ class ExpandJSONRenderer(InclusionJSONRenderer, CamelCaseJSONRenderer):
 
     loader_class = ExpandLoader
 
+    @staticmethod
+    def _get_expansion(record: dict, inclusions: dict) -> dict:
+        expansion = inclusions[record["url"]]
+        # the pre-camelized records are not camelized again by the renderer
+        if isinstance(record, CamelizedDict):
+            return camelize(expansion)
+        return expansion
+
     def _render_inclusions(self, data, renderer_context):
         renderer_context = renderer_context or {}
         response = renderer_context.get("response")
@@ -370,11 +379,13 @@ class ExpandJSONRenderer(InclusionJSONRenderer, CamelCaseJSONRenderer):
         if isinstance(serializer_data, list):
             for record in serializer_data:
                 if record["url"] in inclusions:
-                    record[EXPAND_KEY] = inclusions[record["url"]]
+                    record[EXPAND_KEY] = self._get_expansion(record, inclusions)
 
         if isinstance(serializer_data, dict):
             if inclusions.get(serializer_data["url"]):
-                serializer_data[EXPAND_KEY] = inclusions[serializer_data["url"]]
+                serializer_data[EXPAND_KEY] = self._get_expansion(
+                    serializer_data, inclusions
+                )
 
         return render_data
 
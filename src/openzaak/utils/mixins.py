@@ -1,6 +1,8 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
 from django.conf import settings
+from django.core.paginator import Page, Paginator
+from django.utils.functional import cached_property
 
 from dictdiffer import diff
 from drc_cmis import client_builder
@@ -8,8 +10,10 @@ from drc_cmis.connections import use_cmis_connection_pool
 from vng_api_common.audittrails.models import AuditTrail
 from vng_api_common.models import APIMixin as _APIMixin
 
+from openzaak.audit.compact import load_changes
 from openzaak.utils.decorators import convert_cmis_adapter_exceptions
 
+from .compiled import COMPILED_REPRESENTATION
 from .exceptions import CMISNotSupportedException
 from .expansion import ExpandJSONRenderer
 
@@ -25,20 +29,46 @@ def format_dict_diff(changes):
     return res
 
 
+class AuditTrailEntry:
+    """
+    Audit trail record with its changes, which are only calculated when used.
+    """
+
+    def __init__(self, audit: AuditTrail):
+        self.audit = audit
+
+    @cached_property
+    def changes(self) -> list:
+        compact_diff = getattr(self.audit, "compact_diff", None)
+        if compact_diff is not None and not compact_diff.is_snapshot:
+            return format_dict_diff(load_changes(compact_diff.changes))
+
+        oud = self.audit.oud or {}
+        nieuw = self.audit.nieuw or {}
+        return format_dict_diff(list(diff(oud, nieuw)))
+
+
 class AuditTrailMixin:
+    audittrail_page_size = 25
+
+    def get_audittrail_queryset(self):
+        # ⚡️ exact match on an indexed key instead of a substring match on the URL
+        return (
+            AuditTrail.objects.filter(main_object_key__hoofd_object_uuid=self.uuid)
+            .select_related("compact_diff")
+            .order_by("-aanmaakdatum")
+        )
+
+    def get_audittrail_page(self, number=1) -> Page:
+        paginator = Paginator(self.get_audittrail_queryset(), self.audittrail_page_size)
+        page = paginator.get_page(number)
+        page.object_list = [AuditTrailEntry(audit) for audit in page.object_list]
+        return page
+
     @property
     def audittrail(self):
-        qs = AuditTrail.objects.filter(
-            hoofd_object__contains=self.get_absolute_api_url(version=1)
-        ).order_by("-aanmaakdatum")
-        res = []
-        for audit in qs:
-            oud = audit.oud or {}
-            nieuw = audit.nieuw or {}
-
-            changes = format_dict_diff(list(diff(oud, nieuw)))
-            res.append((audit, changes))
-        return res
+        for audit in self.get_audittrail_queryset().iterator():
+            yield audit, AuditTrailEntry(audit).changes
 
 
 class CMISClientMixin:
@@ -89,6 +119,24 @@ class APIMixin(_APIMixin):
         return super().get_absolute_api_url(request=request, **kwargs)
 
 
+class CompiledRepresentationViewSetMixin:
+    """
+    Use the compiled representation of the serializer for the list endpoints.
+
+    See :class:`openzaak.utils.compiled.CompiledRepresentationMixin`.
+    """
+
+    compiled_representation_actions = ("list", "_zoek")
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        action = getattr(self, "action", None)
+        context[COMPILED_REPRESENTATION] = (
+            action in self.compiled_representation_actions
+        )
+        return context
+
+
 class ExpandMixin:
     renderer_classes = (ExpandJSONRenderer,)
     expand_param = "expand"
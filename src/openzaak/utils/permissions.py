@@ -16,6 +16,8 @@ from django.utils.translation import gettext_lazy as _
 
 from rest_framework import exceptions, permissions
 from rest_framework.exceptions import PermissionDenied
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
 from rest_framework.request import Request
 from rest_framework.serializers import ValidationError, as_serializer_error
 from vng_api_common.permissions import bypass_permissions, get_required_scopes
@@ -25,6 +27,28 @@ from openzaak.utils.decorators import convert_cmis_adapter_exceptions
 
 logger = logging.getLogger(__name__)
 
+RESOLVED_OBJECTS_CACHE_ATTR = "_resolved_objects_cache"
+
+
+def cache_resolved_object(request: Request, url: str, obj) -> None:
+    """
+    Remember the object that ``url`` resolves to for the duration of the request.
+
+    The cache lives on the request, so it's discarded together with it. Serializer
+    fields resolving the same URL can pick up the instance instead of querying the
+    database again.
+    """
+    cache = getattr(request, RESOLVED_OBJECTS_CACHE_ATTR, None)
+    if cache is None:
+        cache = {}
+        setattr(request, RESOLVED_OBJECTS_CACHE_ATTR, cache)
+    cache[url] = obj
+
+
+def get_cached_resolved_object(request: Request, url: str):
+    cache = getattr(request, RESOLVED_OBJECTS_CACHE_ATTR, None) or {}
+    return cache.get(url)
+
 
 class AuthRequired(permissions.BasePermission):
     """
@@ -44,10 +68,32 @@ class AuthRequired(permissions.BasePermission):
         return {field: data.get(field) for field in self.permission_fields}
 
     def format_data(self, obj, request) -> dict:
+        """
+        Serialize only the fields of the main object needed for the permission check.
+
+        Running the complete serializer is wasteful - it resolves all the (nested)
+        relations of the main object while we only need the ``permission_fields``.
+        """
         main_resource = self.get_main_resource()
         serializer_class = main_resource.serializer_class
         serializer = serializer_class(obj, context={"request": request})
-        return serializer.data
+        fields = serializer.fields
+
+        data = {}
+        for name in self.permission_fields:
+            field = fields[name]
+            try:
+                attribute = field.get_attribute(obj)
+            except SkipField:
+                continue
+            # mirror `Serializer.to_representation` for empty relations
+            check_for_none = (
+                attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+            )
+            data[name] = (
+                None if check_for_none is None else field.to_representation(attribute)
+            )
+        return data
 
     def get_main_resource(self):
         if not self.main_resource:
@@ -155,6 +201,7 @@ class AuthRequired(permissions.BasePermission):
                     )
                     raise ValidationError(err_dict)
 
+                cache_resolved_object(request, main_object_url, main_object)
                 main_object_data = self.format_data(main_object, request)
                 fields = self.get_fields(main_object_data)
 
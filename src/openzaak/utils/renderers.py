@@ -1,8 +1,94 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2021 Dimpact
-from djangorestframework_camel_case.render import CamelCaseJSONRenderer
+import math
+import re
+
+from djangorestframework_camel_case.settings import api_settings
+from rest_framework import renderers
 from vng_api_common.views import ERROR_CONTENT_TYPE
 
+from .camel_case import camelize
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# the floats orjson formats differently than the stdlib (``1e-05`` or ``1e+16``),
+# which can also match a string value, in which case the stdlib is used as well
+_ORJSON_FLOAT_RE = re.compile(rb"\de[-+]?\d|0\.0000\d")
+
+
+def _has_non_finite_float(data) -> bool:
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(_has_non_finite_float(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(_has_non_finite_float(value) for value in data)
+    return False
+
+
+class JSONRenderer(renderers.JSONRenderer):
+    """
+    Encode the data with ``orjson`` if it's installed, with the same output as the
+    stdlib :mod:`json` module.
+
+    The data that ``orjson`` can't encode identically falls back to the stdlib:
+    indented or non-compact output, values ``orjson`` doesn't support (non-string
+    keys, big integers...), floats in scientific notation and NaN or infinity. Dates and times are
+    encoded by the encoder of DRF.
+    """
+
+    def _can_use_orjson(self, accepted_media_type, renderer_context) -> bool:
+        return (
+            orjson is not None
+            and self.compact
+            and not self.ensure_ascii
+            and self.strict
+            and self.get_indent(accepted_media_type, renderer_context or {}) is None
+        )
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None or not self._can_use_orjson(
+            accepted_media_type, renderer_context
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        except TypeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # ``orjson`` encodes NaN and infinity as null, which the stdlib refuses to
+        # encode in strict mode
+        if _ORJSON_FLOAT_RE.search(ret) or (
+            b"null" in ret and _has_non_finite_float(data)
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # same as DRF, these characters are valid JSON but not valid JavaScript
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
+
+
+class CamelCaseJSONRenderer(JSONRenderer):
+    """
+    Replacement of :class:`djangorestframework_camel_case.render.CamelCaseJSONRenderer`
+    which doesn't camelize the pre-camelized representations again.
+    """
+
+    json_underscoreize = api_settings.JSON_UNDERSCOREIZE
+
+    def render(self, data, *args, **kwargs):
+        return super().render(
+            camelize(data, **self.json_underscoreize), *args, **kwargs
+        )
+
 
 class ProblemJSONRenderer(CamelCaseJSONRenderer):
     media_type = ERROR_CONTENT_TYPE
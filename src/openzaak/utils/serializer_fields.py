@@ -7,6 +7,8 @@ from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 from vng_api_common.validators import URLValidator
 
+from openzaak.utils.permissions import get_cached_resolved_object
+
 
 class LengthValidationMixin:
     default_error_messages = {
@@ -45,6 +47,30 @@ class LengthValidationMixin:
         return value
 
 
+class MainObjectCacheMixin:
+    """
+    Re-use the main object resolved by the permission checks.
+
+    On create of nested resources, :class:`openzaak.utils.permissions.AuthRequired`
+    already looked up the main object (e.g. the zaak of a status) - there's no need to
+    fetch the same object again during validation.
+    """
+
+    def to_internal_value(self, data):
+        request = self.context.get("request")
+        if request is not None and isinstance(data, str):
+            cached = get_cached_resolved_object(request, data)
+            if cached is not None and isinstance(cached, self.get_queryset().model):
+                return cached
+        return super().to_internal_value(data)
+
+
+class MainObjectHyperlinkedRelatedField(
+    MainObjectCacheMixin, serializers.HyperlinkedRelatedField
+):
+    pass
+
+
 class LengthHyperlinkedRelatedField(
     LengthValidationMixin, serializers.HyperlinkedRelatedField
 ):
@@ -64,6 +90,13 @@ class FKOrServiceUrlValidator(FKOrURLValidator):
         if serializer_field.context.get(context_key) is not None:
             return
 
+        # ⚡️ objects that were already resolved (or loaded in bulk) earlier in the
+        # same request don't need to be looked up again
+        cached_instance = self.get_cached_instance(url, serializer_field)
+        if cached_instance is not None:
+            serializer_field.context[context_key] = cached_instance
+            return
+
         try:
             super().__call__(url, serializer_field)
         except ValueError as exc:
@@ -79,6 +112,20 @@ class FKOrServiceUrlValidator(FKOrURLValidator):
         resolved_instance = resolver.resolve(host, url)
         serializer_field.context[context_key] = resolved_instance
 
+    @staticmethod
+    def get_cached_instance(url: str, serializer_field):
+        request = serializer_field.context.get("request")
+        if request is None:
+            return None
+
+        cached_instance = get_cached_resolved_object(request, url)
+        if cached_instance is None:
+            return None
+
+        model, field = serializer_field._get_model_and_field()
+        related_model = model._meta.get_field(field.fk_field).related_model
+        return cached_instance if isinstance(cached_instance, related_model) else None
+
     @staticmethod
     def get_context_cache_key(field):
         field_names = [field.field_name]
@@ -111,3 +158,18 @@ class FKOrServiceUrlField(FKOrURLField):
         source = source.split("__")[0]
         model_field = model_class._meta.get_field(source)
         return model_class, model_field
+
+    def run_validation(self, *args, **kwargs):
+        url = super(FKOrURLField, self).run_validation(*args, **kwargs)
+
+        if url in [None, ""]:
+            # see rest_framework.fields.Field.validate_empty_values
+            return None
+
+        cached_instance = FKOrServiceUrlValidator.get_cached_instance(url, self)
+        if cached_instance is not None:
+            return cached_instance
+
+        host = self.context["request"].get_host()
+        resolver = self.context["resolver"]
+        return resolver.resolve(host, url)
@@ -0,0 +1,19 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+import logging
+
+from openzaak import celery_app
+
+from .etags import etags_deferred, refresh_stale_etags
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task()
+def refresh_etags():
+    if not etags_deferred():
+        return
+
+    refreshed = refresh_stale_etags()
+    if refreshed:
+        logger.info("Calculated %d missing ETag value(s)", refreshed)
@@ -0,0 +1,163 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+"""
+Fast URL building for the API resources.
+
+Reversing a URL walks the URL configuration, and the absolute URL is built from the
+request for every single object. Instead, the URL of a route is reversed once per
+process into a format string, keyed on the view name, the API version and the host,
+after which the URLs of the objects are rendered with plain string formatting.
+
+The host is taken from the request, so the host rewritten by
+:class:`openzaak.utils.middleware.OverrideHostMiddleware` is used. The URLs are
+identical to the URLs built by :func:`rest_framework.reverse.reverse`, so the URL
+mapping of the CMIS backend (``CMIS_URL_MAPPING_ENABLED``) applies as before.
+"""
+import re
+import uuid
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.http import HttpRequest
+from django.urls import (
+    NoReverseMatch,
+    get_script_prefix,
+    get_urlconf,
+    reverse as django_reverse,
+)
+
+from rest_framework.relations import HyperlinkedRelatedField
+from rest_framework.reverse import reverse
+from rest_framework.settings import api_settings
+from rest_framework.versioning import URLPathVersioning
+
+_PLACEHOLDER = "00000000-0000-0000-0000-0000000000{:02d}"
+
+_UUID_RE = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE
+)
+
+_get_url = HyperlinkedRelatedField.get_url
+
+
+@lru_cache(maxsize=1024)
+def get_url_template(
+    view_name: str,
+    kwarg_names: Tuple[str, ...],
+    version: Optional[str],
+    base_url: str,
+    script_prefix: str,
+    urlconf: str,
+) -> Optional[str]:
+    """
+    Return the format string of the URL of a route, with a replacement field for
+    every name in ``kwarg_names``.
+
+    The ``script_prefix`` and ``urlconf`` are only part of the cache key.
+
+    :return: ``None`` if the route can't be reversed with placeholders
+    """
+    placeholders = {
+        name: _PLACEHOLDER.format(index) for index, name in enumerate(kwarg_names)
+    }
+    kwargs = dict(placeholders)
+    if version is not None:
+        kwargs["version"] = version
+
+    try:
+        path = django_reverse(view_name, kwargs=kwargs, urlconf=urlconf)
+    except NoReverseMatch:
+        return None
+
+    template = f"{base_url}{path}".replace("{", "{{").replace("}", "}}")
+    for name, placeholder in placeholders.items():
+        if template.count(placeholder) != 1:
+            return None
+        template = template.replace(placeholder, f"{{{name}}}")
+    return template
+
+
+def _get_base_url(request: Optional[HttpRequest]) -> str:
+    if request is None:
+        return ""
+
+    base_url = getattr(request, "_url_builder_base_url", None)
+    if base_url is None:
+        base_url = request.build_absolute_uri("/")[:-1]
+        request._url_builder_base_url = base_url
+    return base_url
+
+
+def _is_uuid(value: Any) -> bool:
+    return isinstance(value, uuid.UUID) or (
+        isinstance(value, str) and _UUID_RE.fullmatch(value) is not None
+    )
+
+
+def build_url(
+    view_name: str, kwargs: Dict[str, Any], request: Optional[HttpRequest] = None
+) -> str:
+    """
+    Build the URL of a route, absolute if a ``request`` is given.
+
+    Drop-in replacement of :func:`rest_framework.reverse.reverse` for the routes of
+    the API resources, which are looked up by their ``uuid``. Other routes fall back
+    to :func:`rest_framework.reverse.reverse`.
+    """
+    values = dict(kwargs)
+    version = values.pop("version", None)
+
+    scheme = getattr(request, "versioning_scheme", None)
+    if scheme is not None:
+        if not isinstance(scheme, URLPathVersioning):
+            return reverse(view_name, kwargs=kwargs, request=request)
+        if request.version is not None:
+            version = request.version
+
+    if (
+        request is not None
+        and api_settings.URL_FORMAT_OVERRIDE
+        and api_settings.URL_FORMAT_OVERRIDE in request.GET
+    ) or not all(_is_uuid(value) for value in values.values()):
+        return reverse(view_name, kwargs=kwargs, request=request)
+
+    template = get_url_template(
+        view_name,
+        tuple(sorted(values)),
+        version,
+        _get_base_url(request),
+        get_script_prefix(),
+        get_urlconf() or settings.ROOT_URLCONF,
+    )
+    if template is None:
+        return reverse(view_name, kwargs=kwargs, request=request)
+    return template.format_map(values)
+
+
+def get_url(self, obj, view_name, request, format):
+    """
+    Build the URL of the related object.
+
+    Replaces :meth:`rest_framework.relations.HyperlinkedRelatedField.get_url`.
+    """
+    if format is not None:
+        return _get_url(self, obj, view_name, request, format)
+
+    # Unsaved objects will not yet have a valid URL.
+    if hasattr(obj, "pk") and obj.pk in (None, ""):
+        return None
+
+    lookup_value = getattr(obj, self.lookup_field)
+    return build_url(view_name, {self.lookup_url_kwarg: lookup_value}, request)
+
+
+def get_absolute_api_url(self, request=None, **kwargs) -> str:
+    """
+    Build the absolute URL of the object in the API.
+
+    Replaces :meth:`vng_api_common.models.APIMixin.get_absolute_api_url`.
+    """
+    reverse_kwargs = {"uuid": self.uuid}
+    reverse_kwargs.update(**kwargs)
+    return build_url(f"{self._meta.model_name}-detail", reverse_kwargs, request)
@@ -1,5 +1,7 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
+import uuid
+
 from django import http
 from django.apps import apps
 from django.template import TemplateDoesNotExist, loader
@@ -14,6 +16,8 @@ from vng_api_common.audittrails.viewsets import AuditTrailViewSet as _AuditTrail
 from vng_api_common.views import ViewConfigView as _ViewConfigView, _test_sites_config
 from zds_client import ClientError
 
+from openzaak.audit.compact import reconstruct
+
 
 @requires_csrf_token
 def server_error(request, template_name=ERROR_500_TEMPLATE_NAME):
@@ -113,3 +117,31 @@ class AuditTrailViewSet(_AuditTrailViewSet):
         return super(viewsets.GenericViewSet, self).initialize_request(
             request, *args, **kwargs
         )
+
+    @property
+    def parent_lookup_kwargs(self):
+        # ⚡️ exact match on the indexed main object key instead of a substring
+        # match on the main object URL. The index lookup doesn't depend on the size
+        # of the table, so there is no need to search the recent entries first
+        return {self.main_resource_lookup_field: "main_object_key__hoofd_object_uuid"}
+
+    def get_queryset(self):
+        if not self.kwargs:  # this happens during schema generation
+            return self.queryset.all()
+
+        identifier = self.kwargs.get(self.main_resource_lookup_field)
+        try:
+            uuid.UUID(str(identifier))
+        except ValueError:
+            raise http.Http404
+
+        qs = super(_AuditTrailViewSet, self).get_queryset()
+        if not qs.exists():
+            raise http.Http404
+        return qs.select_related("compact_diff")
+
+    def get_serializer(self, *args, **kwargs):
+        if args:
+            instances = args[0] if kwargs.get("many") else [args[0]]
+            reconstruct(instances)
+        return super().get_serializer(*args, **kwargs)